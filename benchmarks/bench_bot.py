@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Load test: many users sending the same bot command at once.
+
+Synthetic Updates are fed into the bot's own Application
+(``bot.build_application``) whose Bot API calls go to a local fake, and
+/status checks a local synthetic board. For every command the harness
+reports:
+    latency     update queued -> first reply / handler finished / last reply
+                (p50/p95/p99; the last reply of a test run is its report)
+    queue       updates waiting in the update queue and handlers in flight
+    loop lag    how late a 10 ms ticker wakes up while the handlers run
+    handler     time inside the handler (bot_command_seconds)
+
+Usage:
+    python benchmarks/bench_bot.py [--users 50] [--latency 0.02]
+                                   [--commands help status "search python" test_jobboard:5]
+
+A ``:N`` suffix overrides --users for one command.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from telegram import Update  # noqa: E402
+from telegram.ext import TypeHandler  # noqa: E402
+
+import bot  # noqa: E402
+from jobboard_server import SyntheticJobBoard  # noqa: E402
+from run import RESULTS_DIR, git_commit  # noqa: E402
+from tests.fake_bot_api import FakeBotAPI  # noqa: E402
+from utils.metrics import METRICS, percentile  # noqa: E402
+
+DEFAULT_COMMANDS = ["help", "status", "search python", "stats", "test_jobboard:5"]
+TICK = 0.01
+
+
+class RecordingBotAPI(FakeBotAPI):
+    """Fake Bot API that timestamps every message sent to a chat."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.replies = defaultdict(list)
+
+    def handle(self, method: str, params: dict):
+        if method == "sendMessage":
+            self.replies[str(params.get("chat_id"))].append(time.perf_counter())
+        return super().handle(method, params)
+
+
+class Tracker:
+    """Start/finish times of updates, recorded by handlers around the commands."""
+
+    def __init__(self):
+        self.started = {}
+        self.finished = {}
+
+    async def on_start(self, update: Update, context):
+        self.started[update.update_id] = time.perf_counter()
+
+    async def on_finish(self, update: Update, context):
+        self.finished[update.update_id] = time.perf_counter()
+
+
+def update_payload(update_id: int, chat_id: int, text: str) -> dict:
+    """Update JSON as Telegram sends it for a command message."""
+    command = text.split()[0]
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": {"id": chat_id, "is_bot": False, "first_name": "Load"},
+            "text": text,
+            "entities": [{"type": "bot_command", "offset": 0, "length": len(command)}],
+        },
+    }
+
+
+def make_update(application, update_id: int, chat_id: int, text: str) -> Update:
+    return Update.de_json(update_payload(update_id, chat_id, text), application.bot)
+
+
+def summary(values) -> dict:
+    if not values:
+        return {}
+    return {
+        "p50": round(percentile(values, 50), 4),
+        "p95": round(percentile(values, 95), 4),
+        "p99": round(percentile(values, 99), 4),
+        "max": round(max(values), 4),
+    }
+
+
+async def run_command(application, api, tracker, text, users, base_id, timeout):
+    """All users send one command at once; wait until every handler is done."""
+    tracker.started.clear()
+    tracker.finished.clear()
+    api.replies.clear()
+    METRICS.snapshot()
+    queue = application.update_queue
+    lags, depths, in_flight = [], [], []
+    done = asyncio.Event()
+
+    async def sample():
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lags.append(time.perf_counter() - start - TICK)
+            depths.append(queue.qsize())
+            in_flight.append(len(tracker.started) - len(tracker.finished))
+
+    sampler = asyncio.create_task(sample())
+    queued = {}
+    for i in range(users):
+        update_id = base_id + i
+        update = make_update(application, update_id, update_id, f"/{text}")
+        queued[update_id] = time.perf_counter()
+        await queue.put(update)
+
+    deadline = time.perf_counter() + timeout
+    while len(tracker.finished) < users and time.perf_counter() < deadline:
+        await asyncio.sleep(TICK)
+    # Queued test runs report later, from the run queue
+    await asyncio.wait_for(
+        application.bot_data["test_runs"].join(),
+        max(deadline - time.perf_counter(), TICK),
+    )
+    elapsed = time.perf_counter() - min(queued.values())
+    done.set()
+    await sampler
+
+    first_reply = [
+        api.replies[str(i)][0] - queued[i] for i in queued if api.replies.get(str(i))
+    ]
+    last_reply = [
+        api.replies[str(i)][-1] - queued[i] for i in queued if api.replies.get(str(i))
+    ]
+    finished = [tracker.finished[i] - queued[i] for i in tracker.finished]
+    command = text.split()[0]
+    handler = METRICS.snapshot()["histograms"].get(
+        f'bot_command_seconds{{command="{command}"}}', {}
+    )
+    return {
+        "command": text,
+        "users": users,
+        "completed": len(tracker.finished),
+        "seconds": round(elapsed, 3),
+        "first_reply": summary(first_reply),
+        "finished": summary(finished),
+        "last_reply": summary(last_reply),
+        "queue_depth_max": max(depths, default=0),
+        "in_flight_max": max(in_flight, default=0),
+        "loop_lag": summary(lags),
+        "handler": {k: handler[k] for k in ("p50", "p95", "max") if k in handler},
+    }
+
+
+def print_result(result: dict):
+    def ms(stats, key):
+        return f"{stats[key] * 1000:>8.0f}" if key in stats else f"{'—':>8}"
+
+    first, last, lag = result["first_reply"], result["last_reply"], result["loop_lag"]
+    print(
+        f"  /{result['command']:<18} {result['completed']:>3}/{result['users']:<3} "
+        f"reply p50/p95 {ms(first, 'p50')}{ms(first, 'p95')} ms  "
+        f"last p95 {ms(last, 'p95')} ms  "
+        f"queue {result['queue_depth_max']:>3}  in-flight {result['in_flight_max']:>3}  "
+        f"lag p95/max {ms(lag, 'p95')}{ms(lag, 'max')} ms"
+    )
+
+
+async def load_test(args, api) -> list:
+    application = bot.build_application("123456:LOADTEST", api.url)
+    tracker = Tracker()
+    # Group -1 runs before the command handlers (group 0), group 1 after them
+    application.add_handler(TypeHandler(Update, tracker.on_start), group=-1)
+    application.add_handler(TypeHandler(Update, tracker.on_finish), group=1)
+
+    results = []
+    async with application:
+        await application.start()
+        for n, spec in enumerate(args.commands):
+            text, _, users = spec.rpartition(":")
+            if not users.isdigit():
+                text, users = spec, args.users
+            result = await run_command(
+                application,
+                api,
+                tracker,
+                text,
+                int(users),
+                base_id=(n + 1) * 100_000,
+                timeout=args.timeout,
+            )
+            print_result(result)
+            results.append(result)
+        await application.stop()
+        await bot.close_background(application)
+    return results
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--commands", nargs="+", default=DEFAULT_COMMANDS)
+    arg_parser.add_argument("--users", type=int, default=50)
+    arg_parser.add_argument(
+        "--latency", type=float, default=0.02, help="fake Bot API latency, s"
+    )
+    arg_parser.add_argument("--timeout", type=float, default=300)
+    args = arg_parser.parse_args()
+
+    board = SyntheticJobBoard().start()
+    api = RecordingBotAPI(latency=args.latency).start()
+    # /status checks the local board instead of the real sites
+    bot.JOBSITE_URL = bot.INTERNET_URL = board.url(10)
+    print(
+        f"🔥 Load test: {args.users} users per command, {args.latency * 1000:.0f} ms API"
+    )
+    try:
+        results = asyncio.run(load_test(args, api))
+    finally:
+        board.stop()
+        api.stop()
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    commit = git_commit()
+    path = RESULTS_DIR / f"bot_{datetime.now():%Y%m%d_%H%M%S}_{commit}.json"
+    path.write_text(
+        json.dumps(
+            {
+                "commit": commit,
+                "time": datetime.now().isoformat(timespec="seconds"),
+                "args": vars(args),
+                "results": results,
+            },
+            ensure_ascii=False,
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    print(f"\n💾 Saved: {path.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark: matching new jobs to subscribers.
+
+Compares the inverted index against checking every subscription for every
+job on synthetic data (10k subscriptions x 1k jobs by default).
+
+Usage:
+    python benchmarks/bench_subscriptions.py [--subscribers N] [--jobs N]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.job import Job  # noqa: E402
+from utils.subscriptions import (  # noqa: E402
+    Subscription,
+    SubscriptionIndex,
+    job_terms,
+)
+
+KEYWORDS = [
+    "python", "django", "fastapi", "qa", "automation", "frontend", "react",
+    "golang", "java", "kotlin", "data", "ml", "devops", "kubernetes", "senior",
+    "junior", "lead", "backend", "android", "ios", "analyst", "sql", "rust",
+]  # fmt: skip
+TAGS = [
+    "Python", "Go", "Java", "JavaScript", "TypeScript", "SQL", "Docker",
+    "Kubernetes", "Playwright", "PyTest", "React", "Vue", "Kotlin", "Swift",
+]  # fmt: skip
+COMPANIES = [
+    "Яндекс", "Ozon", "VK", "Avito", "Сбер", "Тинькофф", "Kaspersky",
+    "JetBrains", "Wildberries", "МТС", "Lamoda", "HeadHunter",
+]  # fmt: skip
+LOCATIONS = [
+    "Москва", "Санкт-Петербург", "Казань", "Новосибирск", "Удалённо",
+    "Екатеринбург", "Нижний Новгород",
+]  # fmt: skip
+
+
+def make_subscription(rng: random.Random, chat_id: int) -> Subscription:
+    facets = {}
+    if rng.random() < 0.7:
+        facets["keywords"] = rng.sample(KEYWORDS, rng.randint(1, 3))
+    if rng.random() < 0.5:
+        facets["tags"] = rng.sample(TAGS, rng.randint(1, 2))
+    if rng.random() < 0.2:
+        facets["companies"] = rng.sample(COMPANIES, 1)
+    if rng.random() < 0.4:
+        facets["locations"] = rng.sample(LOCATIONS, rng.randint(1, 2))
+    return Subscription(chat_id=str(chat_id), **facets)
+
+
+def make_job(rng: random.Random, i: int) -> Job:
+    words = rng.sample(KEYWORDS, 4)
+    return Job(
+        id=f"job-{i}",
+        title=" ".join(words[:2]).title() + " Engineer",
+        company=rng.choice(COMPANIES),
+        tags=tuple(rng.sample(TAGS, 3)),
+        description="We are looking for " + " ".join(words[2:]),
+        location=rng.choice(LOCATIONS),
+    )
+
+
+def naive_match(subscriptions, job) -> set:
+    terms = job_terms(job)
+    return {s.chat_id for s in subscriptions if s.matches(job, terms)}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--subscribers", type=int, default=10_000)
+    arg_parser.add_argument("--jobs", type=int, default=1_000)
+    arg_parser.add_argument("--seed", type=int, default=42)
+    args = arg_parser.parse_args()
+
+    rng = random.Random(args.seed)
+    subscriptions = [make_subscription(rng, i) for i in range(args.subscribers)]
+    jobs = [make_job(rng, i) for i in range(args.jobs)]
+
+    start = time.perf_counter()
+    index = SubscriptionIndex(subscriptions)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [index.match(job) for job in jobs]
+    indexed_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    naive = [naive_match(subscriptions, job) for job in jobs]
+    naive_time = time.perf_counter() - start
+
+    assert indexed == naive, "index and naive matching disagree"
+    deliveries = sum(len(chats) for chats in indexed)
+
+    print(f"📊 {args.subscribers} subscriptions × {args.jobs} jobs")
+    print(f"   deliveries:     {deliveries} ({deliveries / args.jobs:.0f} per job)")
+    print(f"   index build:    {build * 1000:.1f} ms")
+    print(f"   inverted index: {indexed_time * 1000:.1f} ms")
+    print(f"   naive loop:     {naive_time * 1000:.1f} ms")
+    print(f"   speedup:        {naive_time / indexed_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
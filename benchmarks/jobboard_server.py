@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Synthetic job board for offline benchmarks.
+
+Serves pages with any number of ``.job-card`` elements in the demo
+site's markup, so parse_jobs and the HTTP fast path run unchanged:
+
+    /?jobs=1000                      one page with 1000 cards
+    /?jobs=1000&per_page=50&page=2   paginated, with a rel=next link
+
+Usage:
+    python benchmarks/jobboard_server.py [--port 8000]
+"""
+
+import argparse
+import html
+import random
+import sys
+import threading
+from datetime import date, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_subscriptions import make_job  # noqa: E402
+
+# Abbreviated months as the demo site prints them ("9 февр. 2026 г.")
+RU_MONTHS = [
+    "янв.", "февр.", "мар.", "апр.", "мая", "июн.",
+    "июл.", "авг.", "сент.", "окт.", "нояб.", "дек.",
+]  # fmt: skip
+
+PAGE = """<!DOCTYPE html>
+<html lang="ru">
+<head>
+    <meta charset="UTF-8">
+    <title>JobBoard Demo</title>
+</head>
+<body>
+    <div id="jobs-container">
+{cards}
+    </div>
+{pagination}
+</body>
+</html>
+"""
+
+CARD = """        <div class="job-card" data-id="{id}">
+            <h4 class="job-title">{title}</h4>
+            <p class="job-company">{company}</p>
+            <p class="job-location">{location}</p>
+            <div class="job-tags">{tags}</div>
+            <p class="job-description">{description}</p>
+            <span class="job-date">📅 {posted}</span>
+        </div>"""
+
+
+def render_card(i: int, seed: int = 42) -> str:
+    """Markup of the i-th synthetic card (the same for the same seed)."""
+    rng = random.Random(seed * 1_000_003 + i)
+    job = make_job(rng, i)
+    posted = date(2026, 2, 9) - timedelta(days=i % 60)
+    return CARD.format(
+        id=html.escape(job.id),
+        title=html.escape(job.title),
+        company=html.escape(job.company),
+        location=html.escape(job.location),
+        tags="".join(f"<span>{html.escape(tag)}</span>" for tag in job.tags),
+        description=html.escape(job.description),
+        posted=f"{posted.day} {RU_MONTHS[posted.month - 1]} {posted.year} г.",
+    )
+
+
+@lru_cache(maxsize=32)
+def render_page(jobs: int, per_page: int = 0, page: int = 1, seed: int = 42) -> bytes:
+    """Page of cards, newest (lowest index) first."""
+    per_page = per_page or jobs
+    start = (page - 1) * per_page
+    end = min(start + per_page, jobs)
+    cards = "\n".join(render_card(i, seed) for i in range(start, end))
+    pagination = ""
+    if end < jobs:
+        query = urlencode(
+            {"jobs": jobs, "per_page": per_page, "page": page + 1, "seed": seed}
+        )
+        pagination = f'    <a rel="next" href="?{query}">Далее</a>'
+    return PAGE.format(cards=cards, pagination=pagination).encode("utf-8")
+
+
+class SyntheticJobBoard:
+    """Local HTTP server with generated job board pages."""
+
+    def __init__(self, port: int = 0, seed: int = 42):
+        self.seed = seed
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def url(self, jobs: int, per_page: int = 0) -> str:
+        query = {"jobs": jobs, "seed": self.seed}
+        if per_page:
+            query["per_page"] = per_page
+        return f"http://127.0.0.1:{self._server.server_address[1]}/?{urlencode(query)}"
+
+    def start(self) -> "SyntheticJobBoard":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        board = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                params = parse_qs(urlparse(self.path).query)
+
+                def param(name, default):
+                    return int(params.get(name, [default])[0])
+
+                try:
+                    body = render_page(
+                        param("jobs", 100),
+                        param("per_page", 0),
+                        param("page", 1),
+                        param("seed", board.seed),
+                    )
+                except ValueError:
+                    self.send_error(400)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--port", type=int, default=8000)
+    arg_parser.add_argument("--seed", type=int, default=42)
+    args = arg_parser.parse_args()
+
+    board = SyntheticJobBoard(args.port, args.seed).start()
+    print(f"🌐 Serving {board.url(1000)}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        board.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Replay Telegram updates against the bot's webhook.
+
+POSTs updates (recorded ones from a JSON lines file, or synthetic
+commands) to the webhook with the secret token header, N at a time,
+and reports:
+    ack         POST sent -> webhook answered
+    reply       POST sent -> first message the bot sent to that chat
+    throughput  updates acknowledged per second
+
+By default the bot runs in this process in webhook mode
+(``bot.build_application`` + ``bot.webhook_settings``), and its Bot API
+calls go to a local fake, so nothing reaches Telegram. Every replayed
+update gets its own chat, so each reply can be matched to its update.
+``--url`` targets a bot started separately instead (acks only).
+
+Usage:
+    python benchmarks/replay_webhook.py [--updates updates.jsonl] [--users 200]
+                                        [--commands help stats] [--concurrency 32]
+    python benchmarks/replay_webhook.py --url http://127.0.0.1:8443/telegram --secret S
+
+Record real updates (while no webhook is set):
+    curl -s "https://api.telegram.org/bot$TOKEN/getUpdates" | jq -c '.result[]' > updates.jsonl
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import bot  # noqa: E402
+from bench_bot import RecordingBotAPI, summary, update_payload  # noqa: E402
+from run import RESULTS_DIR, git_commit  # noqa: E402
+
+SECRET_HEADER = "X-Telegram-Bot-Api-Secret-Token"
+# Chats of replayed updates, far from real ones
+CHAT_BASE = 9_000_000_000
+
+
+def load_updates(path: Path) -> list:
+    """Updates from a JSON lines file, one Update object per line."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def synthetic_updates(commands, users: int) -> list:
+    """One command per user, cycling through ``commands``."""
+    return [
+        update_payload(i + 1, i + 1, f"/{commands[i % len(commands)]}")
+        for i in range(users)
+    ]
+
+
+def own_chats(updates: list) -> list:
+    """Copies of the updates, each from a chat of its own."""
+    result = []
+    for i, update in enumerate(updates):
+        update = json.loads(json.dumps(update))
+        message = update.get("message")
+        if message:
+            message["chat"]["id"] = CHAT_BASE + i
+            if "from" in message:
+                message["from"]["id"] = CHAT_BASE + i
+        result.append(update)
+    return result
+
+
+async def replay(url: str, secret: str, updates: list, concurrency: int) -> dict:
+    """POST every update, ``concurrency`` at a time.
+
+    Returns:
+        {"sent": {update_id: time}, "acks": [(status, seconds)], "seconds": total}
+    """
+    sent, acks = {}, []
+    pending = iter(updates)
+    headers = {SECRET_HEADER: secret} if secret else {}
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+
+        async def sender():
+            for update in pending:
+                start = time.perf_counter()
+                sent[update["update_id"]] = start
+                try:
+                    response = await client.post(url, json=update, headers=headers)
+                    status = response.status_code
+                except httpx.HTTPError:
+                    status = 0
+                acks.append((status, time.perf_counter() - start))
+
+        start = time.perf_counter()
+        await asyncio.gather(*(sender() for _ in range(concurrency)))
+    return {"sent": sent, "acks": acks, "seconds": time.perf_counter() - start}
+
+
+def report(replayed: dict, replies: list = None) -> dict:
+    acks = replayed["acks"]
+    ok = [seconds for status, seconds in acks if status == 200]
+    result = {
+        "updates": len(acks),
+        "ok": len(ok),
+        "rejected": len(acks) - len(ok),
+        "seconds": round(replayed["seconds"], 3),
+        "per_second": round(len(ok) / replayed["seconds"], 1) if ok else 0,
+        "ack": summary(ok),
+    }
+    if replies is not None:
+        result["replied"] = len(replies)
+        result["reply"] = summary(replies)
+    return result
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def replay_local(updates: list, concurrency: int, timeout: float, api) -> dict:
+    """Replay against the bot started in webhook mode in this process."""
+    updates = own_chats(updates)
+    secret = "replay-secret"
+    port = free_port()
+    settings = {**bot.webhook_settings(), "port": port, "secret_token": secret}
+    url = f"http://127.0.0.1:{port}/{settings['url_path']}"
+
+    application = bot.build_application("123456:REPLAY", api.url)
+    async with application:
+        await application.start()
+        await application.updater.start_webhook(**settings)
+
+        # A POST without the secret must be refused
+        async with httpx.AsyncClient() as client:
+            forged = await client.post(url, json=updates[0])
+        replayed = await replay(url, secret, updates, concurrency)
+
+        commands = [
+            update
+            for update in updates
+            if update.get("message", {}).get("text", "").startswith("/")
+        ]
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline and any(
+            not api.replies.get(str(u["message"]["chat"]["id"])) for u in commands
+        ):
+            await asyncio.sleep(0.01)
+        await application.bot_data["test_runs"].join()
+
+        await application.updater.stop()
+        await application.stop()
+        await bot.close_background(application)
+
+    replies = [
+        api.replies[chat][0] - replayed["sent"][u["update_id"]]
+        for u in commands
+        for chat in [str(u["message"]["chat"]["id"])]
+        if api.replies.get(chat)
+    ]
+    result = report(replayed, replies)
+    result["forged_status"] = forged.status_code
+    return result
+
+
+def print_result(result: dict):
+    def ms(stats, key):
+        return f"{stats[key] * 1000:>8.1f}" if key in stats else f"{'—':>8}"
+
+    ack, reply = result["ack"], result.get("reply", {})
+    print(
+        f"  {result['ok']}/{result['updates']} accepted in {result['seconds']:.2f} s "
+        f"({result['per_second']:.0f}/s)\n"
+        f"  ack   p50/p95/p99 {ms(ack, 'p50')}{ms(ack, 'p95')}{ms(ack, 'p99')} ms"
+    )
+    if "reply" in result:
+        print(
+            f"  reply p50/p95/p99 {ms(reply, 'p50')}{ms(reply, 'p95')}"
+            f"{ms(reply, 'p99')} ms  ({result['replied']} replied)\n"
+            f"  without secret: HTTP {result['forged_status']}"
+        )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument("--updates", type=Path, help="JSON lines of updates")
+    arg_parser.add_argument("--commands", nargs="+", default=["help", "start", "stats"])
+    arg_parser.add_argument("--users", type=int, default=200)
+    arg_parser.add_argument("--concurrency", type=int, default=32)
+    arg_parser.add_argument("--url", help="webhook of a running bot")
+    arg_parser.add_argument("--secret", default="", help="its WEBHOOK_SECRET")
+    arg_parser.add_argument(
+        "--latency", type=float, default=0.02, help="fake Bot API latency, s"
+    )
+    arg_parser.add_argument("--timeout", type=float, default=120)
+    args = arg_parser.parse_args()
+
+    if args.updates:
+        updates = load_updates(args.updates)
+    else:
+        updates = synthetic_updates(args.commands, args.users)
+    print(
+        f"🔁 Replaying {len(updates)} updates, {args.concurrency} at a time "
+        f"({bot.BOT_CONCURRENCY} handled at once)"
+    )
+
+    if args.url:
+        result = report(
+            asyncio.run(replay(args.url, args.secret, updates, args.concurrency))
+        )
+    else:
+        api = RecordingBotAPI(latency=args.latency).start()
+        try:
+            result = asyncio.run(
+                replay_local(updates, args.concurrency, args.timeout, api)
+            )
+        finally:
+            api.stop()
+    print_result(result)
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    commit = git_commit()
+    path = RESULTS_DIR / f"webhook_{datetime.now():%Y%m%d_%H%M%S}_{commit}.json"
+    path.write_text(
+        json.dumps(
+            {
+                "commit": commit,
+                "time": datetime.now().isoformat(timespec="seconds"),
+                "args": {k: str(v) for k, v in vars(args).items()},
+                "bot_concurrency": bot.BOT_CONCURRENCY,
+                "result": result,
+            },
+            ensure_ascii=False,
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    print(f"\n💾 Saved: {path.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
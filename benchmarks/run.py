@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Offline benchmarks of the monitor pipeline.
+
+Runs parse_jobs (or the HTTP fast path) against the synthetic job board,
+cache load/save and the outbox send loop against the fake Bot API, and
+reports throughput, peak memory and per-phase timings. Results are saved
+to benchmarks/results/ so runs on different commits can be compared.
+
+Usage:
+    python benchmarks/run.py [--jobs 10 1000 100000] [--mode http|browser]
+                             [--messages 500] [--latency 0.02] [--flood-every 50]
+                             [--compare latest|PATH]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+import parser  # noqa: E402
+from jobboard_server import SyntheticJobBoard  # noqa: E402
+from tests.fake_bot_api import FakeBotAPI  # noqa: E402
+from utils.cache import open_cache  # noqa: E402
+from utils.delivery import TelegramSender  # noqa: E402
+from utils.metrics import METRICS  # noqa: E402
+from utils.outbox import deliver, open_outbox  # noqa: E402
+from utils.sources import Source  # noqa: E402
+
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+
+def max_rss_mb() -> float:
+    """Process memory high-water mark (ru_maxrss is in KiB on Linux)."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def measure(name: str, items: int, run, repeat: int) -> dict:
+    """Best of ``repeat`` timed runs plus one traced run for peak memory.
+
+    Args:
+        run: callable doing the work once, called with a fresh temp dir
+    """
+    best, phases = None, {}
+    for _ in range(repeat):
+        METRICS.snapshot()
+        with tempfile.TemporaryDirectory() as tmp:
+            start = time.perf_counter()
+            run(Path(tmp))
+            elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best, phases = elapsed, METRICS.snapshot()["histograms"]
+
+    tracemalloc.start()
+    with tempfile.TemporaryDirectory() as tmp:
+        run(Path(tmp))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    result = {
+        "name": name,
+        "items": items,
+        "seconds": round(best, 6),
+        "per_second": round(items / best, 1) if best else None,
+        "peak_mb": round(peak / 1024 / 1024, 2),
+        "max_rss_mb": round(max_rss_mb(), 1),
+        "phases": phases,
+    }
+    print(
+        f"  {name:<24} {items:>7} items  {best * 1000:>9.1f} ms  "
+        f"{result['per_second'] or 0:>10.0f}/s  peak {result['peak_mb']:>7.2f} MB"
+    )
+    return result
+
+
+def bench_parse(board: SyntheticJobBoard, jobs: int, mode: str, per_page: int):
+    source = Source(name="bench", url=board.url(jobs, per_page))
+    parser.FETCH_MODE = mode
+
+    # The HTTP fast path reads only the first page
+    expected = jobs if mode == "browser" or not per_page else min(per_page, jobs)
+
+    def run(_):
+        # parse_jobs prints every card; keep the output out of the timing
+        with contextlib.redirect_stdout(io.StringIO()):
+            found = parser.fetch_jobs(source)
+        assert found and len(found) == expected, len(found or [])
+
+    return run
+
+
+def bench_cache(backend: str, jobs: int):
+    keys = [f"bench:job-{i}" for i in range(jobs)]
+    found_at = datetime.now().isoformat()
+
+    def run(directory: Path):
+        with METRICS.phase("cache_load"):
+            cache = open_cache(backend, directory)
+        cache.add_many((key, found_at) for key in keys)
+        with METRICS.phase("cache_save"):
+            cache.commit()
+        cache.close()
+
+        with METRICS.phase("cache_load"):
+            cache = open_cache(backend, directory)
+        with METRICS.phase("cache_lookup"):
+            assert all(key in cache for key in keys)
+        cache.close()
+
+    return run
+
+
+def bench_send(api: FakeBotAPI, messages: int, concurrency: int, chats: int):
+    def run(directory: Path):
+        outbox = open_outbox(None, directory)
+        for i in range(messages):
+            outbox.enqueue(str(i % chats), f"💼 <b>Job {i}</b>", [f"bench:{i}"])
+        outbox.commit()
+        # Limits far above the fake API: measure the pipeline, not the bucket
+        sender = TelegramSender(
+            token="bench",
+            chat_id=None,
+            api_url=api.url,
+            rate=1e6,
+            chat_rate=1e6,
+            backoff=0.01,
+        )
+        # Each 429 logs a line to stderr
+        with METRICS.phase("send_loop"), contextlib.redirect_stderr(io.StringIO()):
+            sent, failed = deliver(outbox, sender, concurrency)
+        outbox.close()
+        assert (sent, failed) == (messages, 0), (sent, failed)
+
+    return run
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: list, baseline_path: Path):
+    """Print the time change of every benchmark present in both runs."""
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    before = {(r["name"], r["items"]): r for r in baseline["results"]}
+    print(f"\n📈 Compared with {baseline['commit']} ({baseline_path.name}):")
+    for result in results:
+        old = before.get((result["name"], result["items"]))
+        if not old or not old["seconds"]:
+            continue
+        change = (result["seconds"] - old["seconds"]) / old["seconds"] * 100
+        mark = "🔴" if change > 10 else "🟢" if change < -10 else "⚪"
+        print(
+            f"  {mark} {result['name']:<24} {result['items']:>7} items  "
+            f"{old['seconds'] * 1000:>9.1f} → {result['seconds'] * 1000:>9.1f} ms"
+            f"  ({change:+.1f}%)"
+        )
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    arg_parser.add_argument(
+        "--jobs", type=int, nargs="+", default=[10, 1_000, 10_000, 100_000]
+    )
+    arg_parser.add_argument("--mode", choices=["http", "browser"], default="http")
+    arg_parser.add_argument(
+        "--per-page", type=int, default=0, help="paginate the board (0 — one page)"
+    )
+    arg_parser.add_argument("--messages", type=int, default=500)
+    arg_parser.add_argument("--chats", type=int, default=50)
+    arg_parser.add_argument("--concurrency", type=int, default=8)
+    arg_parser.add_argument("--latency", type=float, default=0.02)
+    arg_parser.add_argument(
+        "--flood-every", type=int, default=50, help="answer every N-th send with 429"
+    )
+    arg_parser.add_argument("--retry-after", type=float, default=0.05)
+    arg_parser.add_argument("--repeat", type=int, default=3)
+    arg_parser.add_argument(
+        "--compare", help="results file to compare with, or 'latest'"
+    )
+    args = arg_parser.parse_args()
+
+    baseline = None
+    if args.compare == "latest":
+        saved = sorted(RESULTS_DIR.glob("*.json"))
+        baseline = saved[-1] if saved else None
+    elif args.compare:
+        baseline = Path(args.compare)
+
+    # Follow every page of a paginated board and never stop at known jobs
+    parser.MAX_PAGES = max(parser.MAX_PAGES, max(args.jobs) // (args.per_page or 1))
+    parser.STOP_AFTER_KNOWN = 0
+
+    board = SyntheticJobBoard().start()
+    api = FakeBotAPI(
+        latency=args.latency,
+        flood_every=args.flood_every,
+        retry_after=args.retry_after,
+    ).start()
+    results = []
+    try:
+        print(f"⏱ parse_jobs ({args.mode})")
+        for jobs in args.jobs:
+            run = bench_parse(board, jobs, args.mode, args.per_page)
+            results.append(measure(f"parse_{args.mode}", jobs, run, args.repeat))
+
+        print("⏱ cache load/save")
+        for backend in ("sqlite", "json"):
+            for jobs in args.jobs:
+                run = bench_cache(backend, jobs)
+                results.append(measure(f"cache_{backend}", jobs, run, args.repeat))
+
+        print(
+            f"⏱ send loop ({args.latency * 1000:.0f} ms latency, "
+            f"429 every {args.flood_every or '—'})"
+        )
+        run = bench_send(api, args.messages, args.concurrency, args.chats)
+        results.append(measure("send_loop", args.messages, run, args.repeat))
+    finally:
+        board.stop()
+        api.stop()
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    commit = git_commit()
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    path = RESULTS_DIR / f"{stamp}_{commit}.json"
+    path.write_text(
+        json.dumps(
+            {
+                "commit": commit,
+                "time": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "args": vars(args),
+                "results": results,
+            },
+            ensure_ascii=False,
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    print(f"\n💾 Saved: {path.relative_to(ROOT)}")
+    if baseline:
+        compare(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
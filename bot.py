@@ -4,13 +4,14 @@ JobPulse Telegram Bot — runs e2e tests and sends reports via Telegram.
 
 import os
 import sys
-import subprocess
+import html
 import time
-import requests
+import functools
 from pathlib import Path
 from datetime import datetime
 
 from telegram import Update
+from telegram.error import TelegramError
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -20,7 +21,23 @@ from telegram.ext import (
 )
 
 # Custom logger setup
+from utils.history import load_rollups, summarize
 from utils.logger import logger
+from utils.metrics import METRICS
+from utils.prober import SiteProber
+from utils.reporter import format_summary
+from utils.run_queue import (
+    ACTIVE,
+    CANCELLED,
+    FAILED,
+    HIT,
+    JOINED,
+    TIMEOUT,
+    RunQueue,
+    Suite,
+)
+from utils.search import JobSearchIndex
+from utils.subscriptions import SubscriptionStore, parse_rule
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -28,13 +45,59 @@ from dotenv import load_dotenv
 load_dotenv()
 
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
-if not TELEGRAM_BOT_TOKEN:
-    logger.error("❌ TELEGRAM_BOT_TOKEN not found in .env file!")
-    sys.exit(1)
+# Bot API server (a local fake in tests and load runs)
+TELEGRAM_API_URL = os.getenv("TELEGRAM_API_URL", "https://api.telegram.org")
+# "polling" or "webhook": Telegram POSTs updates to WEBHOOK_URL, which must
+# reach WEBHOOK_LISTEN:WEBHOOK_PORT/WEBHOOK_PATH (e.g. through a reverse
+# proxy); requests without the WEBHOOK_SECRET header get 403
+BOT_MODE = os.getenv("BOT_MODE", "polling")
+WEBHOOK_URL = os.getenv("WEBHOOK_URL", "")
+WEBHOOK_LISTEN = os.getenv("WEBHOOK_LISTEN", "127.0.0.1")
+WEBHOOK_PORT = int(os.getenv("WEBHOOK_PORT", "8443"))
+WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "telegram")
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET", "")
+# Updates handled at the same time
+BOT_CONCURRENCY = int(os.getenv("BOT_CONCURRENCY", "16"))
+# Every command arrives as a message; skip edits, callbacks, member updates...
+ALLOWED_UPDATES = [Update.MESSAGE]
 
 JOBSITE_URL = os.getenv(
     "JOBSITE_URL", "https://anastasiiaglushakova.github.io/jobboard-demo/"
 )
+INTERNET_URL = os.getenv("INTERNET_URL", "https://the-internet.herokuapp.com/")
+# Shared with parser.py, which sends new jobs to subscribed chats
+SUBSCRIPTIONS_FILE = Path(__file__).parent / "subscriptions.db"
+# Filled by parser.py with every job it has seen
+SEARCH_FILE = Path(__file__).parent / "jobs_search.db"
+SEARCH_LIMIT = 10
+# Rollups precomputed by parser.py from the job history
+HISTORY_DIR = Path(__file__).parent / "history"
+STATS_DEFAULT_DAYS = 7
+# Test runs requested via the bot: parallel pytest processes, seconds per run
+TEST_WORKERS = int(os.getenv("TEST_WORKERS", "2"))
+TEST_TIMEOUT = float(os.getenv("TEST_TIMEOUT_SEC", "60"))
+# Serve a finished run again for this long instead of re-running (0 — off)
+TEST_CACHE_TTL = float(os.getenv("TEST_CACHE_TTL_SEC", "60"))
+# Run suites in warm interpreters with a launched browser (0 — fresh pytest
+# process per run), each replaced after this many runs
+TEST_WARM_WORKERS = os.getenv("TEST_WARM_WORKERS", "1") == "1"
+TEST_WORKER_MAX_RUNS = int(os.getenv("TEST_WORKER_MAX_RUNS", "20"))
+# Seconds between edits of a run's progress message (Telegram rate-limits
+# edits, so keep this at 1 or more)
+TEST_PROGRESS_INTERVAL = float(os.getenv("TEST_PROGRESS_INTERVAL_SEC", "2"))
+SUITES = {
+    "jobboard": Suite("jobboard", "JobBoard Demo", "tests/test_jobboard.py"),
+    "internet": Suite(
+        "internet", "the-internet.herokuapp.com", "tests/test_internet_login.py"
+    ),
+}
+# /status answers from background probes: seconds between rounds, request
+# timeout, samples kept per site for p50/p95 and uptime
+STATUS_PROBE_INTERVAL = float(os.getenv("STATUS_PROBE_INTERVAL_SEC", "60"))
+STATUS_PROBE_TIMEOUT = float(os.getenv("STATUS_PROBE_TIMEOUT_SEC", "10"))
+STATUS_WINDOW = int(os.getenv("STATUS_WINDOW", "60"))
+# Serve command timings at http://127.0.0.1:<port>/metrics (0 — off)
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
 
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -46,7 +109,11 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         "<b>Быстрый доступ:</b>\n"
         "• /test_jobboard — тесты демо-сайта вакансий\n"
         "• /test_internet — тесты учебной площадки\n"
+        "• /queue — очередь тестовых прогонов\n"
         "• /status — проверить доступность сайтов\n"
+        "• /subscribe — подписаться на вакансии\n"
+        "• /search — поиск по вакансиям\n"
+        "• /stats — статистика вакансий\n"
         "• /help — подробная справка о проекте"
     )
     await update.message.reply_text(welcome_text, parse_mode="HTML")
@@ -78,7 +145,14 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         "<b>❓ Команды</b>\n"
         "• /test_jobboard — тесты демо-сайта вакансий\n"
         "• /test_internet — тесты учебной площадки\n"
+        "• /queue — очередь тестовых прогонов\n"
+        "• /cancel [номер] — отменить свой прогон\n"
         "• /status — проверить доступность сайтов\n"
+        "• /subscribe — подписаться на вакансии по фильтру\n"
+        "• /subscriptions — мои подписки\n"
+        "• /unsubscribe — удалить подписку\n"
+        "• /search — поиск по всем найденным вакансиям\n"
+        "• /stats [дней] — статистика: теги, компании, города, срок жизни\n"
         "• /start — краткое меню\n"
         "• /help — эта справка"
     )
@@ -86,107 +160,398 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
 
 async def status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Check status of demo sites."""
-    # Site URLs
-    sites = {
-        "JobBoard Demo": JOBSITE_URL,
-        "the-internet": "https://the-internet.herokuapp.com/",
-    }
-
-    status_text = "🔍 <b>Проверка статуса сайтов</b>\n\n"
-
-    for site_name, site_url in sites.items():
-        try:
-            response = requests.get(site_url, timeout=10)
-            if response.status_code == 200:
-                status_text += (
-                    f"✅ <b>{site_name}</b>\n"
-                    f"   URL: {site_url}\n"
-                    f"   Статус: {response.status_code}\n"
-                    f"   Время ответа: {response.elapsed.total_seconds():.2f} сек\n\n"
-                )
-            else:
-                status_text += (
-                    f"⚠️ <b>{site_name}</b>\n"
-                    f"   URL: {site_url}\n"
-                    f"   Статус: {response.status_code}\n\n"
-                )
-        except Exception as e:
+    """Status of demo sites from the background prober's latest samples."""
+    prober = context.application.bot_data["prober"]
+    # Waits only before the very first probe round
+    await prober.ready()
+
+    status_text = "🔍 <b>Статус сайтов</b>\n\n"
+    for site_name, site_url in prober.sites.items():
+        summary = prober.summary(site_name)
+        latest = summary["latest"]
+        if latest.ok:
+            status_text += (
+                f"✅ <b>{site_name}</b>\n"
+                f"   URL: {site_url}\n"
+                f"   Статус: {latest.status_code}\n"
+                f"   Время ответа: {latest.latency:.2f} сек\n"
+            )
+        elif latest.status_code:
+            status_text += (
+                f"⚠️ <b>{site_name}</b>\n"
+                f"   URL: {site_url}\n"
+                f"   Статус: {latest.status_code}\n"
+            )
+        else:
             status_text += (
                 f"❌ <b>{site_name}</b>\n"
                 f"   URL: {site_url}\n"
-                f"   Ошибка: {str(e)[:50]}\n\n"
+                f"   Ошибка: {html.escape(latest.error[:50])}\n"
             )
+        if summary["p50"] is not None:
+            status_text += (
+                f"   p50/p95: {summary['p50']:.2f} / {summary['p95']:.2f} сек\n"
+            )
+        status_text += (
+            f"   Доступность: {summary['uptime']:.0%} "
+            f"(проверок: {summary['samples']})\n"
+            f"   Проверено {latest.age:.0f} с назад\n\n"
+        )
 
     await update.message.reply_text(status_text, parse_mode="HTML")
 
 
-async def run_tests_and_get_report(test_file: str, site_name: str) -> str:
-    """Run tests and return report text."""
-    result = subprocess.run(
-        [
-            sys.executable,
-            "-m",
-            "pytest",
-            test_file,
-            "-v",
-            "--tb=short",
-            "-o",
-            "console_output_style=classic",
-        ],
-        cwd=Path(__file__).parent,
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-        timeout=60,
+def test_runs(context: ContextTypes.DEFAULT_TYPE) -> RunQueue:
+    return context.application.bot_data["test_runs"]
+
+
+def describe_run(run, position: int) -> str:
+    if position:
+        state = f"в очереди, позиция {position}"
+    else:
+        state = f"выполняется {run.elapsed:.0f} с"
+    if len(run.waiters) > 1:
+        state += f", ожидают чатов: {len(run.waiters)}"
+    return f"#{run.id} {run.suite.title} — {state}"
+
+
+def progress_messages(application: Application) -> dict:
+    """(run ID, chat ID) -> (ID, text) of the reply that shows run progress."""
+    return application.bot_data.setdefault("progress_messages", {})
+
+
+def describe_progress(run) -> str:
+    progress = run.progress
+    total = f"/{progress.total}" if progress.total else ""
+    text = (
+        f"⏳ Пройдено {progress.done}{total}: "
+        f"✅ {progress.passed} ❌ {progress.failed} ⏭ {progress.skipped}"
+    )
+    if progress.current:
+        text += f"\n▶️ {progress.current.rpartition('::')[2]}"
+    return text
+
+
+async def show_progress(application: Application, run) -> None:
+    """Edit the progress message in every chat waiting for a running run."""
+    messages = progress_messages(application)
+    progress = describe_progress(run)
+    for chat_id in list(run.waiters):
+        message = messages.get((run.id, chat_id))
+        if message is None:
+            continue
+        message_id, text = message
+        try:
+            await application.bot.edit_message_text(
+                f"{text}\n\n{progress}", chat_id, message_id
+            )
+        except TelegramError as e:
+            # E.g. the chat deleted the message or edits are rate-limited
+            logger.warning(f"⚠️ Progress of run #{run.id} not shown in {chat_id}: {e}")
+
+
+async def send_report(bot, chat_id, run, how: str = "") -> None:
+    """Send the report of a finished run to a chat waiting for it."""
+    if run.status == CANCELLED:
+        return
+    header = f"🧪 Запуск #{run.id}"
+    if run.status == TIMEOUT:
+        header += f" прерван по таймауту ({TEST_TIMEOUT:.0f} с)"
+    elif run.status == FAILED:
+        header += " не удалось запустить"
+    elif how == HIT:
+        header += f" · 💾 из кэша, результат {run.age:.0f} с назад"
+    else:
+        header += " · 🆕 свежий прогон (не из кэша)"
+    if run.status == FAILED:
+        report = run.output
+    elif run.result:
+        report = format_summary(run.result, run.suite.title)
+    else:
+        # pytest died or was killed before writing its report
+        tail = "\n".join(run.output.strip().splitlines()[-15:])
+        report = f"⚠️ Отчёт не создан (код выхода pytest: {run.exit_code})\n{tail}"
+    await bot.send_message(
+        chat_id,
+        f"{header}\n<pre>{html.escape(report)}</pre>",
+        parse_mode="HTML",
     )
 
-    # Read saved report
-    report_path = Path(__file__).parent / "test_report.txt"
-    if report_path.exists():
-        with open(report_path, "r", encoding="utf-8") as f:
-            report = f.read()
-        # Replace header with correct site name
-        report = report.replace("JobBoard Demo", site_name)
+
+async def finish_run(application: Application, chat_id, run) -> None:
+    """Stop showing the run's progress in the chat and send the report."""
+    progress_messages(application).pop((run.id, str(chat_id)), None)
+    await send_report(application.bot, chat_id, run)
+
+
+async def enqueue_suite(update: Update, context: ContextTypes.DEFAULT_TYPE, suite):
+    """Serve a test run from the cache, an identical run in flight, or a new one.
+
+    Only a new run is queued; the reply comes at once and the report
+    follows when the run ends.
+    """
+    runs = test_runs(context)
+    chat_id = update.effective_chat.id
+    run, how = runs.request(
+        chat_id,
+        suite,
+        on_finish=functools.partial(finish_run, context.application, chat_id),
+    )
+    METRICS.inc("test_run_requests_total", suite=suite.name, result=how)
+    if how == HIT:
+        logger.info(f"💾 Run #{run.id} ({suite.name}) served from cache to {chat_id}")
+        await send_report(context.bot, chat_id, run, how)
+        return
+
+    position = runs.position(run)
+    if position:
+        state = f"в очереди, позиция {position}"
     else:
-        # Generate simplified report
-        passed = result.stdout.count("PASSED")
-        failed = result.stdout.count("FAILED")
-        total = passed + failed
-
-        status_emoji = "✅" if failed == 0 else "❌"
-        report = (
-            f"{status_emoji} {site_name} — Тестовый отчёт\n"
-            f"{'─' * 45}\n"
-            f"Всего тестов:   {total}\n"
-            f"Успешно:       {passed} ✅\n"
-            f"Упало:         {failed} ❌\n"
-            f"{'─' * 45}\n"
+        state = "выполняется" if how == JOINED else "запускается"
+    if how == JOINED:
+        logger.info(f"🔗 Chat {chat_id} joined run #{run.id} ({suite.name})")
+        text = (
+            f"🔗 Тесты {suite.title} уже запущены: #{run.id} {state}.\n"
+            f"Вы получите отчёт этого прогона.\n"
+            f"/queue — очередь, /cancel {run.id} — отписаться"
+        )
+    else:
+        logger.info(f"🧪 Run #{run.id} ({suite.name}) queued by chat {chat_id}")
+        text = (
+            f"🚀 Тесты {suite.title}: запуск #{run.id} {state}.\n"
+            f"Отчёт придёт сюда по завершении (~10 секунд на прогон).\n"
+            f"/queue — очередь, /cancel {run.id} — отменить"
+        )
+    message = await update.message.reply_text(text)
+    if run.status in ACTIVE:
+        # Edited with live progress while the run goes
+        progress_messages(context.application)[(run.id, str(chat_id))] = (
+            message.message_id,
+            text,
         )
-
-    return report
 
 
 async def test_jobboard(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    await enqueue_suite(update, context, SUITES["jobboard"])
+
+
+async def test_internet(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    await enqueue_suite(update, context, SUITES["internet"])
+
+
+async def queue(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handler for /queue — test runs in progress and waiting."""
+    runs = test_runs(context)
+    active = runs.active()
+    if not active:
+        await update.message.reply_text("📭 Очередь тестов пуста.")
+        return
+    chat_id = str(update.effective_chat.id)
+    lines = [f"🧪 <b>Тестовые прогоны</b> (параллельно: {runs.workers})\n"]
+    for run in active:
+        mine = " 👤" if runs.waiting(run, chat_id) else ""
+        lines.append(html.escape(describe_run(run, runs.position(run))) + mine)
+    await update.message.reply_text("\n".join(lines), parse_mode="HTML")
+
+
+async def cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handler for /cancel <id> — cancel a queued or running test run."""
+    runs = test_runs(context)
+    chat_id = str(update.effective_chat.id)
+    if context.args:
+        if not context.args[0].lstrip("#").isdigit():
+            await update.message.reply_text("Использование: /cancel <номер запуска>")
+            return
+        run_id = int(context.args[0].lstrip("#"))
+    else:
+        # Latest active run of this chat
+        own = [run.id for run in runs.active() if runs.waiting(run, chat_id)]
+        if not own:
+            await update.message.reply_text("📭 У вас нет активных запусков.")
+            return
+        run_id = max(own)
+
+    run = runs.cancel(run_id, chat_id)
+    if run is None:
+        await update.message.reply_text(f"❌ Активный запуск #{run_id} не найден.")
+        return
+    # Left or stopped: either way no more progress in this chat (a run
+    # cancelled while queued never reaches finish_run)
+    progress_messages(context.application).pop((run.id, chat_id), None)
+    if run.status in ACTIVE:
+        # Other chats still wait for this run
+        logger.info(f"🔕 Chat {chat_id} left run #{run.id}")
+        await update.message.reply_text(
+            f"🔕 Вы отписались от запуска #{run.id} ({run.suite.title}); "
+            f"он продолжается для других чатов."
+        )
+        return
+    logger.info(f"🛑 Run #{run.id} cancelled by chat {chat_id}")
+    await update.message.reply_text(f"🛑 Запуск #{run.id} ({run.suite.title}) отменён.")
+
+
+async def subscribe(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handler for /subscribe — add a job filter for this chat."""
+    if not context.args:
+        await update.message.reply_text(
+            "🔔 <b>Подписка на вакансии</b>\n\n"
+            "Слова — ключевые слова в названии и описании, "
+            "<code>tag:</code>, <code>company:</code>, <code>location:</code> — "
+            "теги, компания и город. Несколько значений одного вида — "
+            "любое из них, разные виды — все сразу.\n\n"
+            "Пример:\n"
+            "<code>/subscribe python django tag:Python location:Москва</code>\n"
+            "<code>/subscribe all</code> — все вакансии",
+            parse_mode="HTML",
+        )
+        return
+
+    text = " ".join(context.args)
+    try:
+        rule = parse_rule(update.effective_chat.id, "" if text == "all" else text)
+    except ValueError as e:
+        await update.message.reply_text(f"❌ Не удалось разобрать фильтр: {e}")
+        return
+
+    store = SubscriptionStore(SUBSCRIPTIONS_FILE)
+    try:
+        subscription_id = store.add(rule)
+    finally:
+        store.close()
+    logger.info(f"🔔 Chat {rule.chat_id} subscribed: {rule.describe()}")
     await update.message.reply_text(
-        "🚀 Запускаю тесты для JobBoard Demo...\nОжидайте ~10 секунд..."
+        f"✅ Подписка #{subscription_id}: {html.escape(rule.describe())}",
+        parse_mode="HTML",
     )
-    report = await run_tests_and_get_report("tests/test_jobboard.py", "JobBoard Demo")
-    # Escape special characters for HTML
-    report = report.replace("<", "&lt;").replace(">", "&gt;")
-    await update.message.reply_text(f"<pre>{report}</pre>", parse_mode="HTML")
 
 
-async def test_internet(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+async def subscriptions(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handler for /subscriptions — list filters of this chat."""
+    store = SubscriptionStore(SUBSCRIPTIONS_FILE)
+    try:
+        rules = store.for_chat(update.effective_chat.id)
+    finally:
+        store.close()
+
+    if not rules:
+        await update.message.reply_text(
+            "📭 Подписок нет. Добавьте: /subscribe python tag:Python"
+        )
+        return
+    lines = [f"#{rule.id} — {html.escape(rule.describe())}" for rule in rules]
     await update.message.reply_text(
-        "🚀 Запускаю тесты для the-internet...\nОжидайте ~10 секунд..."
+        "🔔 <b>Ваши подписки</b>\n\n" + "\n".join(lines), parse_mode="HTML"
     )
-    report = await run_tests_and_get_report(
-        "tests/test_internet_login.py", "the-internet.herokuapp.com"
+
+
+async def unsubscribe(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handler for /unsubscribe <id> — remove a filter of this chat."""
+    if len(context.args) != 1 or not context.args[0].lstrip("#").isdigit():
+        await update.message.reply_text(
+            "ℹ️ Укажите номер подписки: /unsubscribe 3\nСписок — /subscriptions"
+        )
+        return
+
+    subscription_id = int(context.args[0].lstrip("#"))
+    store = SubscriptionStore(SUBSCRIPTIONS_FILE)
+    try:
+        removed = store.remove(update.effective_chat.id, subscription_id)
+    finally:
+        store.close()
+    if removed:
+        await update.message.reply_text(f"🗑 Подписка #{subscription_id} удалена")
+    else:
+        await update.message.reply_text(f"❌ Подписка #{subscription_id} не найдена")
+
+
+async def search(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handler for /search — full-text search over collected jobs."""
+    if not context.args:
+        await update.message.reply_text(
+            "🔎 <b>Поиск по вакансиям</b>\n\n"
+            "Слова ищутся по началу слова во всех полях. Фильтры: "
+            "<code>компания:</code>, <code>город:</code>, <code>тег:</code>, "
+            "<code>дней:</code>.\n\n"
+            "Пример:\n"
+            "<code>/search python город:Москва дней:7</code>",
+            parse_mode="HTML",
+        )
+        return
+    if not SEARCH_FILE.exists():
+        await update.message.reply_text(
+            "📭 Индекс вакансий пуст — парсер ещё не запускался."
+        )
+        return
+
+    text = " ".join(context.args)
+    index = JobSearchIndex(SEARCH_FILE)
+    try:
+        hits, total, elapsed = index.query(text, limit=SEARCH_LIMIT)
+    except ValueError as e:
+        await update.message.reply_text(f"❌ Неверный запрос: {e}")
+        return
+    finally:
+        index.close()
+    logger.info(f"🔎 /search {text!r}: {total} hits in {elapsed * 1000:.1f} ms")
+
+    if not hits:
+        await update.message.reply_text("🤷 Ничего не найдено.")
+        return
+    lines = [f"🔎 <b>Найдено: {total}</b> ({elapsed * 1000:.0f} мс)\n"]
+    for hit in hits:
+        posted = hit.posted.strftime("%d.%m.%Y") if hit.posted else "—"
+        lines.append(
+            f"💼 <b>{html.escape(hit.title)}</b> — {html.escape(hit.company)}\n"
+            f"📍 {html.escape(hit.location or '—')} · 📅 {posted}\n"
+            f"🛠 {html.escape(hit.tags or '—')}\n"
+        )
+    if total > len(hits):
+        lines.append(f"… и ещё {total - len(hits)}")
+    await update.message.reply_text("\n".join(lines), parse_mode="HTML")
+
+
+def _top(pairs) -> str:
+    return ", ".join(f"{html.escape(name)} ({n})" for name, n in pairs) or "—"
+
+
+async def stats(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handler for /stats — job statistics from precomputed rollups."""
+    days = STATS_DEFAULT_DAYS
+    if context.args:
+        if not context.args[0].isdigit() or int(context.args[0]) < 1:
+            await update.message.reply_text(
+                "❌ Укажите число дней, например: <code>/stats 30</code>",
+                parse_mode="HTML",
+            )
+            return
+        days = int(context.args[0])
+
+    rollups = load_rollups(HISTORY_DIR)
+    summary = summarize(rollups, days) if rollups else None
+    if not summary:
+        await update.message.reply_text(
+            "📭 История вакансий пуста — парсер ещё не запускался."
+        )
+        return
+
+    median = summary["median_listed_days"]
+    lines = [
+        f"📊 <b>Статистика за {summary['days']} дн.</b> "
+        f"(по {summary['day'].strftime('%d.%m.%Y')})\n",
+        f"💼 Активных вакансий: <b>{summary['active']}</b>",
+        f"🆕 Новых: {summary['new']} · 🗑 Снято: {summary['removed']}",
+        f"⏳ Медианный срок жизни: {f'{median:g} дн.' if median else '—'}\n",
+        f"🛠 Теги: {_top(summary['tags'])}",
+        f"🏢 Компании: {_top(summary['companies'])}",
+        f"📍 Города: {_top(summary['locations'])}\n",
+        "<b>По дням</b> (активных / новых):",
+    ]
+    # Last two weeks at most, to stay within one message
+    lines.extend(
+        f"{day.strftime('%d.%m')}: {active} / {new}"
+        for day, active, new in summary["trend"][-14:]
     )
-    # Escape special characters for HTML
-    report = report.replace("<", "&lt;").replace(">", "&gt;")
-    await update.message.reply_text(f"<pre>{report}</pre>", parse_mode="HTML")
+    await update.message.reply_text("\n".join(lines), parse_mode="HTML")
 
 
 async def unknown(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -196,24 +561,123 @@ async def unknown(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     )
 
 
-def main() -> None:
-    """Start the bot."""
-    # Create application
-    application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+def instrumented(command: str, handler):
+    """Time a command handler and count the ones that raise."""
+
+    @functools.wraps(handler)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        try:
+            with METRICS.timer("bot_command_seconds", command=command):
+                await handler(update, context)
+        except Exception:
+            METRICS.inc("bot_command_errors_total", command=command)
+            raise
 
-    # Register handlers
-    application.add_handler(CommandHandler("start", start))
-    application.add_handler(CommandHandler("help", help_command))
-    application.add_handler(CommandHandler("status", status))
-    application.add_handler(CommandHandler("test_jobboard", test_jobboard))
-    application.add_handler(CommandHandler("test_internet", test_internet))
+    return wrapper
+
+
+async def start_background(application: Application) -> None:
+    """Start probing sites and warming test workers as soon as the bot is up."""
+    application.bot_data["prober"].start()
+    application.bot_data["test_runs"].start()
+
+
+async def close_background(application: Application) -> None:
+    """Kill test runs in progress and stop probing when the bot shuts down."""
+    await application.bot_data["test_runs"].close()
+    await application.bot_data["prober"].close()
+
+
+def build_application(token: str, api_url: str = TELEGRAM_API_URL) -> Application:
+    """Application with every command handler registered."""
+    application = (
+        Application.builder()
+        .token(token)
+        .base_url(f"{api_url.rstrip('/')}/bot")
+        .concurrent_updates(BOT_CONCURRENCY)
+        .post_init(start_background)
+        .post_shutdown(close_background)
+        .build()
+    )
+
+    # Register handlers, each timed into bot_command_seconds{command=...}
+    commands = {
+        "start": start,
+        "help": help_command,
+        "status": status,
+        "test_jobboard": test_jobboard,
+        "test_internet": test_internet,
+        "queue": queue,
+        "cancel": cancel,
+        "subscribe": subscribe,
+        "subscriptions": subscriptions,
+        "unsubscribe": unsubscribe,
+        "search": search,
+        "stats": stats,
+    }
+    for command, handler in commands.items():
+        application.add_handler(CommandHandler(command, instrumented(command, handler)))
 
     # Unknown command handler
     application.add_handler(MessageHandler(filters.COMMAND, unknown))
 
+    application.bot_data["test_runs"] = RunQueue(
+        workers=TEST_WORKERS,
+        timeout=TEST_TIMEOUT,
+        cwd=Path(__file__).parent,
+        cache_ttl=TEST_CACHE_TTL,
+        warm=TEST_WARM_WORKERS,
+        max_runs=TEST_WORKER_MAX_RUNS,
+        on_progress=functools.partial(show_progress, application),
+        progress_interval=TEST_PROGRESS_INTERVAL,
+    )
+    application.bot_data["prober"] = SiteProber(
+        {"JobBoard Demo": JOBSITE_URL, "the-internet": INTERNET_URL},
+        interval=STATUS_PROBE_INTERVAL,
+        timeout=STATUS_PROBE_TIMEOUT,
+        window=STATUS_WINDOW,
+    )
+    return application
+
+
+def webhook_settings() -> dict:
+    """Arguments of Application.run_webhook / Updater.start_webhook."""
+    return {
+        "listen": WEBHOOK_LISTEN,
+        "port": WEBHOOK_PORT,
+        "url_path": WEBHOOK_PATH,
+        "secret_token": WEBHOOK_SECRET,
+        "webhook_url": WEBHOOK_URL or None,
+        "allowed_updates": ALLOWED_UPDATES,
+    }
+
+
+def main() -> None:
+    """Start the bot."""
+    if not TELEGRAM_BOT_TOKEN:
+        logger.error("❌ TELEGRAM_BOT_TOKEN not found in .env file!")
+        sys.exit(1)
+    if BOT_MODE not in ("polling", "webhook"):
+        logger.error(f"❌ Unknown BOT_MODE: {BOT_MODE} (polling or webhook)")
+        sys.exit(1)
+    if BOT_MODE == "webhook" and not (WEBHOOK_URL and WEBHOOK_SECRET):
+        logger.error("❌ Webhook mode needs WEBHOOK_URL and WEBHOOK_SECRET")
+        sys.exit(1)
+    application = build_application(TELEGRAM_BOT_TOKEN)
+
+    if METRICS_PORT:
+        METRICS.serve(METRICS_PORT)
+        logger.info(f"📈 Metrics: http://127.0.0.1:{METRICS_PORT}/metrics")
+
     # Start bot
-    logger.info("✅ JobPulse Bot started and awaiting commands...")
-    application.run_polling(allowed_updates=Update.ALL_TYPES)
+    logger.info(
+        f"✅ JobPulse Bot started ({BOT_MODE}, up to {BOT_CONCURRENCY} updates "
+        f"at once) and awaiting commands..."
+    )
+    if BOT_MODE == "webhook":
+        application.run_webhook(**webhook_settings())
+    else:
+        application.run_polling(allowed_updates=ALLOWED_UPDATES)
 
 
 if __name__ == "__main__":
@@ -6,7 +6,13 @@ import pytest
 from playwright.sync_api import sync_playwright, Browser, Page
 import os
 import shutil
+import threading
 import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from utils.pytest_worker import WARM_BROWSER
 
 
 @pytest.fixture(scope="session")
@@ -19,8 +25,15 @@ def browser_context_args():
 
 
 @pytest.fixture(scope="session")
-def browser(browser_context_args):
-    """Create browser instance."""
+def browser(browser_context_args, pytestconfig):
+    """Create browser instance (or reuse the one of a warm bot worker)."""
+    warm = pytestconfig.stash.get(WARM_BROWSER, None)
+    if isinstance(warm, Exception):
+        # The worker already runs Playwright; report why its launch failed
+        pytest.fail(f"Browser not launched: {warm}", pytrace=False)
+    if warm is not None:
+        yield warm
+        return
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True, args=["--no-sandbox"])
         yield browser
@@ -65,9 +78,39 @@ def telegram_bot_token():
     return os.getenv("TELEGRAM_BOT_TOKEN", "")
 
 
+@pytest.fixture(scope="session")
+def fixture_server():
+    """Local HTTP server serving tests/fixtures, yields base URL."""
+
+    class QuietHandler(SimpleHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    handler = partial(
+        QuietHandler, directory=str(Path(__file__).parent / "tests" / "fixtures")
+    )
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def fake_bot_api():
+    """Local fake Telegram Bot API server."""
+    from tests.fake_bot_api import FakeBotAPI
+
+    api = FakeBotAPI().start()
+    yield api
+    api.stop()
+
+
 # Import custom hooks for reporting
 from utils.conftest_hooks import (
     pytest_runtest_protocol,
     pytest_runtest_makereport,
+    pytest_sessionstart,
     pytest_sessionfinish,
 )
@@ -4,6 +4,8 @@ Page Object Model for JobBoard Demo site.
 
 from playwright.sync_api import Page
 
+from utils.job import parse_ru_date
+
 
 class JobBoardPage:
     """Page Object for JobBoard Demo."""
@@ -91,16 +93,7 @@ class JobBoardPage:
         self.page.wait_for_timeout(300)  # Wait for results to update
 
     def get_job_dates(self) -> list:
-        """Get list of job dates from results (as ISO strings)."""
-        job_cards = self.page.locator(".job-card")
-        count = job_cards.count()
-        dates = []
-
-        for i in range(count):
-            card = job_cards.nth(i)
-            date_str = card.locator(".job-date").inner_text()
-            # Parse date from format "📅 9 февр. 2026 г." (Russian format)
-            # Simple version — return as is
-            dates.append(date_str)
-
-        return dates
+        """Get list of job publication dates from results (date or None)."""
+        # Parse date from format "📅 9 февр. 2026 г." (Russian format)
+        date_strs = self.page.locator(".job-card .job-date").all_inner_texts()
+        return [parse_ru_date(date_str) for date_str in date_strs]
@@ -6,12 +6,44 @@ Runs on schedule, sends ONLY new job postings.
 
 import os
 import sys
-import json
+import time
+import asyncio
+import argparse
 from pathlib import Path
 from datetime import datetime
-import requests
 from playwright.sync_api import sync_playwright, TimeoutError as PWTimeoutError
 
+from utils.change_detection import (
+    CONTAINER_HTML_JS,
+    SourceStateStore,
+    is_dom_unchanged,
+)
+from utils.cache import open_cache
+from utils.crawler import Crawler, crawl_sources
+from utils.daemon import Daemon
+from utils.delivery import (
+    DigestEntry,
+    TelegramSender,
+    build_digests,
+    format_job,
+    group_key,
+)
+from utils.fingerprint import Deduplicator, open_fingerprint_index
+from utils.outbox import deliver, open_outbox
+from utils.pagination import (
+    KnownRun,
+    PartialListing,
+    iter_jobs,
+    known_checker,
+)
+from utils.search import JobSearchIndex
+from utils.history import HistoryStore
+from utils.http_source import fetch_jobs_http
+from utils.metrics import METRICS
+from utils.resource_policy import ResourcePolicy, wait_for_cards
+from utils.sources import Source, load_sources
+from utils.subscriptions import SubscriptionStore
+
 # === CONFIGURATION ===
 from dotenv import load_dotenv
 
@@ -20,33 +52,78 @@ load_dotenv()
 JOBSITE_URL = os.environ.get(
     "JOBSITE_URL", "https://anastasiiaglushakova.github.io/jobboard-demo/"
 )
-TELEGRAM_BOT_TOKEN = os.environ.get("TELEGRAM_BOT_TOKEN")
+# Optional JSON data file with the same jobs (used by the HTTP fast path)
+JOBSITE_DATA_URL = os.environ.get("JOBSITE_DATA_URL")
+# auto — try plain HTTP first, fall back to the browser; http / browser — force one
+FETCH_MODE = os.environ.get("JOBSITE_FETCH_MODE", "auto")
+# JSON list of sources; without it only JOBSITE_URL is monitored
+SOURCES_FILE = Path(
+    os.environ.get("JOBSITE_SOURCES", Path(__file__).parent / "sources.json")
+)
+# Pages to follow (pagination / infinite scroll) and how many already-sent
+# jobs in a row end the crawl of a newest-first listing (0 — never stop early)
+MAX_PAGES = int(os.environ.get("JOBSITE_MAX_PAGES", "10"))
+STOP_AFTER_KNOWN = int(os.environ.get("JOBSITE_STOP_AFTER_KNOWN", "5"))
+# Concurrency limits for multi-source runs
+MAX_CONTEXTS = int(os.environ.get("JOBSITE_MAX_CONTEXTS", "8"))
+PER_HOST_LIMIT = int(os.environ.get("JOBSITE_PER_HOST_LIMIT", "2"))
+# Receives every job; other chats subscribe with filters via the bot
 TELEGRAM_CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID")
-CACHE_FILE = Path(__file__).parent / "jobs_cache.json"
-
-
-def load_cache():
-    """Load cache of sent job postings."""
-    if CACHE_FILE.exists():
-        try:
-            with open(CACHE_FILE, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"⚠️ Cache read error: {e}", file=sys.stderr)
-            return {}
-    return {}
-
-
-def save_cache(cache):
-    """Save cache to disk."""
-    with open(CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(cache, f, ensure_ascii=False, indent=2)
+# Group digest messages by company, tag or source (empty — no grouping)
+DIGEST_GROUP_BY = os.environ.get("DIGEST_GROUP_BY", "")
+# Parallel sends and delivery attempts per queued message
+TELEGRAM_CONCURRENCY = int(os.environ.get("TELEGRAM_CONCURRENCY", "8"))
+OUTBOX_MAX_ATTEMPTS = int(os.environ.get("OUTBOX_MAX_ATTEMPTS", "5"))
+# Then retried after this many seconds, doubling with each failure up to a day
+OUTBOX_FAILED_BACKOFF = float(os.environ.get("OUTBOX_FAILED_BACKOFF_SEC", "3600"))
+CACHE_DIR = Path(__file__).parent
+# sqlite (jobs_cache.db, imports jobs_cache.json once) or json (jobs_cache.json)
+CACHE_BACKEND = os.environ.get("JOBS_CACHE_BACKEND", "sqlite")
+# Optional eviction: drop entries older than N days / keep at most N newest
+CACHE_TTL_DAYS = float(os.environ.get("JOBS_CACHE_TTL_DAYS", "0"))
+CACHE_MAX_SIZE = int(os.environ.get("JOBS_CACHE_MAX_SIZE", "0"))
+STATE_FILE = Path(__file__).parent / "sources_state.json"
+SUBSCRIPTIONS_FILE = Path(__file__).parent / "subscriptions.db"
+# Full-text index of every scraped job, queried by the bot's /search
+SEARCH_FILE = Path(__file__).parent / "jobs_search.db"
+# Columnar history of every sighting plus rollups for the bot's /stats
+HISTORY_DIR = Path(__file__).parent / "history"
+# Phase timings and counters of every run: Prometheus textfile and JSON lines
+# (empty — off); METRICS_PORT also serves /metrics while the daemon runs
+METRICS_TEXTFILE = os.environ.get(
+    "METRICS_TEXTFILE", str(Path(__file__).parent / "metrics" / "jobpulse.prom")
+)
+METRICS_JSONL = os.environ.get(
+    "METRICS_JSONL", str(Path(__file__).parent / "metrics" / "runs.jsonl")
+)
+METRICS_PORT = int(os.environ.get("METRICS_PORT", "0"))
+# Reposts: jobs whose fingerprints differ by at most N of 64 bits
+DEDUP_MAX_DISTANCE = int(os.environ.get("DEDUP_MAX_DISTANCE", "3"))
+# suppress — do not send reposts; group — send them marked as reposts
+DEDUP_MODE = os.environ.get("DEDUP_MODE", "suppress")
+# Daemon mode: seconds between checks, random +/- jitter, browser recycling
+DAEMON_INTERVAL = float(os.environ.get("DAEMON_INTERVAL_SEC", "300"))
+DAEMON_JITTER = float(os.environ.get("DAEMON_JITTER_SEC", "30"))
+DAEMON_RECYCLE_RUNS = int(os.environ.get("DAEMON_RECYCLE_RUNS", "50"))
+DAEMON_RECYCLE_RSS_MB = float(os.environ.get("DAEMON_RECYCLE_RSS_MB", "1024"))
+
+
+def default_source() -> Source:
+    """Single source built from JOBSITE_URL / JOBSITE_DATA_URL.
+
+    Uses the default namespace, so cache keys stay plain job IDs.
+    """
+    return Source(name="JobBoard Demo", url=JOBSITE_URL, data_url=JOBSITE_DATA_URL)
 
 
-def parse_jobs():
+def parse_jobs(source: Source = None, state: dict = None, cache=None):
     """
-    Parse job postings from demo site.
-    Exact selectors for the site:
+    Parse job postings from demo site, following pagination.
+    Returns None if the card container is unchanged since the last run
+    (state holds the validators of the source and is updated in place).
+    Pages are extracted lazily: once STOP_AFTER_KNOWN jobs in a row are
+    already in the cache, the pages after the current one are not loaded.
+    Default selectors for the site:
     - .job-card — job card
     - .job-title — title (h4)
     - .job-company — company
@@ -55,140 +132,379 @@ def parse_jobs():
     - .job-location — location
     - .job-date — publication date
     """
+    source = source or default_source()
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
+        with METRICS.phase("browser_launch"):
+            browser = p.chromium.launch(headless=True)
+            page = browser.new_page()
+
+        # Block images/fonts/styles/analytics before navigation
+        policy = ResourcePolicy.from_env()
+        policy.install(page)
 
-        print(f"🌐 Opening {JOBSITE_URL}...")
-        page.goto(JOBSITE_URL, wait_until="networkidle", timeout=30000)
+        print(f"🌐 Opening {source.url}...")
+        with METRICS.phase("goto", source=source.name):
+            page.goto(source.url, wait_until="domcontentloaded", timeout=30000)
 
-        # Wait for job cards to appear
+        # Wait until job cards are rendered and stop changing
         print("⏳ Waiting for job postings to load...")
         try:
-            page.wait_for_selector(".job-card", timeout=15000)
+            with METRICS.phase("card_wait", source=source.name):
+                wait_for_cards(page, source.selectors["card"], timeout=15000)
         except PWTimeoutError:
             print("❌ Job postings did not load in time", file=sys.stderr)
             browser.close()
             return []
+        policy.mark_ready()
 
-        print("✅ Job postings loaded, extracting data...")
+        # Skip extraction if the rendered cards did not change
+        if state is not None:
+            container_html = page.evaluate(CONTAINER_HTML_JS, source.selectors)
+            if is_dom_unchanged(container_html, state):
+                print("⏭ Job postings unchanged since last run")
+                browser.close()
+                return None
 
-        # Extract all job cards
-        job_elements = page.query_selector_all(".job-card")
+        print("✅ Job postings loaded, extracting data...")
 
+        # Stream job cards page by page until the listing reaches known jobs
+        start = time.perf_counter()
         jobs = []
-        for el in job_elements:
-            try:
-                # Extract data using exact selectors
-                title_el = el.query_selector(".job-title")
-                company_el = el.query_selector(".job-company")
-                tags_el = el.query_selector(".job-tags")
-                desc_el = el.query_selector(".job-description")
-                location_el = el.query_selector(".job-location")
-                date_el = el.query_selector(".job-date")
-
-                title = title_el.text_content().strip() if title_el else "Untitled"
-                company = company_el.text_content().strip() if company_el else ""
-                tags = tags_el.text_content().strip() if tags_el else ""
-                description = desc_el.text_content().strip() if desc_el else ""
-                location = location_el.text_content().strip() if location_el else ""
-                posted = (
-                    date_el.text_content().replace("📅 ", "").strip() if date_el else ""
-                )
-
-                # Unique ID from data-id attribute
-                job_id = el.get_attribute("data-id") or title
-
-                jobs.append(
-                    {
-                        "id": job_id,
-                        "title": title,
-                        "company": company,
-                        "tags": tags,
-                        "description": description,
-                        "location": location,
-                        "posted": posted,
-                        "found_at": datetime.now().isoformat(),
-                    }
-                )
-                print(f"  📌 {title} ({company})")
-
-            except Exception as e:
-                print(f"  ⚠️ Error parsing job card: {e}", file=sys.stderr)
+        known = KnownRun(known_checker(source, cache), STOP_AFTER_KNOWN)
+        for job in iter_jobs(page, source.selectors, MAX_PAGES, run=known):
+            print(f"  📌 {job.title} ({job.company})")
+            jobs.append(job)
+        jobs = known.listing(jobs)
+        elapsed = time.perf_counter() - start
+        METRICS.observe(
+            "phase_seconds", elapsed, phase="extraction", source=source.name
+        )
 
         browser.close()
-        print(f"✅ Extracted {len(jobs)} job postings")
+        print(f"✅ Extracted {len(jobs)} job postings in {elapsed * 1000:.1f} ms")
+        print(f"🚦 Requests: {policy.summary()}")
         return jobs
 
 
-def send_telegram(text: str):
-    """Send message to Telegram via direct API."""
-    if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
-        print("❌ TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID not set", file=sys.stderr)
-        return False
+def fetch_jobs(source: Source = None, state: dict = None, cache=None):
+    """Get job postings, preferring the browserless HTTP path.
+
+    In "auto" mode the Playwright path is used only when the static page
+    (or JSON data file) yields no job cards. Returns None if the source is
+    unchanged since the last run.
+    """
+    source = source or default_source()
+    if FETCH_MODE != "browser":
+        url = source.data_url or source.url
+        print(f"⚡ Fetching {url} without browser...")
+        try:
+            with METRICS.phase("http_fetch", source=source.name):
+                jobs, elapsed = fetch_jobs_http(url, source.selectors, state=state)
+        except Exception as e:
+            print(f"⚠️ HTTP fetch error: {e}", file=sys.stderr)
+            jobs, elapsed = [], 0.0
+
+        if jobs is None:
+            print(f"⏭ Not modified ({elapsed * 1000:.1f} ms)")
+            return None
+        if jobs:
+            for job in jobs:
+                print(f"  📌 {job.title} ({job.company})")
+            print(f"✅ Extracted {len(jobs)} job postings in {elapsed * 1000:.1f} ms")
+            return jobs
+        if FETCH_MODE == "http":
+            return []
+        print("ℹ️ No job cards in static HTML, falling back to browser")
+
+    return parse_jobs(source, state, cache)
+
+
+def collect_jobs(sources, states: SourceStateStore, cache=None):
+    """Get job postings from all sources.
 
+    A single source goes through the sync path; several sources are crawled
+    concurrently with a shared async browser.
+
+    Returns:
+        Source name -> list of job dicts (None for unchanged sources)
+    """
+    if len(sources) == 1:
+        source = sources[0]
+        return {source.name: fetch_jobs(source, states.get(source.name), cache)}
+
+    print(f"🌐 Crawling {len(sources)} sources concurrently...")
+    return asyncio.run(
+        crawl_sources(
+            sources,
+            states=states,
+            max_contexts=MAX_CONTEXTS,
+            per_host=PER_HOST_LIMIT,
+            mode=FETCH_MODE,
+            cache=cache,
+            max_pages=MAX_PAGES,
+            stop_after_known=STOP_AFTER_KNOWN,
+        )
+    )
+
+
+def queue_new_jobs(cache, outbox, sources, jobs_by_source, subscribers) -> int:
+    """Diff jobs against the cache and enqueue digests for new ones.
+
+    Every new job goes to the chats whose subscriptions match it; each chat
+    gets its own digests. New jobs are marked as known together with their
+    outbox messages, so after commit they are never detected (and sent)
+    twice.
+
+    Returns:
+        Number of queued job postings
+    """
+    sources_by_name = {source.name: source for source in sources}
+    total = sum(len(jobs) for jobs in jobs_by_source.values())
+    if not total:
+        print("ℹ️ No job postings found")
+        return 0
+
+    # Filter only new jobs: not in cache and not a repost of a known job
+    new_jobs = []
+    with METRICS.phase("diff"):
+        index = open_fingerprint_index(cache, DEDUP_MAX_DISTANCE)
+        dedup = Deduplicator(cache, index)
+        for name, jobs in jobs_by_source.items():
+            source = sources_by_name[name]
+            for job in jobs:
+                status, key, match = dedup.classify(source.cache_key(job.id), job)
+                if status == "new" or (status == "duplicate" and DEDUP_MODE == "group"):
+                    new_jobs.append((source, key, job, match))
+                elif status == "duplicate":
+                    # Suppressed repost: remember it without sending
+                    cache.add(key, job.found_at.isoformat())
+    METRICS.inc("jobs_new_total", len(new_jobs))
+    print(f"🧬 Dedup: {dedup.stats.summary()}")
+    print(f"🆕 New job postings: {len(new_jobs)} out of {total}")
+
+    # Route new job postings to subscribed chats
+    entries_by_chat = {}
+    for source, key, job, match in new_jobs:
+        entry = DigestEntry(
+            text=format_job(
+                job, source.name if len(sources) > 1 else None, repost=bool(match)
+            ),
+            group=group_key(job, DIGEST_GROUP_BY, source.name),
+            payload=key,
+        )
+        for chat_id in subscribers.match(job):
+            entries_by_chat.setdefault(chat_id, []).append(entry)
+    if new_jobs:
+        print(f"📬 Recipients: {len(entries_by_chat)} chats")
+
+    # Pack each chat's job postings into digest messages
+    for chat_id, entries in entries_by_chat.items():
+        for digest in build_digests(entries):
+            outbox.enqueue(chat_id, digest.text, [e.payload for e in digest.entries])
+    cache.add_many((key, job.found_at.isoformat()) for _, key, job, _ in new_jobs)
+
+    evicted = cache.evict(ttl_days=CACHE_TTL_DAYS, max_size=CACHE_MAX_SIZE)
+    if evicted:
+        if hasattr(index, "prune"):
+            index.prune()
+        print(f"🧹 Evicted {evicted} old cache entries")
+    return len(new_jobs)
+
+
+def index_jobs(sources, jobs_by_source):
+    """Upsert every scraped job into the search index."""
+    sources_by_name = {source.name: source for source in sources}
+    search = JobSearchIndex(SEARCH_FILE)
     try:
-        resp = requests.post(
-            f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage",
-            json={
-                "chat_id": TELEGRAM_CHAT_ID,
-                "text": text,
-                "parse_mode": "HTML",
-                "disable_web_page_preview": False,
-            },
-            timeout=10,
+        search.add_many(
+            (sources_by_name[name].cache_key(job.id), name, job)
+            for name, jobs in jobs_by_source.items()
+            for job in jobs
         )
-        if resp.status_code != 200:
-            print(f"❌ Telegram API error: {resp.text}", file=sys.stderr)
-            return False
-        return True
-    except Exception as e:
-        print(f"❌ Send error: {e}", file=sys.stderr)
-        return False
+        search.commit()
+        print(f"🔎 Search index: {len(search)} job postings")
+    finally:
+        search.close()
+
+
+def record_history(sources, jobs_by_source, observed_at: datetime = None):
+    """Append this run's sightings to the history and refresh rollups.
+
+    Only a complete listing can show that a job was removed. Sources that
+    were unchanged, failed (no jobs) or stopped early at known jobs keep
+    their previous sightings.
+    """
+    sources_by_name = {source.name: source for source in sources}
+    history = HistoryStore(HISTORY_DIR)
+    added = 0
+    for name, jobs in jobs_by_source.items():
+        if not jobs or isinstance(jobs, PartialListing):
+            # The jobs not seen this time may well still be up
+            added += history.carry_over(name, observed_at)
+        if jobs:
+            source = sources_by_name[name]
+            added += history.append(
+                ((source.cache_key(job.id), name, job) for job in jobs), observed_at
+            )
+    history.commit()
+    history.refresh_rollups()
+    print(f"🗄 History: {added} new sightings, {len(history)} total")
+
+
+def process_jobs(sources, states: SourceStateStore, jobs_by_source, cache):
+    """Queue new jobs from a crawl, save validators and deliver the outbox.
+
+    Closes the cache when done.
+
+    Returns:
+        (sent, failed) message counts
+    """
+    record_history(sources, jobs_by_source)
+
+    # Unchanged sources skip diffing and the cache write
+    for name, jobs in jobs_by_source.items():
+        if jobs is None:
+            states.record_skip(name)
+        else:
+            METRICS.inc("jobs_found_total", len(jobs), source=name)
+    jobs_by_source = {
+        name: jobs for name, jobs in jobs_by_source.items() if jobs is not None
+    }
+
+    if jobs_by_source:
+        index_jobs(sources, jobs_by_source)
+
+    outbox = open_outbox(cache, CACHE_DIR, OUTBOX_MAX_ATTEMPTS, OUTBOX_FAILED_BACKOFF)
+    subscriptions = SubscriptionStore(SUBSCRIPTIONS_FILE)
+    subscribers = subscriptions.build_index(TELEGRAM_CHAT_ID)
+    subscriptions.close()
+
+    if not len(subscribers):
+        # Nothing can be delivered, keep jobs new for the next run
+        print("❌ TELEGRAM_CHAT_ID not set and no subscriptions", file=sys.stderr)
+    elif jobs_by_source:
+        queued = queue_new_jobs(cache, outbox, sources, jobs_by_source, subscribers)
+        # Outbox first: with the JSON backend it is a separate database, and
+        # a crash before the cache commit only re-detects the jobs (a
+        # duplicate message), while the reverse order would lose them.
+        # Validators last, a crash before them only costs a re-check.
+        with METRICS.phase("cache_save"):
+            outbox.commit()
+            cache.commit()
+            states.save()
+        print(f"📥 Queued: {queued} new job postings")
+    else:
+        skipped_runs = states.record_skipped_run()
+        states.save()
+        print(f"⏭ Nothing changed, run skipped (skipped runs: {skipped_runs})")
+
+    # Deliver queued messages, including leftovers of failed or crashed runs
+    pending = outbox.pending_count()
+    sent = failed = 0
+    if pending:
+        print(f"📨 Messages to send: {pending}")
+        sender = TelegramSender.from_env()
+        with METRICS.phase("delivery"):
+            sent, failed = deliver(outbox, sender, TELEGRAM_CONCURRENCY)
+    outbox.close()
+    cache.close()
+    return sent, failed
+
+
+def export_metrics(mode: str, elapsed: float):
+    """Write this run's metrics to the textfile and the JSON lines log."""
+    METRICS.observe("run_seconds", elapsed, mode=mode)
+    try:
+        if METRICS_TEXTFILE:
+            METRICS.write_textfile(Path(METRICS_TEXTFILE))
+        if METRICS_JSONL:
+            METRICS.append_jsonl(Path(METRICS_JSONL), mode=mode, seconds=elapsed)
+    except OSError as e:
+        print(f"⚠️ Metrics not saved: {e}", file=sys.stderr)
 
 
 def main():
     print(f"\n🔍 [{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting parser...")
+    start = time.perf_counter()
 
-    # Load cache of sent job postings
-    cache = load_cache()
-    print(f"📦 Cache: {len(cache)} known job postings")
+    sources = load_sources(SOURCES_FILE, default_source())
+    states = SourceStateStore(STATE_FILE)
+    # Opened before crawling: known jobs end pagination early
+    cache = open_cache(CACHE_BACKEND, CACHE_DIR)
 
     # Parse new job postings
     try:
-        jobs = parse_jobs()
+        jobs_by_source = collect_jobs(sources, states, cache)
     except Exception as e:
         print(f"❌ Critical error: {e}", file=sys.stderr)
+        cache.close()
+        METRICS.inc("run_errors_total")
+        export_metrics("once", time.perf_counter() - start)
         sys.exit(1)
 
-    if not jobs:
-        print("ℹ️ No job postings found")
-        sys.exit(0)
-
-    # Filter only new jobs (not in cache)
-    new_jobs = [j for j in jobs if j["id"] not in cache]
-    print(f"🆕 New job postings: {len(new_jobs)} out of {len(jobs)}")
-
-    # Send new job postings
-    sent_count = 0
-    for job in new_jobs:
-        msg = (
-            f"💼 <b>{job['title']}</b>\n"
-            f"🏢 {job['company']}\n"
-            f"📍 {job['location']}\n"
-            f"🛠 {job['tags']}\n"
-        )
-        if send_telegram(msg):
-            sent_count += 1
-            cache[job["id"]] = job["found_at"]
-            print(f"📤 Sent: {job['title']}")
-        else:
-            print(f"❌ Not sent: {job['title']}")
+    sent, failed = process_jobs(sources, states, jobs_by_source, cache)
+    export_metrics("once", time.perf_counter() - start)
+    print(f"\n✅ Done: {sent} messages sent, {failed} failed\n")
 
-    # Save cache
-    save_cache(cache)
-    print(f"\n✅ Done: {sent_count} new job postings sent\n")
+
+async def check_once(crawler: Crawler):
+    """One daemon check with the warm crawler."""
+    print(f"\n🔍 [{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Checking...")
+    start = time.perf_counter()
+    # Re-read on every check, so sources.json can change without a restart
+    sources = load_sources(SOURCES_FILE, default_source())
+    states = SourceStateStore(STATE_FILE)
+    cache = open_cache(CACHE_BACKEND, CACHE_DIR)
+
+    try:
+        jobs_by_source = await crawler.crawl(sources, states, cache)
+    except BaseException:
+        cache.close()
+        METRICS.inc("run_errors_total")
+        export_metrics("daemon", time.perf_counter() - start)
+        raise
+    sent, failed = await asyncio.to_thread(
+        process_jobs, sources, states, jobs_by_source, cache
+    )
+    export_metrics("daemon", time.perf_counter() - start)
+    print(f"✅ Done: {sent} messages sent, {failed} failed")
+
+
+def run_daemon():
+    """Check for new jobs until SIGTERM, keeping the browser warm."""
+    print(
+        f"🚀 Daemon started: every {DAEMON_INTERVAL:.0f}s "
+        f"(±{DAEMON_JITTER:.0f}s), browser recycled after "
+        f"{DAEMON_RECYCLE_RUNS} runs or {DAEMON_RECYCLE_RSS_MB:.0f} MB"
+    )
+    if METRICS_PORT:
+        METRICS.serve(METRICS_PORT)
+        print(f"📈 Metrics: http://127.0.0.1:{METRICS_PORT}/metrics")
+    daemon = Daemon(
+        check=check_once,
+        crawler_factory=lambda: Crawler(
+            max_contexts=MAX_CONTEXTS,
+            per_host=PER_HOST_LIMIT,
+            mode=FETCH_MODE,
+            max_pages=MAX_PAGES,
+            stop_after_known=STOP_AFTER_KNOWN,
+        ),
+        interval=DAEMON_INTERVAL,
+        jitter=DAEMON_JITTER,
+        recycle_runs=DAEMON_RECYCLE_RUNS,
+        recycle_rss_mb=DAEMON_RECYCLE_RSS_MB,
+    )
+    asyncio.run(daemon.run())
 
 
 if __name__ == "__main__":
-    main()
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip())
+    arg_parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="keep running and check on an interval with a warm browser",
+    )
+    if arg_parser.parse_args().daemon:
+        run_daemon()
+    else:
+        main()
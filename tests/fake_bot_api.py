@@ -0,0 +1,125 @@
+"""
+Local fake of the Telegram Bot API for offline tests.
+
+Records every call and can simulate latency and flood-control (HTTP 429)
+responses.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl
+
+
+class FakeBotAPI:
+    """Minimal Bot API server: sendMessage, editMessageText, getMe."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        rate_limited: int = 0,
+        retry_after=1,
+        flood_every: int = 0,
+    ):
+        self.latency = latency
+        # Number of upcoming sendMessage calls answered with 429
+        self.rate_limited = rate_limited
+        # Also answer every N-th sendMessage call with 429 (0 — never)
+        self.flood_every = flood_every
+        self._send_calls = 0
+        self.retry_after = retry_after
+        self.calls = []
+        self.messages = []
+        self._lock = threading.Lock()
+        self._message_id = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def start(self) -> "FakeBotAPI":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _flooded(self) -> bool:
+        """Whether this sendMessage call gets a 429 (called under the lock)."""
+        self._send_calls += 1
+        if self.rate_limited > 0:
+            self.rate_limited -= 1
+            return True
+        return bool(self.flood_every) and self._send_calls % self.flood_every == 0
+
+    def handle(self, method: str, params: dict):
+        """Return (status, body) for a Bot API call."""
+        with self._lock:
+            self.calls.append((method, params))
+            if method == "sendMessage" and self._flooded():
+                return 429, {
+                    "ok": False,
+                    "error_code": 429,
+                    "description": "Too Many Requests",
+                    "parameters": {"retry_after": self.retry_after},
+                }
+            if method in ("sendMessage", "editMessageText"):
+                if method == "sendMessage":
+                    self._message_id += 1
+                    self.messages.append(params)
+                return 200, {
+                    "ok": True,
+                    "result": {
+                        "message_id": params.get("message_id", self._message_id),
+                        "date": int(time.time()),
+                        "chat": {"id": params.get("chat_id"), "type": "private"},
+                        "text": params.get("text", ""),
+                    },
+                }
+            if method == "getMe":
+                return 200, {
+                    "ok": True,
+                    "result": {
+                        "id": 1,
+                        "is_bot": True,
+                        "first_name": "JobPulse",
+                        "username": "jobpulse_test_bot",
+                    },
+                }
+            return 200, {"ok": True, "result": True}
+
+    def _handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, like the real Bot API
+            protocol_version = "HTTP/1.1"
+            # Headers and body are separate writes: avoid delayed-ACK stalls
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                if "json" in (self.headers.get("Content-Type") or ""):
+                    params = json.loads(body) if body else {}
+                else:
+                    params = dict(parse_qsl(body.decode("utf-8")))
+                if api.latency:
+                    time.sleep(api.latency)
+                method = self.path.rsplit("/", 1)[-1]
+                status, payload = api.handle(method, params)
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
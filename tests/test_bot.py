@@ -0,0 +1,51 @@
+"""
+Tests for the bot application against a local fake Bot API.
+"""
+
+import asyncio
+import sys
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from bench_bot import RecordingBotAPI, load_test  # noqa: E402
+from replay_webhook import replay_local, synthetic_updates  # noqa: E402
+
+
+class TestBotLoad:
+    """Synthetic updates through bot.build_application."""
+
+    @pytest.mark.unit
+    def test_every_user_gets_a_reply(self):
+        """Each chat gets its reply; latency and queue numbers are reported."""
+        api = RecordingBotAPI().start()
+        args = Namespace(commands=["help", "start:3"], users=5, timeout=30)
+        try:
+            results = asyncio.run(load_test(args, api))
+        finally:
+            api.stop()
+
+        help_result, start_result = results
+        assert (help_result["users"], help_result["completed"]) == (5, 5)
+        assert start_result["completed"] == 3
+        assert len(api.messages) == 8
+        assert help_result["first_reply"]["p95"] >= help_result["first_reply"]["p50"]
+        assert help_result["handler"]["p50"] > 0
+        assert "p95" in help_result["loop_lag"]
+
+    @pytest.mark.unit
+    def test_webhook_replay(self):
+        """Webhook mode answers every replayed update and checks the secret."""
+        api = RecordingBotAPI().start()
+        updates = synthetic_updates(["help", "start", "nonsense"], 9)
+        try:
+            result = asyncio.run(replay_local(updates, 4, 30, api))
+        finally:
+            api.stop()
+
+        assert result["forged_status"] == 403
+        assert (result["updates"], result["ok"], result["replied"]) == (9, 9, 9)
+        assert result["reply"]["p50"] >= result["ack"]["p50"] > 0
@@ -0,0 +1,84 @@
+"""
+Tests for cache backends.
+"""
+
+import json
+
+import pytest
+from utils.cache import JobCache, JSONCache, SQLiteCache, open_cache
+
+
+class TestSQLiteCache:
+    """SQLite cache backend."""
+
+    @pytest.mark.unit
+    def test_migrates_json_cache(self, tmp_path):
+        """Existing jobs_cache.json is imported once and renamed."""
+        legacy = tmp_path / "jobs_cache.json"
+        legacy.write_text(json.dumps({"job-1": "2026-02-01T10:00:00"}))
+
+        cache = open_cache("sqlite", tmp_path)
+
+        assert "job-1" in cache
+        assert "job-2" not in cache
+        assert not legacy.exists()
+        assert (tmp_path / "jobs_cache.json.migrated").exists()
+        cache.close()
+
+    @pytest.mark.unit
+    def test_commit_and_evict(self, tmp_path):
+        """Committed entries survive reopening; eviction keeps newest."""
+        cache = SQLiteCache(tmp_path / "cache.db")
+        cache.add_many(
+            [
+                ("old", "2020-01-01T00:00:00"),
+                ("mid", "2026-01-01T00:00:00"),
+                ("new", "2026-02-01T00:00:00"),
+            ]
+        )
+        cache.commit()
+        cache.close()
+
+        cache = SQLiteCache(tmp_path / "cache.db")
+        assert len(cache) == 3
+        assert cache.evict(ttl_days=365 * 3) == 1
+        assert cache.evict(max_size=1) == 1
+        assert "new" in cache and "mid" not in cache
+        cache.close()
+
+
+class TestJSONCache:
+    """Legacy JSON cache backend."""
+
+    @pytest.mark.unit
+    def test_roundtrip(self, tmp_path):
+        """Entries are written atomically and read back."""
+        cache = JSONCache(tmp_path / "jobs_cache.json")
+        cache.add("job-1", "2026-02-01T10:00:00")
+        cache.commit()
+
+        assert "job-1" in JSONCache(tmp_path / "jobs_cache.json")
+
+
+class TestJobCache:
+    """The interface every backend implements."""
+
+    @pytest.mark.unit
+    def test_incomplete_backend_cannot_be_created(self):
+        """A backend missing a method fails when created, not on first use."""
+
+        class NoCommitCache(JobCache):
+            def __contains__(self, key):
+                return False
+
+            def __len__(self):
+                return 0
+
+            def add_many(self, items):
+                pass
+
+            def evict(self, ttl_days=None, max_size=None):
+                return 0
+
+        with pytest.raises(TypeError, match="commit"):
+            NoCommitCache()
@@ -0,0 +1,94 @@
+"""
+Tests for multi-source configuration and the concurrent crawler.
+"""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from utils.crawler import Crawler, crawl_sources
+from utils.sources import Source, load_sources
+
+
+class TestSources:
+    """Loading sources from a JSON file."""
+
+    @pytest.mark.unit
+    def test_defaults_without_file(self, tmp_path):
+        """Only the default source is used when the file is missing."""
+        default = Source(name="JobBoard Demo", url="https://example.com/")
+
+        assert load_sources(tmp_path / "missing.json", default) == [default]
+
+    @pytest.mark.unit
+    def test_selectors_and_namespace(self, tmp_path):
+        """Selectors are merged over defaults and namespace defaults to name."""
+        path = tmp_path / "sources.json"
+        path.write_text(
+            json.dumps(
+                [
+                    {
+                        "name": "hh",
+                        "url": "https://hh.example/",
+                        "selectors": {"card": ".v"},
+                    }
+                ]
+            ),
+            encoding="utf-8",
+        )
+
+        [source] = load_sources(path, None)
+
+        assert source.selectors["card"] == ".v"
+        assert source.selectors["title"] == ".job-title"
+        assert source.cache_key("1") == "hh:1"
+
+
+class TestCrawler:
+    """Concurrent crawl over the HTTP fast path."""
+
+    @pytest.mark.unit
+    def test_crawls_all_sources(self, fixture_server):
+        """Every source gets its own result, failures do not stop others."""
+        sources = [
+            Source(name="html", url=fixture_server + "jobboard.html", namespace="a"),
+            Source(name="json", url=fixture_server + "jobs.json", namespace="b"),
+            Source(name="broken", url=fixture_server + "missing.html", namespace="c"),
+        ]
+
+        results = asyncio.run(crawl_sources(sources, mode="http"))
+
+        assert len(results["html"]) == 4
+        assert len(results["json"]) == 2
+        assert results["broken"] == []
+
+    @pytest.mark.unit
+    def test_relaunches_disconnected_browser(self):
+        """A crashed browser is replaced instead of failing every source."""
+
+        class FakeBrowser:
+            def __init__(self):
+                self.connected = True
+
+            def is_connected(self):
+                return self.connected
+
+        class FakeChromium:
+            launched = []
+
+            async def launch(self, **kwargs):
+                self.launched.append(FakeBrowser())
+                return self.launched[-1]
+
+        async def scenario():
+            crawler = Crawler()
+            crawler._playwright = SimpleNamespace(chromium=FakeChromium())
+            first = await crawler._get_browser()
+            assert await crawler._get_browser() is first
+            first.connected = False
+            return first, await crawler._get_browser()
+
+        first, second = asyncio.run(scenario())
+
+        assert second is not first and second.is_connected()
@@ -0,0 +1,80 @@
+"""
+Tests for the long-running daemon loop (no browser is launched).
+"""
+
+import asyncio
+import os
+
+import pytest
+from utils.daemon import Daemon, process_tree_rss
+
+
+class FakeCrawler:
+    """Stands in for the crawler and counts close() calls."""
+
+    instances = 0
+
+    def __init__(self):
+        FakeCrawler.instances += 1
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def run_daemon(checks, fail=False, **kwargs):
+    """Run the daemon for the given number of checks."""
+    FakeCrawler.instances = 0
+    seen = []
+
+    async def check(crawler):
+        seen.append(crawler)
+        if len(seen) == checks:
+            daemon.stop()
+        if fail:
+            raise RuntimeError("browser crashed")
+
+    kwargs.setdefault("rss", lambda: 0)
+    daemon = Daemon(check, FakeCrawler, interval=0, jitter=0, **kwargs)
+    asyncio.run(daemon.run())
+    return daemon, seen
+
+
+class TestDaemon:
+    """Check loop, browser recycling and shutdown."""
+
+    @pytest.mark.unit
+    def test_reuses_warm_crawler(self):
+        """Checks share one crawler, which is closed on stop."""
+        daemon, seen = run_daemon(3, recycle_runs=0, recycle_rss_mb=0)
+
+        assert daemon.runs == 3
+        assert FakeCrawler.instances == 1
+        assert seen[0] is seen[-1] and seen[0].closed
+
+    @pytest.mark.unit
+    def test_recycles_after_runs(self):
+        """A new crawler is started every recycle_runs checks."""
+        _, seen = run_daemon(5, recycle_runs=2, recycle_rss_mb=0)
+
+        assert FakeCrawler.instances == 3
+        assert seen[0] is seen[1] and seen[0] is not seen[2]
+        assert all(crawler.closed for crawler in seen)
+
+    @pytest.mark.unit
+    def test_recycles_on_memory_and_failure(self):
+        """High RSS or a failed check replace the crawler."""
+        _, seen = run_daemon(2, recycle_runs=0, rss=lambda: 2 * 2**30)
+        assert seen[0] is not seen[1]
+
+        _, seen = run_daemon(2, recycle_runs=0, recycle_rss_mb=0, fail=True)
+        assert seen[0] is not seen[1]
+
+    @pytest.mark.unit
+    def test_jitter_and_rss(self):
+        """Delays stay within interval ± jitter; RSS includes this process."""
+        daemon = Daemon(None, FakeCrawler, interval=10, jitter=2)
+
+        assert all(8 <= daemon.next_delay() <= 12 for _ in range(100))
+        if os.path.exists("/proc"):
+            assert process_tree_rss() > 0
@@ -0,0 +1,118 @@
+"""
+Tests for digest batching and rate-aware Telegram delivery.
+"""
+
+import re
+
+import pytest
+from utils.delivery import (
+    DigestEntry,
+    TelegramSender,
+    TokenBucket,
+    build_digests,
+    format_job,
+    group_key,
+)
+from utils.job import Job
+
+
+def make_job(i, company="Яндекс"):
+    return Job(
+        id=f"job-{i}",
+        title=f"Python Developer {i}",
+        company=company,
+        location="Москва",
+        tags=("Python", "Django"),
+    )
+
+
+class TestDigests:
+    """Packing jobs into messages."""
+
+    @pytest.mark.unit
+    def test_respects_message_limit(self):
+        """500 jobs fit into few messages, none over the limit."""
+        entries = [
+            DigestEntry(text=format_job(make_job(i)), payload=i) for i in range(500)
+        ]
+
+        digests = build_digests(entries)
+
+        assert len(digests) < 50
+        assert all(len(d.text) <= 4096 for d in digests)
+        assert sorted(e.payload for d in digests for e in d.entries) == list(range(500))
+
+    @pytest.mark.unit
+    def test_grouped_by_company(self):
+        """Each group gets a header."""
+        jobs = [make_job(1, "Ozon"), make_job(2, "VK"), make_job(3, "Ozon")]
+        entries = [
+            DigestEntry(text=format_job(j), group=group_key(j, "company")) for j in jobs
+        ]
+
+        [digest] = build_digests(entries)
+
+        assert digest.text.count("📂 <b>Ozon</b>") == 1
+        assert digest.text.index("VK") > digest.text.index("Python Developer 3")
+
+    @pytest.mark.unit
+    def test_oversized_entry_keeps_html_valid(self):
+        """Truncation never cuts through a tag or an entity."""
+        job = Job(id="huge", title="R&D " * 2000, company="A&B", location="Москва")
+        text = "<a href='https://example.com/?a=1&amp;b=2'>" + "x&amp;y " * 900 + "</a>"
+        entries = [DigestEntry(text=format_job(job)), DigestEntry(text=text)]
+
+        digests = build_digests(entries)
+
+        assert len(digests) == 2
+        assert len(digests[0].text) < 4096
+        assert digests[0].text.count("<b>") == digests[0].text.count("</b>") == 1
+        long_one = digests[1].text
+        assert len(long_one) <= 4096 and long_one.endswith("…")
+        assert "<" not in long_one
+        assert not re.search(r"&(?!amp;)", long_one)
+
+
+class TestTokenBucket:
+    """Rate limiter."""
+
+    @pytest.mark.unit
+    def test_waits_for_tokens(self):
+        """Burst is served immediately, then one token per 1/rate seconds."""
+        now = [0.0]
+        waits = []
+
+        def sleep(seconds):
+            waits.append(seconds)
+            now[0] += seconds
+
+        bucket = TokenBucket(rate=2, capacity=2, clock=lambda: now[0], sleep=sleep)
+        for _ in range(4):
+            bucket.acquire()
+
+        assert waits == [0.5, 0.5]
+
+
+class TestTelegramSender:
+    """Delivery against a local fake Bot API."""
+
+    @pytest.mark.unit
+    def test_honours_retry_after(self, fake_bot_api):
+        """429 responses are retried after the requested delay."""
+        fake_bot_api.rate_limited = 2
+        fake_bot_api.retry_after = 3
+        sleeps = []
+        sender = TelegramSender(
+            "TOKEN",
+            "42",
+            api_url=fake_bot_api.url,
+            rate=1000,
+            chat_rate=1000,
+            sleep=sleeps.append,
+        )
+
+        assert sender.send("hello")
+        assert sleeps == [3, 3]
+        assert sender.retries == 2
+        assert fake_bot_api.messages[0]["text"] == "hello"
+        assert fake_bot_api.messages[0]["chat_id"] == "42"
@@ -0,0 +1,62 @@
+"""
+Tests for batched job card extraction.
+"""
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+from utils.extractor import build_job, extract_jobs
+
+FIXTURE = Path(__file__).parent / "fixtures" / "jobboard.html"
+
+
+class TestBuildJob:
+    """Fallbacks applied to raw card fields."""
+
+    @pytest.mark.unit
+    def test_missing_title_and_id(self):
+        """Missing title becomes 'Untitled' and is used as ID."""
+        job = build_job({"id": None, "title": None})
+        assert job.title == "Untitled"
+        assert job.id == "Untitled"
+        assert job.company == ""
+        assert job.tags == ()
+
+    @pytest.mark.unit
+    def test_date_and_tags_normalized(self):
+        """Russian date is parsed, tags are split into a tuple."""
+        job = build_job(
+            {
+                "id": "42",
+                "title": " Python Dev ",
+                "tags": "Python, Django,",
+                "posted": "📅 9 февр. 2026 г.",
+            }
+        )
+        assert job.id == "42"
+        assert job.title == "Python Dev"
+        assert job.tags == ("Python", "Django")
+        assert job.posted == date(2026, 2, 9)
+
+
+class TestExtractJobs:
+    """Extraction from a rendered page."""
+
+    @pytest.mark.e2e
+    def test_extracts_all_cards(self, page):
+        """All cards are extracted with fallbacks in one call."""
+        page.set_content(FIXTURE.read_text(encoding="utf-8"))
+
+        jobs, elapsed = extract_jobs(page)
+
+        assert [j.id for j in jobs] == [
+            "job-1",
+            "job-2",
+            "Frontend Developer",
+            "job-4",
+        ]
+        assert jobs[0].posted == date(2026, 2, 9)
+        assert jobs[0].tags == ("Python", "Django")
+        assert jobs[3].title == "Untitled"
+        assert elapsed >= 0
@@ -0,0 +1,104 @@
+"""
+Tests for near-duplicate detection.
+"""
+
+from dataclasses import replace
+
+import pytest
+from utils.cache import JSONCache, SQLiteCache
+from utils.fingerprint import (
+    Deduplicator,
+    SimHashIndex,
+    hamming,
+    job_fingerprint,
+    open_fingerprint_index,
+)
+from utils.job import Job
+
+JOB = Job(
+    id="job-1",
+    title="Python Developer",
+    company="Яндекс",
+    tags=("Python", "Django", "PostgreSQL"),
+    description="Разработка backend-сервисов поиска на Python и Django",
+)
+
+
+class TestFingerprint:
+    """SimHash fingerprints and the LSH index."""
+
+    @pytest.mark.unit
+    def test_similar_jobs_are_close(self):
+        """A lightly edited repost is close, a different job is far."""
+        repost = replace(JOB, id="job-99", tags=JOB.tags + ("Docker",))
+        other = replace(
+            JOB,
+            title="Frontend Developer",
+            company="VK",
+            tags=("React", "TypeScript"),
+            description="Интерфейсы мессенджера на React",
+        )
+        fp = job_fingerprint(JOB)
+
+        assert hamming(fp, job_fingerprint(repost)) <= 8
+        assert hamming(fp, job_fingerprint(other)) > 16
+
+    @pytest.mark.unit
+    def test_index_finds_within_distance(self):
+        """Any fingerprint within max_distance bits is found."""
+        index = SimHashIndex(max_distance=3)
+        fp = job_fingerprint(JOB)
+        index.add("job-1", fp)
+
+        assert index.nearest(fp ^ 0b1011) == ("job-1", 3)
+        assert index.nearest(fp ^ 0b11111) is None
+        assert index.nearest(fp, exclude="job-1") is None
+
+
+class TestDeduplicator:
+    """Classification against cache and index."""
+
+    @pytest.mark.unit
+    def test_repost_and_title_collision(self, tmp_path):
+        """Reposts are detected, same-title jobs get their own key."""
+        cache = SQLiteCache(tmp_path / "cache.db")
+        dedup = Deduplicator(cache, open_fingerprint_index(cache, max_distance=3))
+
+        assert dedup.classify("job-1", JOB)[0] == "new"
+        cache.add("job-1", "2026-02-01T10:00:00")
+
+        assert dedup.classify("job-1", JOB)[0] == "known"
+        assert dedup.classify("job-2", replace(JOB, id="job-2")) == (
+            "duplicate",
+            "job-2",
+            "job-1",
+        )
+
+        title_job = Job(id="QA", title="QA", company="Ozon", tags=("Python",))
+        cache.add("QA", "2026-02-01T10:00:00")
+        dedup.classify("QA", title_job)
+        other = replace(
+            title_job, company="Avito", tags=("Java",), description="Mobile"
+        )
+        status, key, _ = dedup.classify("QA", other)
+
+        assert status == "new"
+        assert key.startswith("QA#")
+        assert dedup.stats.collisions == 1
+        cache.close()
+
+    @pytest.mark.unit
+    def test_json_cache_keeps_fingerprints(self, tmp_path):
+        """Reposts are detected across runs on the JSON backend too."""
+        cache = JSONCache(tmp_path / "jobs_cache.json")
+        dedup = Deduplicator(cache, open_fingerprint_index(cache))
+        assert dedup.classify("job-1", JOB)[0] == "new"
+        cache.add("job-1", "2026-02-01T10:00:00")
+        cache.commit()
+
+        cache = JSONCache(tmp_path / "jobs_cache.json")
+        dedup = Deduplicator(cache, open_fingerprint_index(cache))
+        assert dedup.classify("job-2", replace(JOB, id="job-2"))[2] == "job-1"
+
+        cache.evict(ttl_days=1)
+        assert cache.fingerprints == {}
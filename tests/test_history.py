@@ -0,0 +1,107 @@
+"""
+Tests for the columnar job history and its rollups.
+"""
+
+from collections import Counter
+from datetime import date, datetime
+
+import pytest
+import parser
+from utils.history import HistoryStore, load_rollups, summarize
+from utils.job import Job
+from utils.pagination import PartialListing
+from utils.sources import Source
+
+PYTHON = Job(id="1", title="Python Dev", company="Яндекс", tags=("Python", "Django"))
+QA = Job(id="2", title="QA", company="Ozon", tags=("Playwright",), location="Москва")
+GO = Job(id="3", title="Go Dev", company="VK", tags=("Go",), location="Москва")
+
+
+def day(n: int, hour: int = 9) -> datetime:
+    return datetime(2026, 2, n, hour)
+
+
+def sightings(*jobs):
+    return [(f"demo:{job.id}", "demo", job) for job in jobs]
+
+
+class TestHistory:
+    """Appends, persistence and aggregates."""
+
+    @pytest.mark.unit
+    def test_one_row_per_job_per_day(self, tmp_path):
+        """Repeated checks on a day add nothing; history survives reopening."""
+        history = HistoryStore(tmp_path)
+        assert history.append(sightings(PYTHON, QA), day(1)) == 2
+        assert history.append(sightings(PYTHON, QA, GO), day(1, 15)) == 1
+        history.commit()
+
+        reopened = HistoryStore(tmp_path)
+        assert len(reopened) == 3
+        assert reopened.append(sightings(PYTHON), day(1, 20)) == 0
+        assert reopened.carry_over("demo", day(2)) == 3
+        assert reopened.daily_counts("tag")[date(2026, 2, 2)] == Counter(
+            {"Python": 1, "Django": 1, "Playwright": 1, "Go": 1}
+        )
+        with pytest.raises(ValueError):
+            reopened.append(sightings(GO), day(1))
+
+    @pytest.mark.unit
+    def test_torn_append_is_cut(self, tmp_path):
+        """Columns of unequal length are cut back to whole rows."""
+        history = HistoryStore(tmp_path)
+        history.append(sightings(PYTHON, QA), day(1))
+        history.commit()
+        with open(tmp_path / "day.col", "ab") as f:
+            f.write(b"\x01\x02\x03\x04\x05")
+
+        assert len(HistoryStore(tmp_path)) == 2
+
+    @pytest.mark.unit
+    def test_rollups(self, tmp_path):
+        """Per-day postings, new and removed jobs, and time to removal."""
+        history = HistoryStore(tmp_path)
+        history.append(sightings(PYTHON, QA), day(1))
+        history.refresh_rollups()
+        history.append(sightings(PYTHON, GO), day(2))
+        history.append(sightings(GO), day(4))
+        history.commit()
+        history.refresh_rollups()
+
+        assert sorted(history.removal_times()) == [1, 2]
+        assert history.daily_counts("company")[date(2026, 2, 4)] == {"VK": 1}
+        rollups = load_rollups(tmp_path)
+        assert list(rollups["days"]) == ["2026-02-01", "2026-02-02", "2026-02-04"]
+        assert rollups["days"]["2026-02-02"]["removed"] == 1
+
+        summary = summarize(rollups, days=2)
+        assert summary["active"] == 1
+        assert (summary["new"], summary["removed"]) == (1, 2)
+        assert summary["median_listed_days"] == 1.5
+        assert summary["locations"] == [("Москва", 1)]
+        assert summarize({"days": {}}) is None
+
+    @pytest.mark.unit
+    def test_incomplete_listings_keep_sightings(self, tmp_path, monkeypatch):
+        """Early-stopped and failed crawls don't count unseen jobs as removed."""
+        monkeypatch.setattr(parser, "HISTORY_DIR", tmp_path)
+        source = Source(name="demo", url="https://example.com/", namespace="demo")
+        jobs = [Job(id=str(i), title=f"Job {i}", company="VK") for i in range(20)]
+        new = Job(id="new", title="New job", company="Ozon")
+
+        parser.record_history([source], {"demo": jobs}, day(1))
+        # Stopped after five known jobs in a row, still on the first page
+        partial = PartialListing([new, *jobs[:5]])
+        parser.record_history([source], {"demo": partial}, day(2))
+        parser.record_history([source], {"demo": []}, day(3))
+        parser.record_history([source], {"demo": [new, *jobs[:10]]}, day(4))
+
+        rollups = load_rollups(tmp_path)["days"]
+        assert (rollups["2026-02-02"]["active"], rollups["2026-02-02"]["new"]) == (
+            21,
+            1,
+        )
+        assert rollups["2026-02-02"]["removed"] == 0
+        assert rollups["2026-02-03"]["active"] == 21
+        assert rollups["2026-02-03"]["removed"] == 0
+        assert rollups["2026-02-04"]["removed"] == 10
@@ -0,0 +1,84 @@
+"""
+Tests for the browserless HTTP fast path.
+"""
+
+from datetime import date
+
+import pytest
+import parser
+from utils.http_source import fetch_jobs_http
+
+
+class TestHttpSource:
+    """Fetch-and-parse against a local fixture server."""
+
+    @pytest.mark.unit
+    def test_static_html(self, fixture_server):
+        """Cards in static HTML produce the same jobs as parse_jobs."""
+        jobs, _ = fetch_jobs_http(fixture_server + "jobboard.html")
+
+        assert [j.id for j in jobs] == [
+            "job-1",
+            "job-2",
+            "Frontend Developer",
+            "job-4",
+        ]
+        assert jobs[0].title == "Python Developer"
+        assert jobs[0].company == "Яндекс"
+        assert jobs[0].tags == ("Python", "Django")
+        assert jobs[0].posted == date(2026, 2, 9)
+        assert jobs[2].location == ""
+        assert jobs[3].title == "Untitled"
+
+    @pytest.mark.unit
+    def test_json_data_file(self, fixture_server):
+        """JSON data file is parsed into jobs."""
+        jobs, _ = fetch_jobs_http(fixture_server + "jobs.json")
+
+        assert jobs[0].id == "101"
+        assert jobs[0].tags == ("Python", "Spark")
+        assert jobs[0].posted == date(2026, 2, 5)
+        assert jobs[1].id == "Go Developer"
+
+    @pytest.mark.unit
+    def test_unchanged_page_skipped(self, fixture_server):
+        """Second fetch with saved validators reports the page as unchanged."""
+        state = {}
+        jobs, _ = fetch_jobs_http(fixture_server + "jobboard.html", state=state)
+        assert len(jobs) == 4
+        assert state["via"] == "http"
+
+        jobs, _ = fetch_jobs_http(fixture_server + "jobboard.html", state=state)
+        assert jobs is None
+
+    @pytest.mark.unit
+    def test_falls_back_to_browser(self, fixture_server, monkeypatch):
+        """Empty static page falls back to the Playwright path."""
+        monkeypatch.setattr(parser, "JOBSITE_URL", fixture_server + "empty.html")
+        monkeypatch.setattr(parser, "FETCH_MODE", "auto")
+        monkeypatch.setattr(
+            parser,
+            "parse_jobs",
+            lambda source, state=None, cache=None: [{"id": "from-browser"}],
+        )
+
+        assert parser.fetch_jobs() == [{"id": "from-browser"}]
+
+    @pytest.mark.unit
+    def test_synthetic_benchmark_board(self):
+        """Benchmark pages use markup every card field is parsed from."""
+        from benchmarks.jobboard_server import SyntheticJobBoard
+
+        board = SyntheticJobBoard().start()
+        try:
+            jobs, _ = fetch_jobs_http(board.url(120, per_page=100))
+        finally:
+            board.stop()
+
+        assert len(jobs) == 100
+        assert len({job.id for job in jobs}) == 100
+        assert all(
+            job.title and job.company and job.location and job.description
+            for job in jobs
+        )
+        assert all(len(job.tags) == 3 and job.posted for job in jobs)
@@ -0,0 +1,66 @@
+"""
+Tests for the typed job model.
+"""
+
+import sys
+from datetime import date, datetime
+
+import pytest
+from utils.job import Job, parse_ru_date
+
+
+class TestJob:
+    """Date parsing, tag normalization and serialization."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "text, expected",
+        [
+            ("📅 9 февр. 2026 г.", date(2026, 2, 9)),
+            ("12 мая 2025", date(2025, 5, 12)),
+            ("1 сентября 2025 г.", date(2025, 9, 1)),
+            ("31 дек. 2024 г.", date(2024, 12, 31)),
+            ("09.02.2026", date(2026, 2, 9)),
+            ("2026-02-09", date(2026, 2, 9)),
+            ("31 февр. 2026 г.", None),
+            ("вчера", None),
+        ],
+    )
+    def test_parse_ru_date(self, text, expected):
+        """Russian, numeric and ISO dates; invalid ones give None."""
+        assert parse_ru_date(text) == expected
+
+    @pytest.mark.unit
+    def test_bytes_round_trip(self):
+        """Serialized jobs come back equal and smaller than JSON-ish dicts."""
+        job = Job.from_raw(
+            {
+                "id": "job-1",
+                "title": "Python Developer",
+                "company": "Яндекс",
+                "tags": "Python, Django",
+                "description": "Backend services for search.",
+                "location": "Москва",
+                "posted": "📅 9 февр. 2026 г.",
+            },
+            found_at=datetime(2026, 2, 10, 12, 30, 15, 123456),
+        )
+
+        data = job.to_bytes()
+
+        assert Job.from_bytes(data) == job
+        assert Job.from_bytes(Job(id="x", title="x").to_bytes()).posted is None
+        assert len(data) < len(repr(job).encode("utf-8"))
+
+    @pytest.mark.unit
+    def test_compact_and_interned(self):
+        """Jobs have no per-instance dict and share tag strings."""
+        first = Job.from_raw({"title": "A", "tags": "".join(["Py", "thon"])})
+        second = Job.from_raw({"title": "B", "tags": "Python, Go"})
+
+        assert not hasattr(first, "__dict__")
+        assert first.tags[0] is second.tags[0]
+        as_dict = {name: getattr(first, name) for name in Job.__slots__}
+        assert sys.getsizeof(first) < sys.getsizeof(as_dict)
+        with pytest.raises(AttributeError):
+            first.title = "C"
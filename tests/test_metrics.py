@@ -0,0 +1,81 @@
+"""
+Tests for run metrics and their exports.
+"""
+
+import json
+import urllib.request
+
+import pytest
+from utils.metrics import DEFAULT_BUCKETS, Histogram, Metrics, percentile
+
+
+class TestMetrics:
+    """Histograms, counters, Prometheus text and JSON lines."""
+
+    @pytest.mark.unit
+    def test_prometheus_text(self):
+        """Buckets are cumulative; labels are sorted and escaped."""
+        metrics = Metrics(buckets=(0.1, 1.0))
+        metrics.observe("phase_seconds", 0.05, phase="goto", source='a "b"')
+        metrics.observe("phase_seconds", 0.5, phase="goto", source='a "b"')
+        metrics.inc("jobs_new_total", 3)
+
+        lines = metrics.render().splitlines()
+        labels = 'phase="goto",source="a \\"b\\""'
+        assert "# TYPE jobpulse_phase_seconds histogram" in lines
+        assert f'jobpulse_phase_seconds_bucket{{{labels},le="0.1"}} 1' in lines
+        assert f'jobpulse_phase_seconds_bucket{{{labels},le="1"}} 2' in lines
+        assert f'jobpulse_phase_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+        assert f"jobpulse_phase_seconds_count{{{labels}}} 2" in lines
+        assert "jobpulse_jobs_new_total 3" in lines
+
+    @pytest.mark.unit
+    def test_runs_to_jsonl(self, tmp_path):
+        """Each line holds one run's percentiles and counter increments."""
+        metrics = Metrics()
+        for ms in range(1, 101):
+            with metrics.phase("diff"):
+                pass
+            metrics.observe("phase_seconds", ms / 1000, phase="telegram_send")
+        metrics.inc("telegram_retries_total", 2)
+        path = tmp_path / "runs.jsonl"
+        metrics.append_jsonl(path, mode="once")
+        metrics.inc("telegram_retries_total")
+        metrics.append_jsonl(path, mode="once")
+
+        first, second = [json.loads(line) for line in path.read_text().splitlines()]
+        send = first["histograms"]['phase_seconds{phase="telegram_send"}']
+        assert (send["count"], send["p50"], send["p95"]) == (100, 0.05, 0.095)
+        assert first["counters"] == {"telegram_retries_total": 2}
+        assert second["histograms"] == {}
+        assert second["counters"] == {"telegram_retries_total": 1}
+        assert percentile([3, 1, 2], 50) == 2
+
+    @pytest.mark.unit
+    def test_samples_are_bounded(self):
+        """A process that never snapshots keeps only the latest samples."""
+        histogram = Histogram(DEFAULT_BUCKETS, max_samples=100)
+        for ms in range(1000):
+            histogram.observe(ms / 1000)
+
+        assert len(histogram.samples) == 100 and histogram.samples[0] == 0.9
+        assert (histogram.count, histogram.run_count) == (1000, 1000)
+        assert histogram.run_sum == pytest.approx(499.5)
+
+    @pytest.mark.unit
+    def test_http_endpoint_and_textfile(self, tmp_path):
+        """/metrics serves the same text that goes to the textfile."""
+        metrics = Metrics()
+        metrics.inc("jobs_found_total", 4, source="demo")
+        server = metrics.serve(0)
+        try:
+            url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+            with urllib.request.urlopen(url) as resp:
+                body = resp.read().decode()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        metrics.write_textfile(tmp_path / "jobpulse.prom")
+        assert body == (tmp_path / "jobpulse.prom").read_text()
+        assert 'jobpulse_jobs_found_total{source="demo"} 4' in body
@@ -0,0 +1,92 @@
+"""
+Tests for the persistent notification outbox.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+import parser
+from utils.cache import SQLiteCache
+from utils.change_detection import SourceStateStore
+from utils.delivery import TelegramSender
+from utils.outbox import deliver, open_outbox
+from utils.sources import Source
+
+
+class TestOutbox:
+    """Queueing and crash-safe delivery."""
+
+    @pytest.mark.unit
+    def test_delivers_and_checkpoints(self, tmp_path, fake_bot_api):
+        """Every pending message is sent once and marked as sent."""
+        cache = SQLiteCache(tmp_path / "cache.db")
+        outbox = open_outbox(cache, tmp_path)
+        for i in range(50):
+            outbox.enqueue(str(i % 5), f"job {i}", [f"job-{i}"])
+        outbox.commit()
+
+        sender = TelegramSender(
+            "TOKEN", None, api_url=fake_bot_api.url, rate=1000, chat_rate=1000
+        )
+        assert deliver(outbox, sender, concurrency=8) == (50, 0)
+
+        assert outbox.pending_count() == 0
+        assert sorted(m["text"] for m in fake_bot_api.messages) == sorted(
+            f"job {i}" for i in range(50)
+        )
+        # Nothing left to re-send on the next run
+        assert deliver(outbox, sender) == (0, 0)
+        assert len(fake_bot_api.messages) == 50
+        cache.close()
+
+    @pytest.mark.unit
+    def test_failed_sends_stay_pending(self, tmp_path):
+        """Failed messages are retried, then only after a growing backoff."""
+        outbox = open_outbox(None, tmp_path, max_attempts=2, failed_backoff=60)
+        outbox.enqueue("1", "hello", ["job-1"])
+        outbox.commit()
+
+        class FailingSender:
+            session = TelegramSender("TOKEN", "1").session
+
+            def send(self, text, chat_id=None):
+                return False
+
+        assert deliver(outbox, FailingSender()) == (0, 1)
+        assert outbox.pending_count() == 1
+        assert deliver(outbox, FailingSender()) == (0, 1)
+        assert outbox.pending_count() == 0
+        # Given up for now, but not dropped: its jobs are already cached
+        assert deliver(outbox, FailingSender()) == (0, 0)
+        outbox.conn.execute("UPDATE outbox SET retry_at = '2000-01-01'")
+        [message] = outbox.pending()
+        assert message.keys == ["job-1"]
+        assert deliver(outbox, FailingSender()) == (0, 1)
+        (retry_at,) = outbox.conn.execute("SELECT retry_at FROM outbox").fetchone()
+        wait = datetime.fromisoformat(retry_at) - datetime.now()
+        assert timedelta(seconds=110) < wait <= timedelta(seconds=120)
+        outbox.close()
+
+    @pytest.mark.unit
+    def test_run_retries_due_failed_messages(self, tmp_path, monkeypatch, fake_bot_api):
+        """A run with nothing new still retries failed messages that are due."""
+        for name in ("CACHE_DIR", "HISTORY_DIR"):
+            monkeypatch.setattr(parser, name, tmp_path)
+        monkeypatch.setattr(parser, "SUBSCRIPTIONS_FILE", tmp_path / "subs.db")
+        monkeypatch.setattr(parser, "SEARCH_FILE", tmp_path / "search.db")
+        monkeypatch.setattr(parser, "TELEGRAM_CHAT_ID", "1")
+        monkeypatch.setenv("TELEGRAM_BOT_TOKEN", "TOKEN")
+        monkeypatch.setenv("TELEGRAM_API_URL", fake_bot_api.url)
+
+        cache = SQLiteCache(tmp_path / "jobs_cache.db")
+        outbox = open_outbox(cache, tmp_path)
+        outbox.enqueue("1", "hello", ["job-1"])
+        outbox.conn.execute(
+            "UPDATE outbox SET status = 'failed', retry_at = '2000-01-01'"
+        )
+        outbox.commit()
+
+        source = Source(name="demo", url="https://example.com/", namespace="demo")
+        states = SourceStateStore(tmp_path / "sources_state.json")
+        assert parser.process_jobs([source], states, {"demo": None}, cache) == (1, 0)
+        assert [m["text"] for m in fake_bot_api.messages] == ["hello"]
@@ -0,0 +1,119 @@
+"""
+Tests for streaming pagination and the early stop on known jobs.
+"""
+
+import pytest
+from playwright.sync_api import Error as PWError
+from utils.extractor import EXTRACT_JOBS_JS, JOB_SELECTORS
+from utils.job import Job
+from utils.pagination import (
+    PAGE_CHANGED_JS,
+    PAGE_SIGNATURE_JS,
+    SCROLL_TO_BOTTOM_JS,
+    KnownRun,
+    PartialListing,
+    iter_jobs,
+)
+
+
+def card(job_id):
+    return {
+        "id": job_id,
+        "title": f"Job {job_id}",
+        "company": "Acme",
+        "tags": "Python",
+        "description": "",
+        "location": "Remote",
+        "posted": None,
+    }
+
+
+class FakeLocator:
+    first = property(lambda self: self)
+
+    def count(self):
+        return 0
+
+
+class InfiniteScrollPage:
+    """Page that appends a batch of cards on every scroll to the bottom."""
+
+    def __init__(self, batches):
+        self.batches = batches
+        self.loaded = 1
+        self.scrolls = 0
+
+    @property
+    def cards(self):
+        return [
+            card(job_id) for batch in self.batches[: self.loaded] for job_id in batch
+        ]
+
+    def evaluate(self, script, arg=None):
+        if script == EXTRACT_JOBS_JS:
+            return self.cards
+        if script == PAGE_SIGNATURE_JS:
+            return len(self.cards)
+        if script == SCROLL_TO_BOTTOM_JS:
+            self.scrolls += 1
+            self.loaded = min(self.loaded + 1, len(self.batches))
+
+    def wait_for_function(self, script, arg=None, **kwargs):
+        if script == PAGE_CHANGED_JS and arg[1] == len(self.cards):
+            raise PWError("Timeout")
+
+    def locator(self, selector):
+        return FakeLocator()
+
+
+class TestPagination:
+    """Lazy page loading and early stop."""
+
+    @pytest.mark.unit
+    def test_follows_infinite_scroll(self):
+        """All batches are yielded once, then the crawl ends."""
+        page = InfiniteScrollPage([["1", "2"], ["3", "4"], ["5"]])
+
+        ids = [job.id for job in iter_jobs(page, JOB_SELECTORS)]
+
+        assert ids == ["1", "2", "3", "4", "5"]
+        assert page.scrolls == 3
+
+    @pytest.mark.unit
+    def test_stops_on_known_run(self):
+        """The page with enough known jobs in a row is the last one loaded."""
+        page = InfiniteScrollPage(
+            [["new-1", "old-1"], ["old-2", "old-3", "new-2"], ["old-4"]]
+        )
+        known = {"old-1", "old-2", "old-3", "old-4"}
+        run = KnownRun(lambda job: job.id in known, 2)
+
+        jobs = [job.id for job in iter_jobs(page, JOB_SELECTORS, run=run)]
+
+        # The rest of the page is kept, even after a new job resets the run
+        assert jobs == ["new-1", "old-1", "old-2", "old-3", "new-2"]
+        # One more scroll only checks that the listing goes on
+        assert page.scrolls == 2
+        assert isinstance(run.listing(jobs), PartialListing)
+
+    @pytest.mark.unit
+    def test_stop_on_last_page_is_complete(self):
+        """A listing whose last page was reached is not partial."""
+        page = InfiniteScrollPage([["old-1", "old-2", "old-3"]])
+        run = KnownRun(lambda job: True, 2)
+
+        jobs = [job.id for job in iter_jobs(page, JOB_SELECTORS, run=run)]
+
+        assert jobs == ["old-1", "old-2", "old-3"]
+        assert run.stopped and not isinstance(run.listing(jobs), PartialListing)
+
+    @pytest.mark.unit
+    def test_known_run_resets_and_can_be_disabled(self):
+        """A new job resets the run; stop_after=0 never stops."""
+        jobs = [Job(id=i, title=i) for i in ("old", "new", "old", "old")]
+        is_known = lambda job: job.id == "old"
+
+        run = KnownRun(is_known, 2)
+        assert [run.reached(job) for job in jobs] == [False, False, False, True]
+        assert not any(KnownRun(is_known, 0).reached(job) for job in jobs * 3)
+        assert not any(KnownRun(None, 2).reached(job) for job in jobs * 3)
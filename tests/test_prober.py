@@ -0,0 +1,72 @@
+"""
+Tests for the background site prober behind /status.
+"""
+
+import asyncio
+import socket
+import time
+
+import pytest
+from utils.prober import SiteProber
+
+
+class TestSiteProber:
+    """Concurrent probes, rolling window, percentiles and uptime."""
+
+    @pytest.mark.unit
+    def test_probes_sites_concurrently(self, fixture_server):
+        """A hanging host costs one timeout, not one per site."""
+        # Accepts connections but never answers
+        hanging = socket.socket()
+        hanging.bind(("127.0.0.1", 0))
+        hanging.listen()
+        sites = {
+            "ok": fixture_server + "jobboard.html",
+            "missing": fixture_server + "missing.html",
+            "hanging": f"http://127.0.0.1:{hanging.getsockname()[1]}/",
+            "hanging too": f"http://127.0.0.1:{hanging.getsockname()[1]}/other",
+        }
+
+        async def scenario():
+            prober = SiteProber(sites, timeout=0.5, window=3)
+            start = time.monotonic()
+            samples = await prober.probe_all()
+            elapsed = time.monotonic() - start
+            for _ in range(3):
+                await prober.probe_all()
+            await prober.close()
+            return prober, samples, elapsed
+
+        try:
+            prober, samples, elapsed = asyncio.run(scenario())
+        finally:
+            hanging.close()
+
+        assert elapsed < 1.5
+        assert samples["ok"].ok and samples["ok"].latency > 0
+        assert samples["missing"].status_code == 404
+        assert not samples["hanging"].ok and samples["hanging"].error
+
+        ok = prober.summary("ok")
+        assert ok["samples"] == 3
+        assert ok["uptime"] == 1.0
+        assert 0 < ok["p50"] <= ok["p95"]
+        hanging_summary = prober.summary("hanging")
+        assert hanging_summary["uptime"] == 0.0
+        assert hanging_summary["p50"] is None
+
+    @pytest.mark.unit
+    def test_ready_waits_for_first_round(self, fixture_server):
+        """Callers get samples without probing themselves."""
+
+        async def scenario():
+            prober = SiteProber({"ok": fixture_server + "jobboard.html"}, interval=60)
+            await asyncio.gather(prober.ready(), prober.ready())
+            summary = prober.summary("ok")
+            await prober.close()
+            return summary
+
+        summary = asyncio.run(scenario())
+
+        assert summary["samples"] == 1
+        assert summary["latest"].ok
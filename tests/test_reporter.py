@@ -0,0 +1,103 @@
+"""
+Tests for structured per-run test reports.
+"""
+
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+
+# Aliased, so pytest does not try to collect it
+from utils.reporter import (
+    TestReport as RunReport,
+    format_summary,
+    load_report,
+    prune_reports,
+)
+
+
+def sample_report() -> RunReport:
+    report = RunReport("20260217_120000_run7")
+    report.add_result("tests/test_a.py::TestA::test_ok", "PASSED", 0.5)
+    report.add_result(
+        "tests/test_a.py::TestA::test_broken",
+        "FAILED",
+        1.25,
+        error="AssertionError: assert 1 == 2\nmore details",
+    )
+    report.add_result("tests/test_b.py::test_later", "SKIPPED", 0.0)
+    return report
+
+
+class TestReporter:
+    """JSON, JUnit XML and text from one set of results."""
+
+    @pytest.mark.unit
+    def test_save_and_load(self, tmp_path):
+        """The run directory holds all three files; JSON loads back."""
+        directory = sample_report().save(tmp_path / "20260217_120000_run7")
+
+        assert sorted(p.name for p in directory.iterdir()) == [
+            "junit.xml",
+            "report.json",
+            "report.txt",
+        ]
+        data = load_report(directory)
+        assert data["run_id"] == "20260217_120000_run7"
+        assert (data["total"], data["passed"], data["failed"], data["skipped"]) == (
+            3,
+            1,
+            1,
+            1,
+        )
+        assert data["duration"] == 1.75
+        assert data["tests"][1]["error"].startswith("AssertionError")
+        assert load_report(tmp_path / "missing") is None
+        # A torn write reads as no report instead of raising
+        (directory / "report.json").write_text('{"run_id": "2026', encoding="utf-8")
+        assert load_report(directory) is None
+
+    @pytest.mark.unit
+    def test_prune_keeps_newest_runs(self, tmp_path):
+        """Old run directories go; other files and directories stay."""
+        for i in range(5):
+            directory = sample_report().save(tmp_path / f"run{i}")
+            os.utime(directory, (1000 + i, 1000 + i))
+        (tmp_path / "notes").mkdir()
+
+        assert prune_reports(tmp_path, keep=2) == 3
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["notes", "run3", "run4"]
+        assert prune_reports(tmp_path, keep=0) == 0
+
+    @pytest.mark.unit
+    def test_junit_xml(self, tmp_path):
+        """One testcase per test, with failure and skipped elements."""
+        directory = sample_report().save(tmp_path / "run")
+
+        suite = ET.parse(directory / "junit.xml").getroot().find("testsuite")
+        assert suite.get("tests") == "3"
+        assert suite.get("failures") == "1"
+        cases = suite.findall("testcase")
+        assert [(c.get("classname"), c.get("name")) for c in cases] == [
+            ("tests.test_a.TestA", "test_ok"),
+            ("tests.test_a.TestA", "test_broken"),
+            ("tests.test_b", "test_later"),
+        ]
+        failure = cases[1].find("failure")
+        assert failure.get("message") == "AssertionError: assert 1 == 2"
+        assert "more details" in failure.text
+        assert cases[2].find("skipped") is not None
+
+    @pytest.mark.unit
+    def test_summary_from_data(self, tmp_path):
+        """The bot renders saved data under the suite's own title."""
+        report = sample_report()
+        directory = report.save(tmp_path / "run")
+
+        text = format_summary(load_report(directory), "the-internet")
+        assert text.startswith("❌ the-internet — Test Report")
+        assert "Failed:         1 ❌" in text
+        assert "   Error: AssertionError: assert 1 == 2" in text
+        assert (directory / "report.txt").read_text(encoding="utf-8") == (
+            report.get_summary()
+        )
@@ -0,0 +1,51 @@
+"""
+Tests for request interception policy.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from utils.resource_policy import ResourcePolicy
+
+
+def fake_request(url, resource_type):
+    return SimpleNamespace(url=url, resource_type=resource_type)
+
+
+class TestResourcePolicy:
+    """Blocking rules and configuration."""
+
+    @pytest.mark.unit
+    def test_blocks_non_essential(self):
+        """Images and analytics are blocked, documents and scripts are not."""
+        policy = ResourcePolicy()
+
+        assert policy.should_block(fake_request("https://a.io/logo.png", "image"))
+        assert policy.should_block(
+            fake_request("https://www.google-analytics.com/g/collect", "xhr")
+        )
+        assert not policy.should_block(fake_request("https://a.io/", "document"))
+        assert not policy.should_block(fake_request("https://a.io/app.js", "script"))
+
+    @pytest.mark.unit
+    def test_configured_from_env(self, monkeypatch):
+        """Empty env values disable blocking."""
+        monkeypatch.setenv("JOBSITE_BLOCK_RESOURCES", "")
+        monkeypatch.setenv("JOBSITE_BLOCK_HOSTS", "")
+        policy = ResourcePolicy.from_env()
+
+        assert not policy.should_block(fake_request("https://a.io/x.png", "image"))
+
+    @pytest.mark.unit
+    def test_time_saved_counts_only_activity_before_ready(self):
+        """An idle network saves nothing; later requests don't inflate it."""
+        policy = ResourcePolicy()
+        policy.started_at = 10.0
+        policy.last_activity_at = 10.2
+        policy.ready_at = 11.0
+        assert policy.time_saved == 0.0
+
+        policy.last_activity_at = 10.8
+        assert policy.time_saved == pytest.approx(0.3)
+        policy._on_activity(None)
+        assert policy.last_activity_at == 10.8
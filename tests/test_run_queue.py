@@ -0,0 +1,350 @@
+"""
+Tests for the asynchronous test-run queue.
+"""
+
+import asyncio
+import functools
+import re
+import sys
+import time
+from dataclasses import dataclass
+
+import pytest
+from utils.run_queue import (
+    CANCELLED,
+    DONE,
+    FAILED,
+    HIT,
+    JOINED,
+    MISS,
+    RUNNING,
+    TIMEOUT,
+    RunQueue,
+    Suite,
+)
+
+
+@dataclass(frozen=True)
+class SleepSuite(Suite):
+    """Stands in for pytest: sleeps, then prints one passed test."""
+
+    seconds: float = 0.3
+
+    def command(self):
+        code = f"import time; time.sleep({self.seconds}); print('test_a PASSED')"
+        return [sys.executable, "-c", code]
+
+
+def suite(seconds: float = 0.3) -> SleepSuite:
+    return SleepSuite("sleep", "Sleep Demo", "-", seconds)
+
+
+class PidSuite(Suite):
+    """Shows test output, so tests can print their worker's PID.
+
+    The reporter hooks come from conftest.py in the repo; load them here.
+    """
+
+    def pytest_args(self):
+        return [self.test_file, "-v", "-s", "-p", "utils.conftest_hooks"]
+
+
+class TestRunQueue:
+    """Ordering, cancellation, timeouts and a free event loop."""
+
+    @pytest.mark.unit
+    def test_runs_in_order_without_blocking(self, tmp_path):
+        """Runs get IDs and positions; the loop keeps ticking meanwhile."""
+
+        async def scenario():
+            runs = RunQueue(workers=1, cwd=tmp_path)
+            finished = []
+
+            async def on_finish(run):
+                finished.append(run)
+
+            submitted = [runs.submit(42, suite(), on_finish) for _ in range(3)]
+            await asyncio.sleep(0.1)
+            positions = [runs.position(run) for run in submitted]
+
+            ticks = 0
+            while len(finished) < 3:
+                await asyncio.sleep(0.01)
+                ticks += 1
+            await runs.close()
+            return submitted, positions, finished, ticks
+
+        submitted, positions, finished, ticks = asyncio.run(scenario())
+
+        assert [run.id for run in submitted] == [1, 2, 3]
+        assert positions == [0, 1, 2]
+        assert finished == submitted
+        assert all(run.status == DONE for run in finished)
+        assert finished[0].exit_code == 0
+        # No pytest, no report: every run still gets a directory of its own
+        assert finished[0].result is None
+        assert len({run.report_dir for run in finished}) == 3
+        # Three 0.3 s runs: a blocked loop would not tick in between
+        assert ticks > 30
+
+    @pytest.mark.unit
+    def test_cancel_and_timeout(self, tmp_path):
+        """Only the owner cancels; running processes are stopped."""
+
+        async def scenario():
+            runs = RunQueue(workers=1, timeout=0.5, cwd=tmp_path)
+            finished = []
+
+            async def on_finish(run):
+                finished.append(run)
+
+            running = runs.submit(1, suite(30), on_finish)
+            queued = runs.submit(1, suite(30), on_finish)
+            slow = runs.submit(2, suite(30), on_finish)
+            await asyncio.sleep(0.1)
+
+            assert runs.cancel(queued.id, chat_id=2) is None
+            assert runs.cancel(queued.id, chat_id=1) is queued
+            assert [run.id for run in runs.active()] == [running.id, slow.id]
+            start = time.monotonic()
+            runs.cancel(running.id, chat_id=1)
+            while len(finished) < 2:
+                await asyncio.sleep(0.01)
+            await runs.close()
+            return running, queued, slow, finished, time.monotonic() - start
+
+        running, queued, slow, finished, elapsed = asyncio.run(scenario())
+
+        assert (running.status, queued.status, slow.status) == (
+            CANCELLED,
+            CANCELLED,
+            TIMEOUT,
+        )
+        assert finished == [running, slow]
+        assert elapsed < 5
+
+    @pytest.mark.unit
+    def test_identical_requests_share_one_run(self, tmp_path):
+        """Requests in flight join the run; later ones hit the cache."""
+
+        async def scenario():
+            runs = RunQueue(workers=2, cache_ttl=30, cwd=tmp_path)
+            reports = []
+
+            async def on_finish(chat_id, run):
+                reports.append((chat_id, run.id))
+
+            def request(chat_id, sleep_suite):
+                callback = functools.partial(on_finish, chat_id)
+                return runs.request(chat_id, sleep_suite, callback)
+
+            first, how_first = request(1, suite())
+            joined = [request(chat_id, suite()) for chat_id in (2, 2, 3)]
+            other, how_other = request(1, suite(0.2))
+            await runs.join()
+            cached, how_cached = request(4, suite())
+            await runs.close()
+            return first, how_first, joined, how_other, cached, how_cached, reports
+
+        first, how_first, joined, how_other, cached, how_cached, reports = asyncio.run(
+            scenario()
+        )
+
+        assert how_first == MISS
+        assert joined == [(first, JOINED)] * 3
+        assert how_other == MISS
+        # One report per waiting chat, the repeated request did not add one
+        assert sorted(chat_id for chat_id, run_id in reports if run_id == first.id) == [
+            1,
+            2,
+            3,
+        ]
+        assert (cached, how_cached) == (first, HIT)
+        assert cached.age > 0
+        assert len(reports) == 4
+
+    @pytest.mark.unit
+    def test_cancel_stops_run_only_when_nobody_waits(self, tmp_path):
+        """Cancelling detaches the chat; the last one stops the run."""
+
+        async def on_finish(run):
+            pass
+
+        async def scenario():
+            runs = RunQueue(workers=1, cwd=tmp_path)
+            run, _ = runs.request(1, suite(30), on_finish)
+            runs.request(2, suite(30), on_finish)
+            await asyncio.sleep(0.1)
+
+            left = runs.cancel(run.id, chat_id=1)
+            still = (left.status, runs.waiting(run, 1), runs.waiting(run, 2))
+            assert runs.cancel(run.id, chat_id=1) is None
+            runs.cancel(run.id, chat_id=2)
+            await runs.join()
+            await runs.close()
+            return run, still
+
+        run, still = asyncio.run(scenario())
+
+        assert still == (RUNNING, False, True)
+        assert run.status == CANCELLED
+
+    @pytest.mark.unit
+    def test_run_that_cannot_start_fails_and_worker_survives(self, tmp_path):
+        """An error starting pytest ends the run; later requests get new runs."""
+
+        async def scenario():
+            runs = RunQueue(workers=1, cwd=tmp_path / "missing")
+            finished = []
+
+            async def on_finish(run):
+                finished.append(run)
+
+            first, how = runs.request(1, suite(), on_finish)
+            await runs.join()
+            second, how_again = runs.request(2, suite(), on_finish)
+            await runs.join()
+            await runs.close()
+            return first, second, how_again, finished
+
+        first, second, how_again, finished = asyncio.run(scenario())
+
+        assert first.status == second.status == FAILED
+        assert "FileNotFoundError" in first.output
+        assert how_again == MISS and second is not first
+        assert finished == [first, second]
+
+    @pytest.mark.unit
+    def test_warm_workers_are_reused_and_recycled(self, tmp_path):
+        """Runs share an interpreter until max_runs; a killed one is replaced."""
+        (tmp_path / "test_pid.py").write_text(
+            "import os\n\n\ndef test_pid():\n    print('PID', os.getpid())\n"
+        )
+        (tmp_path / "test_hang.py").write_text(
+            "import time\n\n\ndef test_hang():\n    time.sleep(30)\n"
+        )
+        pid_suite = PidSuite("pid", "Pid Demo", "test_pid.py")
+        hang_suite = PidSuite("hang", "Hang Demo", "test_hang.py")
+
+        async def scenario():
+            runs = RunQueue(workers=1, timeout=3, warm=True, max_runs=2, cwd=tmp_path)
+            runs.start()
+            submitted = [runs.submit(1, pid_suite) for _ in range(3)]
+            submitted.append(runs.submit(1, hang_suite))
+            submitted.append(runs.submit(1, pid_suite))
+            await runs.join()
+            await runs.close()
+            return submitted
+
+        submitted = asyncio.run(scenario())
+
+        pids = [
+            pid for run in submitted for pid in re.findall(r"PID (\d+)", run.output)
+        ]
+        assert [run.status for run in submitted] == [DONE] * 3 + [TIMEOUT, DONE]
+        assert submitted[0].result["passed"] == 1
+        assert submitted[0].result["run_id"] == submitted[0].report_id
+        assert (submitted[0].report_dir / "junit.xml").exists()
+        assert submitted[3].result is None
+        # Two runs per interpreter, then a fresh one; the hang is killed
+        assert len(pids) == 4
+        assert pids[0] == pids[1] != pids[2]
+        assert pids[3] not in pids[:3]
+
+    @pytest.mark.unit
+    def test_warm_worker_hands_browser_to_tests(self, tmp_path):
+        """Tests see the worker's browser, or why it failed to launch."""
+        (tmp_path / "test_stash.py").write_text(
+            "from utils.pytest_worker import WARM_BROWSER\n\n\n"
+            "def test_stash(pytestconfig):\n"
+            "    assert pytestconfig.stash.get(WARM_BROWSER, None) is not None\n"
+        )
+        stash_suite = PidSuite("stash", "Stash Demo", "test_stash.py")
+
+        async def scenario():
+            runs = RunQueue(workers=1, warm=True, cwd=tmp_path)
+            run = runs.submit(1, stash_suite)
+            await runs.join()
+            await runs.close()
+            return run
+
+        run = asyncio.run(scenario())
+
+        assert run.exit_code == 0, run.output
+
+    @pytest.mark.unit
+    def test_progress_is_streamed_while_tests_run(self, tmp_path):
+        """Per-test results arrive before the run ends, at most once per interval."""
+        (tmp_path / "test_slow.py").write_text(
+            "import time\n\nimport pytest\n\n\n"
+            "@pytest.mark.parametrize('n', range(4))\n"
+            "def test_slow(n):\n    time.sleep(0.4)\n    assert n != 2\n"
+        )
+        slow_suite = PidSuite("slow", "Slow Demo", "test_slow.py")
+        seen = []
+
+        async def on_progress(run):
+            progress = run.progress
+            seen.append((time.monotonic(), progress.done, progress.failed))
+
+        async def scenario():
+            runs = RunQueue(
+                workers=1,
+                warm=True,
+                cwd=tmp_path,
+                on_progress=on_progress,
+                progress_interval=0.5,
+            )
+            runs.start()
+            run = runs.submit(1, slow_suite)
+            await runs.join()
+            await runs.close()
+            return run
+
+        run = asyncio.run(scenario())
+
+        assert run.status == DONE and run.result["failed"] == 1
+        first_result = next(at for at, done, _ in seen if done)
+        assert run.finished_at - first_result > 0.6
+        gaps = [b[0] - a[0] for a, b in zip(seen, seen[1:])]
+        assert all(gap > 0.4 for gap in gaps)
+        progress = run.progress
+        assert (progress.total, progress.done, progress.passed) == (4, 4, 3)
+        assert progress.failed == 1 and not progress.current
+
+    @pytest.mark.unit
+    def test_no_progress_after_report(self, tmp_path):
+        """A progress update still in flight is done or dropped before on_finish."""
+        (tmp_path / "test_fast.py").write_text(
+            "import pytest\n\n\n"
+            "@pytest.mark.parametrize('n', range(3))\n"
+            "def test_fast(n):\n    pass\n"
+        )
+        fast_suite = PidSuite("fast", "Fast Demo", "test_fast.py")
+        events = []
+
+        async def on_progress(run):
+            # A slow message edit
+            await asyncio.sleep(0.3)
+            events.append("progress")
+
+        async def on_finish(run):
+            events.append("finish")
+
+        async def scenario():
+            runs = RunQueue(
+                workers=1,
+                warm=True,
+                cwd=tmp_path,
+                on_progress=on_progress,
+                progress_interval=0,
+            )
+            runs.start()
+            runs.submit(1, fast_suite, on_finish)
+            await runs.join()
+            await asyncio.sleep(0.5)
+            await runs.close()
+
+        asyncio.run(scenario())
+
+        assert events[-1] == "finish" and events.count("finish") == 1
@@ -0,0 +1,87 @@
+"""
+Tests for the full-text job search index.
+"""
+
+from dataclasses import replace
+from datetime import date, timedelta
+
+import pytest
+from utils.job import Job
+from utils.search import JobSearchIndex, parse_query
+
+TODAY = date.today()
+
+JOBS = [
+    Job(
+        id="1",
+        title="Python Developer",
+        company="Яндекс",
+        tags=("Python", "Django"),
+        description="Backend services for search",
+        location="Москва",
+        posted=TODAY,
+    ),
+    Job(
+        id="2",
+        title="QA Automation Engineer",
+        company="Ozon",
+        tags=("Playwright",),
+        description="E2E tests in Python",
+        location="Удалённо",
+        posted=TODAY - timedelta(days=30),
+    ),
+    Job(
+        id="3",
+        title="Go Developer",
+        company="VK",
+        tags=("Go",),
+        location="Москва",
+        posted=TODAY - timedelta(days=2),
+    ),
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = JobSearchIndex(tmp_path / "jobs_search.db")
+    index.add_many((f"demo:{job.id}", "demo", job) for job in JOBS)
+    index.commit()
+    yield index
+    index.close()
+
+
+class TestSearch:
+    """Ranking, prefixes, filters and incremental updates."""
+
+    @pytest.mark.unit
+    def test_prefix_and_ranking(self, index):
+        """Prefixes match; a title/tag hit ranks above a description hit."""
+        hits, total, elapsed = index.query("pyth")
+
+        assert [hit.key for hit in hits] == ["demo:1", "demo:2"]
+        assert total == 2
+        assert elapsed < 0.1
+
+    @pytest.mark.unit
+    def test_filters(self, index):
+        """Column filters, Russian aliases and the days window combine."""
+        hits = index.query("developer город:москва")[0]
+        assert {h.key for h in hits} == {"demo:1", "demo:3"}
+        hits = index.query("developer location:Москва days:1")[0]
+        assert [h.key for h in hits] == ["demo:1"]
+        assert [h.key for h in index.query("компания:ozon")[0]] == ["demo:2"]
+        # Filter-only queries list the newest jobs first
+        assert [h.key for h in index.query("дней:7")[0]] == ["demo:1", "demo:3"]
+        with pytest.raises(ValueError):
+            parse_query("days:week")
+
+    @pytest.mark.unit
+    def test_incremental_update(self, index):
+        """Re-adding jobs keeps one entry per key and reindexes changes."""
+        changed = replace(JOBS[2], title="Rust Developer", tags=("Rust",))
+        index.add_many([("demo:3", "demo", changed), ("demo:1", "demo", JOBS[0])])
+        index.commit()
+
+        assert len(index) == 3
+        assert [h.key for h in index.query("rust")[0]] == ["demo:3"]
+        assert index.query("go")[1] == 0
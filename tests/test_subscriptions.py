@@ -0,0 +1,99 @@
+"""
+Tests for chat subscriptions and the inverted index.
+"""
+
+import random
+from dataclasses import replace
+
+import pytest
+from utils.subscriptions import (
+    Subscription,
+    SubscriptionIndex,
+    SubscriptionStore,
+    parse_rule,
+)
+from utils.job import Job
+
+JOB = Job(
+    id="job-1",
+    title="Python Developer",
+    company="Яндекс",
+    tags=("Python", "Django", "PostgreSQL"),
+    description="Backend services for search",
+    location="Москва, удалённо",
+)
+
+
+class TestSubscriptions:
+    """Rule parsing, matching and storage."""
+
+    @pytest.mark.unit
+    def test_parse_rule(self):
+        """Bare words are keywords, prefixes set facets, quotes keep spaces."""
+        rule = parse_rule(
+            42, 'Python backend tag:Django company:Яндекс location:"Нижний Новгород"'
+        )
+
+        assert rule.chat_id == "42"
+        assert rule.keywords == ("python", "backend")
+        assert rule.tags == ("django",)
+        assert rule.companies == ("яндекс",)
+        assert rule.locations == ("нижний новгород",)
+        assert parse_rule(42, rule.describe()) == rule
+        with pytest.raises(ValueError):
+            parse_rule(42, "salary:1000")
+
+    @pytest.mark.unit
+    def test_and_across_facets_or_within(self):
+        """Every set facet must match; any value of a facet is enough."""
+        index = SubscriptionIndex(
+            [
+                parse_rule("a", "golang python tag:Django"),
+                parse_rule("b", "python location:Казань"),
+                parse_rule("c", "company:Ozon company:Яндекс location:удалённо"),
+                parse_rule("d", ""),
+            ]
+        )
+
+        assert index.match(JOB) == {"a", "c", "d"}
+
+    @pytest.mark.unit
+    def test_index_agrees_with_direct_check(self):
+        """The index returns exactly the chats a full scan would."""
+        rng = random.Random(7)
+        words = ["python", "go", "qa", "data", "senior", "django", "москва"]
+        subscriptions = [
+            Subscription(
+                chat_id=str(i),
+                keywords=rng.sample(words, rng.randint(0, 2)),
+                tags=rng.sample(["python", "django", "go"], rng.randint(0, 1)),
+                locations=rng.sample(["москва", "казань"], rng.randint(0, 1)),
+            )
+            for i in range(300)
+        ]
+        jobs = [
+            replace(
+                JOB, title=" ".join(rng.sample(words, 2)), tags=(rng.choice(words),)
+            )
+            for _ in range(50)
+        ]
+
+        index = SubscriptionIndex(subscriptions)
+        for job in jobs:
+            assert index.match(job) == {
+                s.chat_id for s in subscriptions if s.matches(job)
+            }
+
+    @pytest.mark.unit
+    def test_store(self, tmp_path):
+        """Subscriptions persist per chat and only the owner can remove them."""
+        store = SubscriptionStore(tmp_path / "subscriptions.db")
+        first = store.add(parse_rule(1, "python"))
+        store.add(parse_rule(2, "tag:Go"))
+
+        assert [s.keywords for s in store.for_chat(1)] == [("python",)]
+        assert not store.remove(2, first)
+        assert store.remove(1, first)
+        assert len(store) == 1
+        assert store.build_index("main").match(JOB) == {"main"}
+        store.close()
@@ -0,0 +1,207 @@
+"""
+Storage backends for the cache of sent job postings.
+
+The cache maps job keys to the ISO timestamp when the job was found.
+Backends share one small interface, so the parser does not care where
+the data lives:
+- SQLiteCache (default) — indexed lookups, batch inserts and atomic commits;
+- JSONCache — the original jobs_cache.json file, written atomically;
+  job fingerprints live in a jobs_cache.fingerprints.json side file.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+
+
+class JobCache(ABC):
+    """Base interface for cache backends."""
+
+    @abstractmethod
+    def __contains__(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def add(self, key: str, found_at: str):
+        """Mark job as known."""
+        self.add_many([(key, found_at)])
+
+    @abstractmethod
+    def add_many(self, items: Iterable[Tuple[str, str]]):
+        """Mark several jobs as known in one batch."""
+
+    @abstractmethod
+    def evict(self, ttl_days: float = None, max_size: int = None) -> int:
+        """Drop entries older than ttl_days and the oldest beyond max_size.
+
+        Returns:
+            Number of evicted entries
+        """
+
+    @abstractmethod
+    def commit(self):
+        """Atomically persist pending changes."""
+
+    def close(self):
+        pass
+
+
+class SQLiteCache(JobCache):
+    """Cache stored in an SQLite database.
+
+    The connection may be handed between threads (the daemon crawls in the
+    event loop and writes in a worker), but is used by one at a time.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " key TEXT PRIMARY KEY,"
+            " found_at TEXT NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS jobs_found_at ON jobs (found_at)")
+        self.conn.commit()
+
+    def __contains__(self, key: str) -> bool:
+        row = self.conn.execute("SELECT 1 FROM jobs WHERE key = ?", (key,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def add_many(self, items: Iterable[Tuple[str, str]]):
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO jobs (key, found_at) VALUES (?, ?)", items
+        )
+
+    def evict(self, ttl_days: float = None, max_size: int = None) -> int:
+        evicted = 0
+        if ttl_days:
+            cutoff = (datetime.now() - timedelta(days=ttl_days)).isoformat()
+            evicted += self.conn.execute(
+                "DELETE FROM jobs WHERE found_at < ?", (cutoff,)
+            ).rowcount
+        if max_size:
+            evicted += self.conn.execute(
+                "DELETE FROM jobs WHERE key IN ("
+                " SELECT key FROM jobs ORDER BY found_at DESC LIMIT -1 OFFSET ?"
+                ")",
+                (max_size,),
+            ).rowcount
+        return evicted
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def migrate_json(self, json_path: Path) -> int:
+        """Import a legacy jobs_cache.json and rename it to *.migrated.
+
+        Returns:
+            Number of imported entries
+        """
+        json_path = Path(json_path)
+        if not json_path.exists():
+            return 0
+        with open(json_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.add_many(data.items())
+        self.commit()
+        json_path.rename(json_path.with_name(json_path.name + ".migrated"))
+        return len(data)
+
+
+class JSONCache(JobCache):
+    """Cache stored in a JSON file (original format).
+
+    Fingerprints of the cached jobs (see utils.fingerprint) are kept in
+    a side file, so the JSON file itself keeps its original format.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.fingerprints_path = self.path.with_suffix(".fingerprints.json")
+        self.data: Dict[str, str] = self._load(self.path)
+        self.fingerprints: Dict[str, int] = self._load(self.fingerprints_path)
+
+    @staticmethod
+    def _load(path: Path) -> dict:
+        if not path.exists():
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Cache read error: {e}", file=sys.stderr)
+            return {}
+
+    @staticmethod
+    def _dump(path: Path, data: dict):
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.data
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def add_many(self, items: Iterable[Tuple[str, str]]):
+        for key, found_at in items:
+            self.data.setdefault(key, found_at)
+
+    def evict(self, ttl_days: float = None, max_size: int = None) -> int:
+        before = len(self.data)
+        items = sorted(self.data.items(), key=lambda item: item[1], reverse=True)
+        if ttl_days:
+            cutoff = (datetime.now() - timedelta(days=ttl_days)).isoformat()
+            items = [item for item in items if item[1] >= cutoff]
+        if max_size:
+            items = items[:max_size]
+        self.data = dict(items)
+        self.fingerprints = {
+            key: fp for key, fp in self.fingerprints.items() if key in self.data
+        }
+        return before - len(self.data)
+
+    def commit(self):
+        # Fingerprints first: a crash in between leaves extra ones,
+        # which are dropped on the next eviction
+        self._dump(self.fingerprints_path, self.fingerprints)
+        self._dump(self.path, self.data)
+
+
+def open_cache(backend: str, directory: Path) -> JobCache:
+    """Open cache backend by name ("sqlite" or "json").
+
+    The SQLite backend imports an existing jobs_cache.json on first use.
+    """
+    directory = Path(directory)
+    json_path = directory / "jobs_cache.json"
+    if backend == "json":
+        return JSONCache(json_path)
+    if backend != "sqlite":
+        raise ValueError(f"Unknown cache backend: {backend}")
+
+    cache = SQLiteCache(directory / "jobs_cache.db")
+    migrated = cache.migrate_json(json_path)
+    if migrated:
+        print(f"📦 Migrated {migrated} job postings from {json_path.name}")
+    return cache
@@ -0,0 +1,87 @@
+"""
+Per-source validators used to skip runs when a job board has not changed.
+
+Two kinds of validators are kept for each source:
+- ETag / Last-Modified / body hash of the page fetched over plain HTTP
+  (used only when the previous run got its jobs from static HTML or JSON);
+- hash of the rendered card container (browser path).
+"""
+
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, Union
+
+# Runs in the browser: HTML of the card container (or of all cards)
+CONTAINER_HTML_JS = """
+(sel) => {
+    const container = sel.container && document.querySelector(sel.container);
+    if (container) return container.innerHTML;
+    return Array.from(document.querySelectorAll(sel.card), (el) => el.outerHTML).join("");
+}
+"""
+
+
+def content_hash(content: Union[str, bytes]) -> str:
+    """Stable hash of page content."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha1(content).hexdigest()
+
+
+def conditional_headers(state: Dict) -> Dict[str, str]:
+    """Request headers for a conditional GET based on saved validators."""
+    headers = {}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("last_modified"):
+        headers["If-Modified-Since"] = state["last_modified"]
+    return headers
+
+
+class SourceStateStore:
+    """Validators and skip counters for every source, kept in a JSON file.
+
+    Callers mutate the dicts returned by get() and call save() only after
+    the run's results are persisted, so a crashed run is never skipped.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.data = {"skipped_runs": 0, "sources": {}}
+        if self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.data.update(json.load(f))
+            except Exception as e:
+                print(f"⚠️ Source state read error: {e}", file=sys.stderr)
+
+    def get(self, name: str) -> Dict:
+        """Mutable state of a source."""
+        return self.data["sources"].setdefault(name, {"skipped": 0})
+
+    def record_skip(self, name: str):
+        """Count an unchanged source."""
+        self.get(name)["skipped"] = self.get(name).get("skipped", 0) + 1
+
+    def record_skipped_run(self) -> int:
+        """Count a run where no source changed, return the total."""
+        self.data["skipped_runs"] += 1
+        return self.data["skipped_runs"]
+
+    def save(self):
+        """Atomically write state to disk."""
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+def is_dom_unchanged(container_html: str, state: Dict) -> bool:
+    """Compare card container with the previous browser run, update state."""
+    dom_hash = content_hash(container_html)
+    unchanged = state.get("via") == "browser" and state.get("dom_hash") == dom_hash
+    state.update(via="browser", dom_hash=dom_hash)
+    return unchanged
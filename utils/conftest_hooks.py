@@ -2,24 +2,77 @@
 Custom pytest hooks for integration with our test reporter.
 """
 
+import json
+import os
 import pytest
+import socket
 import time
-from utils.reporter import TestReport
+from datetime import datetime
+from pathlib import Path
+from utils.reporter import TestReport, prune_reports
 
 
 # Global reporter instance
 _reporter = TestReport()
 
+# Connection streaming per-test progress to the bot (TEST_PROGRESS_ADDR)
+_progress = None
+
+
+def _send_progress(event: dict):
+    """Send one progress event as a JSON line; never fail the tests."""
+    global _progress
+    address = os.environ.get("TEST_PROGRESS_ADDR")
+    if not address:
+        return
+    try:
+        if _progress is None:
+            host, port = address.rsplit(":", 1)
+            _progress = socket.create_connection((host, int(port)), timeout=1)
+        event = {"run_id": _reporter.run_id, **event}
+        _progress.sendall((json.dumps(event) + "\n").encode("utf-8"))
+    except OSError:
+        _close_progress()
+
+
+def _close_progress():
+    global _progress
+    if _progress is not None:
+        _progress.close()
+        _progress = None
+
+
+def pytest_sessionstart(session):
+    """Start a fresh report (a warm bot worker runs many sessions).
+
+    The bot passes TEST_RUN_ID; other runs get a timestamped one.
+    """
+    global _reporter
+    run_id = os.environ.get("TEST_RUN_ID") or (
+        f"{datetime.now():%Y%m%d_%H%M%S}_{os.getpid()}"
+    )
+    _reporter = TestReport(run_id)
+
 
 @pytest.hookimpl(hookwrapper=True)
 def pytest_runtest_protocol(item, nextitem):
-    """Intercept each test execution to measure duration."""
+    """Intercept each test execution to measure duration and stream it."""
+    _send_progress(
+        {
+            "event": "start",
+            "test": item.nodeid,
+            "total": item.session.testscollected,
+        }
+    )
     start = time.time()
     yield
     duration = time.time() - start
 
-    # Determine test status
-    report = item.rep_call if hasattr(item, "rep_call") else None
+    # Determine test status (setup errors and skips have no call report)
+    report = getattr(item, "rep_call", None)
+    setup = getattr(item, "rep_setup", None)
+    if setup and not setup.passed:
+        report = setup
     if report and report.failed:
         status = "FAILED"
         error = str(report.longrepr)
@@ -33,6 +86,14 @@ def pytest_runtest_protocol(item, nextitem):
     _reporter.add_result(
         test_name=item.nodeid, status=status, duration=duration, error=error
     )
+    _send_progress(
+        {
+            "event": "result",
+            "test": item.nodeid,
+            "status": status,
+            "duration": round(duration, 3),
+        }
+    )
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -45,13 +106,17 @@ def pytest_runtest_makereport(item, call):
 
 def pytest_sessionfinish(session, exitstatus):
     """Print report after all tests have finished."""
+    _close_progress()
     _reporter.finish()
     print("\n\n" + "=" * 50)
     print(_reporter.get_summary())
     print("=" * 50 + "\n")
 
-    # Save report to file
-    with open("test_report.txt", "w", encoding="utf-8") as f:
-        f.write(_reporter.get_summary())
+    # JSON, JUnit XML and text in a directory of this run only
+    reports_dir = Path(os.environ.get("TEST_REPORTS_DIR", "reports"))
+    report_dir = _reporter.save(reports_dir / _reporter.run_id)
+
+    print(f"📄 Report saved: {report_dir}/")
 
-    print("📄 Report saved: test_report.txt")
+    # Keep the newest runs only (0 keeps all)
+    prune_reports(reports_dir, int(os.environ.get("TEST_REPORTS_KEEP", "50")))
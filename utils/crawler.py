@@ -0,0 +1,204 @@
+"""
+Concurrent multi-source crawler built on async Playwright.
+
+All sources share one browser (launched only if some source needs it).
+The number of open contexts is bounded, and so is the number of
+concurrent requests per host.
+"""
+
+import asyncio
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+from playwright.async_api import async_playwright, TimeoutError as PWTimeoutError
+
+from utils.change_detection import (
+    CONTAINER_HTML_JS,
+    SourceStateStore,
+    is_dom_unchanged,
+)
+from utils.http_source import fetch_jobs_http
+from utils.job import Job
+from utils.metrics import METRICS
+from utils.pagination import KnownRun, iter_jobs_async, known_checker
+from utils.resource_policy import ResourcePolicy, wait_for_cards_async
+from utils.sources import Source
+
+
+class Crawler:
+    """Crawls many sources concurrently with a shared browser."""
+
+    def __init__(
+        self,
+        max_contexts: int = 8,
+        per_host: int = 2,
+        mode: str = "auto",
+        max_pages: int = 10,
+        stop_after_known: int = 5,
+    ):
+        self.mode = mode
+        self.max_pages = max_pages
+        self.stop_after_known = stop_after_known
+        self._contexts = asyncio.Semaphore(max_contexts)
+        self._host_limits = defaultdict(lambda: asyncio.Semaphore(per_host))
+        self._browser_lock = asyncio.Lock()
+        self._playwright = None
+        self._browser = None
+
+    async def _get_browser(self):
+        async with self._browser_lock:
+            if self._browser is not None and not self._browser.is_connected():
+                # Crashed or killed: every source would fail until relaunched
+                print("⚠️ Browser disconnected, relaunching", file=sys.stderr)
+                self._browser = None
+            if self._browser is None:
+                with METRICS.phase("browser_launch"):
+                    if self._playwright is None:
+                        self._playwright = await async_playwright().start()
+                    self._browser = await self._playwright.chromium.launch(
+                        headless=True
+                    )
+            return self._browser
+
+    async def close(self):
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+
+    async def _fetch_http(self, source: Source, state: Dict) -> Optional[List[Job]]:
+        url = source.data_url or source.url
+        try:
+            with METRICS.phase("http_fetch", source=source.name):
+                jobs, _ = await asyncio.to_thread(
+                    fetch_jobs_http, url, source.selectors, state=state
+                )
+            return jobs
+        except Exception as e:
+            print(f"⚠️ [{source.name}] HTTP fetch error: {e}", file=sys.stderr)
+            return []
+
+    async def _fetch_browser(
+        self, source: Source, state: Dict, cache=None
+    ) -> Optional[List[Job]]:
+        browser = await self._get_browser()
+        async with self._contexts:
+            context = await browser.new_context()
+            try:
+                page = await context.new_page()
+                policy = ResourcePolicy.from_env()
+                await policy.install_async(page)
+
+                with METRICS.phase("goto", source=source.name):
+                    await page.goto(
+                        source.url, wait_until="domcontentloaded", timeout=30000
+                    )
+                try:
+                    with METRICS.phase("card_wait", source=source.name):
+                        await wait_for_cards_async(
+                            page, source.selectors["card"], timeout=15000
+                        )
+                except PWTimeoutError:
+                    print(
+                        f"❌ [{source.name}] Job postings did not load in time",
+                        file=sys.stderr,
+                    )
+                    return []
+                policy.mark_ready()
+
+                if state is not None:
+                    container_html = await page.evaluate(
+                        CONTAINER_HTML_JS, source.selectors
+                    )
+                    if is_dom_unchanged(container_html, state):
+                        return None
+
+                # Follow pages until the listing reaches already-sent jobs
+                known = KnownRun(known_checker(source, cache), self.stop_after_known)
+                with METRICS.phase("extraction", source=source.name):
+                    jobs = [
+                        job
+                        async for job in iter_jobs_async(
+                            page, source.selectors, self.max_pages, run=known
+                        )
+                    ]
+                jobs = known.listing(jobs)
+                print(f"🚦 [{source.name}] Requests: {policy.summary()}")
+                return jobs
+            finally:
+                await context.close()
+
+    async def crawl_one(
+        self, source: Source, state: Dict = None, cache=None
+    ) -> Optional[List[Job]]:
+        """Crawl a single source: HTTP fast path first, then the browser.
+
+        Returns None if the source is unchanged since the last run.
+        """
+        start = time.perf_counter()
+        async with self._host_limits[source.host]:
+            jobs = []
+            if self.mode != "browser":
+                jobs = await self._fetch_http(source, state)
+            if jobs == [] and self.mode != "http":
+                jobs = await self._fetch_browser(source, state, cache)
+
+        elapsed = time.perf_counter() - start
+        if jobs is None:
+            print(f"⏭ [{source.name}] Unchanged ({elapsed:.2f}s)")
+        else:
+            print(f"✅ [{source.name}] {len(jobs)} job postings in {elapsed:.2f}s")
+        return jobs
+
+    async def crawl(
+        self, sources: List[Source], states: SourceStateStore = None, cache=None
+    ) -> Dict[str, Optional[List[Job]]]:
+        """Crawl all sources concurrently.
+
+        With a cache, paginated listings are followed only until they reach
+        jobs that are already known.
+
+        Returns:
+            Source name -> jobs; failed sources map to an empty list,
+            unchanged ones to None
+        """
+        results = await asyncio.gather(
+            *(
+                self.crawl_one(s, states.get(s.name) if states else None, cache)
+                for s in sources
+            ),
+            return_exceptions=True,
+        )
+        jobs_by_source = {}
+        for source, result in zip(sources, results):
+            if isinstance(result, Exception):
+                print(f"❌ [{source.name}] Crawl error: {result}", file=sys.stderr)
+                result = []
+            jobs_by_source[source.name] = result
+        return jobs_by_source
+
+
+async def crawl_sources(
+    sources: List[Source],
+    states: SourceStateStore = None,
+    max_contexts: int = 8,
+    per_host: int = 2,
+    mode: str = "auto",
+    cache=None,
+    max_pages: int = 10,
+    stop_after_known: int = 5,
+) -> Dict[str, Optional[List[Job]]]:
+    """Crawl sources concurrently and close the shared browser afterwards."""
+    crawler = Crawler(
+        max_contexts=max_contexts,
+        per_host=per_host,
+        mode=mode,
+        max_pages=max_pages,
+        stop_after_known=stop_after_known,
+    )
+    try:
+        return await crawler.crawl(sources, states, cache)
+    finally:
+        await crawler.close()
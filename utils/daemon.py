@@ -0,0 +1,146 @@
+"""
+Long-running parser mode with a warm browser.
+
+Instead of cold-starting Playwright on every scheduled run, the daemon
+keeps one crawler (and its browser) alive between checks. The browser is
+recycled after a number of runs or when the memory of the process tree
+passes a threshold. SIGTERM / SIGINT stop the loop after the current
+check.
+"""
+
+import asyncio
+import os
+import random
+import signal
+import sys
+import time
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from utils.crawler import Crawler
+
+
+def process_tree_rss(pid: int = None) -> int:
+    """Resident memory of a process and all its descendants, in bytes.
+
+    Reads /proc, so the browser and Playwright driver processes are
+    included. Returns 0 where /proc is not available.
+    """
+    pid = pid or os.getpid()
+    proc = Path("/proc")
+    if not proc.exists():
+        return 0
+
+    children = {}
+    rss = {}
+    for entry in proc.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            status = (entry / "status").read_text()
+        except OSError:
+            continue
+        fields = dict(line.split(":", 1) for line in status.splitlines() if ":" in line)
+        child = int(entry.name)
+        children.setdefault(int(fields["PPid"]), []).append(child)
+        # Kernel threads have no VmRSS
+        rss[child] = int(fields.get("VmRSS", "0 kB").split()[0]) * 1024
+
+    total, stack = 0, [pid]
+    while stack:
+        current = stack.pop()
+        total += rss.get(current, 0)
+        stack.extend(children.get(current, ()))
+    return total
+
+
+class Daemon:
+    """Runs checks on an interval with jitter, reusing one crawler."""
+
+    def __init__(
+        self,
+        check: Callable[[Crawler], Awaitable[None]],
+        crawler_factory: Callable[[], Crawler],
+        interval: float = 300,
+        jitter: float = 30,
+        recycle_runs: int = 50,
+        recycle_rss_mb: float = 1024,
+        rss: Callable[[], int] = process_tree_rss,
+    ):
+        self.check = check
+        self.crawler_factory = crawler_factory
+        self.interval = interval
+        self.jitter = jitter
+        self.recycle_runs = recycle_runs
+        self.recycle_rss_mb = recycle_rss_mb
+        self.rss = rss
+        self.runs = 0
+        self._stop = asyncio.Event()
+
+    def stop(self):
+        """Finish the current check and exit the loop."""
+        self._stop.set()
+
+    def next_delay(self) -> float:
+        """Interval plus random jitter, so checks do not hit sites in lockstep."""
+        return max(0.0, self.interval + random.uniform(-self.jitter, self.jitter))
+
+    def should_recycle(self, runs: int) -> bool:
+        """Recycle the browser after recycle_runs checks or above the RSS limit."""
+        if self.recycle_runs and runs >= self.recycle_runs:
+            print(f"♻️ Recycling browser after {runs} runs")
+            return True
+        rss_mb = self.rss() / 2**20
+        if self.recycle_rss_mb and rss_mb > self.recycle_rss_mb:
+            print(f"♻️ Recycling browser at {rss_mb:.0f} MB RSS")
+            return True
+        return False
+
+    def _install_signal_handlers(self):
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError):
+                # Windows or not the main thread
+                pass
+
+    async def _close(self, crawler: Crawler):
+        try:
+            await crawler.close()
+        except Exception as e:
+            print(f"⚠️ Browser close error: {e}", file=sys.stderr)
+
+    async def run(self):
+        """Loop until stop() or a termination signal."""
+        self._install_signal_handlers()
+        crawler, crawler_runs = None, 0
+        try:
+            while not self._stop.is_set():
+                if crawler is None:
+                    crawler, crawler_runs = self.crawler_factory(), 0
+
+                start = time.perf_counter()
+                failed = False
+                try:
+                    await self.check(crawler)
+                except Exception as e:
+                    print(f"❌ Check failed: {e}", file=sys.stderr)
+                    failed = True
+                self.runs += 1
+                crawler_runs += 1
+                print(f"⏱ Check took {time.perf_counter() - start:.2f}s")
+
+                # A failed check may leave the browser broken, start fresh
+                if failed or self.should_recycle(crawler_runs):
+                    await self._close(crawler)
+                    crawler = None
+
+                try:
+                    await asyncio.wait_for(self._stop.wait(), self.next_delay())
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if crawler is not None:
+                await self._close(crawler)
+            print(f"👋 Daemon stopped after {self.runs} runs")
@@ -0,0 +1,282 @@
+"""
+Telegram delivery for the parser: digest batching and rate-aware sending.
+
+New jobs are packed into digest messages up to Telegram's 4096-character
+limit, optionally grouped by company, tag or source. Messages are sent
+through a token bucket, and HTTP 429 responses are retried after the
+``retry_after`` Telegram asks for.
+"""
+
+import html
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from utils.job import Job
+from utils.metrics import METRICS
+
+TELEGRAM_MESSAGE_LIMIT = 4096
+TELEGRAM_API_URL = "https://api.telegram.org"
+# Characters of one job field shown in a message
+FIELD_LIMIT = 500
+
+
+def shorten(text: str, limit: int = FIELD_LIMIT) -> str:
+    """Cut plain text to limit characters (escape it afterwards)."""
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def format_job(job: Job, source_name: str = None, repost: bool = False) -> str:
+    """Format a job posting for Telegram (HTML parse mode)."""
+    text = (
+        f"💼 <b>{html.escape(shorten(job.title))}</b>\n"
+        f"🏢 {html.escape(shorten(job.company))}\n"
+        f"📍 {html.escape(shorten(job.location))}\n"
+        f"🛠 {html.escape(shorten(job.tags_text))}\n"
+    )
+    if source_name:
+        text += f"🌐 {html.escape(shorten(source_name))}\n"
+    if repost:
+        text += "🔁 Повторная публикация\n"
+    return text
+
+
+@dataclass
+class DigestEntry:
+    """A formatted job with the key it is grouped by."""
+
+    text: str
+    group: str = ""
+    payload: object = None
+
+
+@dataclass
+class Digest:
+    """One Telegram message with the entries it carries."""
+
+    text: str
+    entries: List[DigestEntry] = field(default_factory=list)
+
+
+def group_key(job: Job, group_by: Optional[str], source_name: str = "") -> str:
+    """Group of a job: company, first tag, source or none."""
+    if group_by == "company":
+        return job.company
+    if group_by == "tag":
+        return job.tags[0] if job.tags else ""
+    if group_by == "source":
+        return source_name
+    return ""
+
+
+def fit_html(text: str, limit: int) -> str:
+    """Plain-text version of formatted text, truncated to fit limit.
+
+    Cutting the HTML itself could split a tag or an entity, and Telegram
+    rejects such a message on every attempt.
+    """
+    plain = html.unescape(re.sub(r"<[^>]*>", "", text)).rstrip("\n")
+    size = limit - 2
+    while len(html.escape(plain[:size])) > limit - 2:
+        size -= len(html.escape(plain[:size])) - (limit - 2)
+    return html.escape(plain[:size]) + "…\n"
+
+
+def build_digests(
+    entries: List[DigestEntry], limit: int = TELEGRAM_MESSAGE_LIMIT
+) -> List[Digest]:
+    """Pack entries into as few messages as possible.
+
+    Entries are ordered by group; each message repeats the header of the
+    group it continues. An entry that does not fit into an empty message
+    is sent as truncated plain text.
+    """
+    entries = sorted(entries, key=lambda e: e.group)
+    digests: List[Digest] = []
+    text, current, group = "", [], None
+
+    def flush():
+        if current:
+            digests.append(Digest(text=text.rstrip("\n"), entries=list(current)))
+
+    for entry in entries:
+        header = (
+            f"📂 <b>{html.escape(shorten(entry.group))}</b>\n\n" if entry.group else ""
+        )
+        chunk = entry.text + "\n"
+        if entry.group != group:
+            chunk = header + chunk
+
+        if len(text) + len(chunk) > limit and current:
+            flush()
+            text, current = "", []
+            chunk = header + entry.text + "\n"
+        if len(chunk) > limit:
+            chunk = fit_html(chunk, limit)
+
+        text += chunk
+        current.append(entry)
+        group = entry.group
+
+    flush()
+    return digests
+
+
+class TokenBucket:
+    """Token bucket rate limiter (thread-safe)."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available and take it."""
+        while True:
+            with self._lock:
+                now = self.clock()
+                self.tokens = min(
+                    self.capacity, self.tokens + (now - self.updated) * self.rate
+                )
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+class TelegramSender:
+    """Sends messages via the Bot API with rate limiting and retries.
+
+    A global token bucket caps overall throughput and a bucket per chat
+    keeps each chat within Telegram's per-chat limit. Safe to use from
+    several threads.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        chat_id: str,
+        api_url: str = TELEGRAM_API_URL,
+        rate: float = 25.0,
+        burst: float = 1,
+        chat_rate: float = 1.0,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        session: requests.Session = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.token = token
+        self.chat_id = chat_id
+        self.api_url = api_url.rstrip("/")
+        self.bucket = TokenBucket(rate, burst, sleep=sleep)
+        self.chat_rate = chat_rate
+        self._chat_buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.session = session or requests.Session()
+        self.sleep = sleep
+        self.sent = 0
+        self.retries = 0
+        self.failed = 0
+
+    @classmethod
+    def from_env(cls) -> "TelegramSender":
+        """Sender configured from TELEGRAM_* environment variables."""
+        return cls(
+            token=os.environ.get("TELEGRAM_BOT_TOKEN"),
+            chat_id=os.environ.get("TELEGRAM_CHAT_ID"),
+            api_url=os.environ.get("TELEGRAM_API_URL", TELEGRAM_API_URL),
+            rate=float(os.environ.get("TELEGRAM_RATE_PER_SEC", "25")),
+            burst=float(os.environ.get("TELEGRAM_BURST", "1")),
+            chat_rate=float(os.environ.get("TELEGRAM_CHAT_RATE_PER_SEC", "1")),
+        )
+
+    def _chat_bucket(self, chat_id: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._chat_buckets.get(chat_id)
+            if bucket is None:
+                bucket = TokenBucket(self.chat_rate, 1, sleep=self.sleep)
+                self._chat_buckets[chat_id] = bucket
+            return bucket
+
+    def _count(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+        METRICS.inc(f"telegram_{name}_total")
+
+    def send(self, text: str, chat_id: str = None) -> bool:
+        """Send a message, honouring 429 retry_after and backing off on errors.
+
+        Args:
+            text: Message text (HTML parse mode)
+            chat_id: Target chat, defaults to the sender's chat
+        """
+        chat_id = chat_id or self.chat_id
+        if not self.token or not chat_id:
+            print("❌ TELEGRAM_BOT_TOKEN or TELEGRAM_CHAT_ID not set", file=sys.stderr)
+            self._count("failed")
+            return False
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                self._count("retries")
+            self._chat_bucket(chat_id).acquire()
+            self.bucket.acquire()
+            try:
+                with METRICS.phase("telegram_send"):
+                    resp = self.session.post(
+                        f"{self.api_url}/bot{self.token}/sendMessage",
+                        json={
+                            "chat_id": chat_id,
+                            "text": text,
+                            "parse_mode": "HTML",
+                            "disable_web_page_preview": False,
+                        },
+                        timeout=10,
+                    )
+            except Exception as e:
+                print(f"❌ Send error: {e}", file=sys.stderr)
+                self.sleep(self.backoff * 2**attempt)
+                continue
+
+            if resp.status_code == 200:
+                self._count("sent")
+                return True
+            if resp.status_code == 429:
+                try:
+                    retry_after = resp.json()["parameters"]["retry_after"]
+                except Exception:
+                    retry_after = self.backoff * 2**attempt
+                print(f"⏳ Rate limited, retry after {retry_after}s", file=sys.stderr)
+                self.sleep(retry_after)
+                continue
+            if resp.status_code >= 500:
+                print(f"❌ Telegram API error: {resp.text}", file=sys.stderr)
+                self.sleep(self.backoff * 2**attempt)
+                continue
+
+            # Other 4xx will not succeed on retry
+            print(f"❌ Telegram API error: {resp.text}", file=sys.stderr)
+            break
+
+        self._count("failed")
+        return False
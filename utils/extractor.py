@@ -0,0 +1,97 @@
+"""
+Batched job card extraction for the parser.
+
+All card fields are pulled in a single ``page.evaluate`` call instead of
+querying every card element separately over the Playwright connection.
+"""
+
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from utils.job import Job
+
+# Exact selectors for the demo site
+JOB_SELECTORS = {
+    "card": ".job-card",
+    "title": ".job-title",
+    "company": ".job-company",
+    "tags": ".job-tags",
+    "description": ".job-description",
+    "location": ".job-location",
+    "posted": ".job-date",
+    # Used only for change detection
+    "container": "#jobs-container",
+    # "Next page" control; without one the listing is scrolled instead
+    "next": "a[rel=next], .pagination .next",
+}
+
+# Per-card fields, in output order
+FIELD_NAMES = ("title", "company", "tags", "description", "location", "posted")
+
+# Runs in the browser: returns raw text (or null) for every field of every card.
+# Tags rendered as separate child elements are joined with commas.
+EXTRACT_JOBS_JS = """
+(sel) => Array.from(document.querySelectorAll(sel.card), (card) => {
+    const text = (s) => {
+        const el = card.querySelector(s);
+        return el ? el.textContent : null;
+    };
+    const tags = (s) => {
+        const el = card.querySelector(s);
+        if (!el) return null;
+        if (!el.children.length) return el.textContent;
+        return Array.from(el.children, (child) => child.textContent).join(",");
+    };
+    return {
+        id: card.getAttribute("data-id"),
+        title: text(sel.title),
+        company: text(sel.company),
+        tags: tags(sel.tags),
+        description: text(sel.description),
+        location: text(sel.location),
+        posted: text(sel.posted),
+    };
+})
+"""
+
+
+def build_job(raw: Dict[str, Optional[str]], found_at: datetime = None) -> Job:
+    """Turn raw card fields into a Job.
+
+    Args:
+        raw: Field name -> text content (None if the element is missing)
+        found_at: Time the job was found, defaults to now
+
+    Returns:
+        Job with normalized tags and publication date
+    """
+    return Job.from_raw(raw, found_at)
+
+
+def extract_jobs(page, selectors: Dict[str, str] = None) -> Tuple[List[Job], float]:
+    """Extract all job cards from the page in one round trip.
+
+    Args:
+        page: Playwright page with job cards rendered
+        selectors: Card/field selectors, defaults to JOB_SELECTORS
+
+    Returns:
+        (jobs, elapsed) — list of jobs and extraction time in seconds
+    """
+    start = time.perf_counter()
+    raw_cards = page.evaluate(EXTRACT_JOBS_JS, selectors or JOB_SELECTORS)
+    found_at = datetime.now()
+    jobs = [build_job(raw, found_at) for raw in raw_cards]
+    return jobs, time.perf_counter() - start
+
+
+async def extract_jobs_async(
+    page, selectors: Dict[str, str] = None
+) -> Tuple[List[Job], float]:
+    """Async variant of extract_jobs for the multi-source crawler."""
+    start = time.perf_counter()
+    raw_cards = await page.evaluate(EXTRACT_JOBS_JS, selectors or JOB_SELECTORS)
+    found_at = datetime.now()
+    jobs = [build_job(raw, found_at) for raw in raw_cards]
+    return jobs, time.perf_counter() - start
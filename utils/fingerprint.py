@@ -0,0 +1,328 @@
+"""
+Content fingerprints for near-duplicate (repost) detection.
+
+Each job gets a 64-bit SimHash over its title, company, tags and
+description. Near duplicates are looked up through an LSH index: the
+fingerprint is split into max_distance + 1 bands, so by the pigeonhole
+principle any fingerprint within max_distance bits shares at least one
+band exactly. Only jobs in matching bands are compared.
+"""
+
+import hashlib
+import re
+import sqlite3
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils.job import Job
+
+FP_BITS = 64
+
+# Feature weights per job field
+FIELD_WEIGHTS = {"title": 3, "company": 3, "tags": 2, "description": 1}
+
+
+def _tokens(text: str) -> List[str]:
+    return re.findall(r"\w+", text.lower())
+
+
+def _feature_hash(feature: str) -> int:
+    digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def simhash(features: Iterable[Tuple[str, int]]) -> int:
+    """SimHash of weighted features."""
+    vector = [0] * FP_BITS
+    for feature, weight in features:
+        h = _feature_hash(feature)
+        for bit in range(FP_BITS):
+            vector[bit] += weight if h >> bit & 1 else -weight
+    return sum(1 << bit for bit, value in enumerate(vector) if value > 0)
+
+
+def job_fingerprint(job: Job) -> int:
+    """SimHash over title, company, tags and description of a job."""
+    features = []
+    for field, weight in FIELD_WEIGHTS.items():
+        value = job.tags_text if field == "tags" else getattr(job, field)
+        tokens = _tokens(value)
+        if field == "description":
+            # Word bigrams keep some order information for long texts
+            tokens = [" ".join(pair) for pair in zip(tokens, tokens[1:])] or tokens
+        features.extend((f"{field}:{token}", weight) for token in tokens)
+    return simhash(features)
+
+
+def hamming(a: int, b: int) -> int:
+    """Number of differing bits."""
+    return bin(a ^ b).count("1")
+
+
+def _bands(max_distance: int) -> List[Tuple[int, int]]:
+    """(shift, width) of every band."""
+    count = max_distance + 1
+    bands, shift = [], 0
+    for i in range(count):
+        width = FP_BITS // count + (1 if i < FP_BITS % count else 0)
+        bands.append((shift, width))
+        shift += width
+    return bands
+
+
+class SimHashIndex:
+    """In-memory LSH index of job fingerprints."""
+
+    def __init__(self, max_distance: int = 3):
+        self.max_distance = max_distance
+        self.bands = _bands(max_distance)
+        self._fingerprints: Dict[str, int] = {}
+        self._buckets: Dict[Tuple[int, int], List[str]] = {}
+
+    def band_keys(self, fp: int) -> List[Tuple[int, int]]:
+        return [
+            (i, fp >> shift & ((1 << width) - 1))
+            for i, (shift, width) in enumerate(self.bands)
+        ]
+
+    def get(self, key: str) -> Optional[int]:
+        """Stored fingerprint of a job."""
+        return self._fingerprints.get(key)
+
+    def add(self, key: str, fp: int):
+        if key in self._fingerprints:
+            return
+        self._fingerprints[key] = fp
+        for band_key in self.band_keys(fp):
+            self._buckets.setdefault(band_key, []).append(key)
+
+    def _candidates(self, fp: int) -> Iterable[Tuple[str, int]]:
+        keys = set()
+        for band_key in self.band_keys(fp):
+            keys.update(self._buckets.get(band_key, ()))
+        return ((key, self._fingerprints[key]) for key in keys)
+
+    def nearest(self, fp: int, exclude: str = None) -> Optional[Tuple[str, int]]:
+        """Closest stored job within max_distance.
+
+        Returns:
+            (key, distance) or None
+        """
+        best = None
+        for key, other in self._candidates(fp):
+            if key == exclude:
+                continue
+            distance = hamming(fp, other)
+            if distance <= self.max_distance and (best is None or distance < best[1]):
+                best = (key, distance)
+        return best
+
+
+def _to_signed(fp: int) -> int:
+    return fp - (1 << FP_BITS) if fp >= 1 << (FP_BITS - 1) else fp
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << FP_BITS) if value < 0 else value
+
+
+class SQLiteSimHashIndex(SimHashIndex):
+    """LSH index stored next to the job cache in SQLite.
+
+    Band rows are tagged with the band count, so changing max_distance
+    rebuilds them once from the stored fingerprints.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, max_distance: int = 3):
+        super().__init__(max_distance)
+        self.conn = conn
+        self.scheme = len(self.bands)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints ("
+            " key TEXT PRIMARY KEY,"
+            " fp INTEGER NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprint_bands ("
+            " scheme INTEGER NOT NULL,"
+            " band INTEGER NOT NULL,"
+            " value INTEGER NOT NULL,"
+            " key TEXT NOT NULL"
+            ")"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS fingerprint_bands_lookup"
+            " ON fingerprint_bands (scheme, band, value)"
+        )
+        self._rebuild_bands()
+
+    def _rebuild_bands(self):
+        has_scheme = self.conn.execute(
+            "SELECT 1 FROM fingerprint_bands WHERE scheme = ? LIMIT 1", (self.scheme,)
+        ).fetchone()
+        has_fingerprints = self.conn.execute(
+            "SELECT 1 FROM fingerprints LIMIT 1"
+        ).fetchone()
+        if has_scheme or not has_fingerprints:
+            return
+        self.conn.execute("DELETE FROM fingerprint_bands")
+        rows = self.conn.execute("SELECT key, fp FROM fingerprints")
+        self.conn.executemany(
+            "INSERT INTO fingerprint_bands (scheme, band, value, key)"
+            " VALUES (?, ?, ?, ?)",
+            (
+                (self.scheme, band, value, key)
+                for key, fp in rows.fetchall()
+                for band, value in self.band_keys(_to_unsigned(fp))
+            ),
+        )
+
+    def get(self, key: str) -> Optional[int]:
+        row = self.conn.execute(
+            "SELECT fp FROM fingerprints WHERE key = ?", (key,)
+        ).fetchone()
+        return _to_unsigned(row[0]) if row else None
+
+    def add(self, key: str, fp: int):
+        inserted = self.conn.execute(
+            "INSERT OR IGNORE INTO fingerprints (key, fp) VALUES (?, ?)",
+            (key, _to_signed(fp)),
+        ).rowcount
+        if inserted:
+            self.conn.executemany(
+                "INSERT INTO fingerprint_bands (scheme, band, value, key)"
+                " VALUES (?, ?, ?, ?)",
+                ((self.scheme, band, value, key) for band, value in self.band_keys(fp)),
+            )
+
+    def prune(self, table: str = "jobs"):
+        """Drop fingerprints of jobs no longer present in the cache table."""
+        self.conn.execute(
+            f"DELETE FROM fingerprints WHERE key NOT IN (SELECT key FROM {table})"
+        )
+        self.conn.execute(
+            "DELETE FROM fingerprint_bands WHERE key NOT IN"
+            " (SELECT key FROM fingerprints)"
+        )
+
+    def _candidates(self, fp: int) -> Iterable[Tuple[str, int]]:
+        clauses = " OR ".join(["(b.band = ? AND b.value = ?)"] * len(self.bands))
+        params = [self.scheme]
+        for band, value in self.band_keys(fp):
+            params.extend((band, value))
+        rows = self.conn.execute(
+            "SELECT DISTINCT f.key, f.fp FROM fingerprint_bands b"
+            " JOIN fingerprints f ON f.key = b.key"
+            f" WHERE b.scheme = ? AND ({clauses})",
+            params,
+        )
+        return ((key, _to_unsigned(value)) for key, value in rows)
+
+
+class JSONSimHashIndex(SimHashIndex):
+    """LSH index over the fingerprints kept by the JSON cache.
+
+    Buckets are rebuilt in memory on open; new fingerprints are written
+    back to the cache and saved with its commit.
+    """
+
+    def __init__(self, cache, max_distance: int = 3):
+        super().__init__(max_distance)
+        self.cache = cache
+        for key, fp in cache.fingerprints.items():
+            super().add(key, fp)
+
+    def add(self, key: str, fp: int):
+        super().add(key, fp)
+        self.cache.fingerprints.setdefault(key, fp)
+
+    def prune(self):
+        """Drop fingerprints of jobs no longer present in the cache."""
+        self.cache.fingerprints = {
+            key: fp for key, fp in self.cache.fingerprints.items() if key in self.cache
+        }
+        self._fingerprints, self._buckets = {}, {}
+        for key, fp in self.cache.fingerprints.items():
+            SimHashIndex.add(self, key, fp)
+
+
+@dataclass
+class DedupStats:
+    """Per-run deduplication counters."""
+
+    known: int = 0
+    new: int = 0
+    near_duplicates: int = 0
+    collisions: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"{self.new} new, {self.known} known, "
+            f"{self.near_duplicates} near-duplicates, {self.collisions} ID collisions"
+        )
+
+
+class Deduplicator:
+    """Classifies scraped jobs against the cache and the fingerprint index.
+
+    Statuses returned by classify():
+    - "known" — already sent (same key and similar content);
+    - "new" — not seen before;
+    - "duplicate" — new key, but content matches a known job (repost).
+
+    Jobs without data-id use their title as ID; if such a key is cached
+    but the content differs, the job gets a content-qualified key instead
+    of being dropped as a collision.
+    """
+
+    def __init__(self, cache, index: SimHashIndex):
+        self.cache = cache
+        self.index = index
+        self.stats = DedupStats()
+
+    def classify(self, key: str, job: Job) -> Tuple[str, str, Optional[str]]:
+        """Classify a job.
+
+        Returns:
+            (status, key, matched key) — key may be rewritten for title
+            collisions, matched key is set for duplicates
+        """
+        fp = job_fingerprint(job)
+
+        if key in self.cache:
+            stored = self.index.get(key)
+            title_id = job.id == job.title
+            if (
+                stored is None
+                or not title_id
+                or hamming(fp, stored) <= self.index.max_distance
+            ):
+                self.index.add(key, fp)
+                self.stats.known += 1
+                return "known", key, None
+            # Same title, different job
+            self.stats.collisions += 1
+            key = f"{key}#{fp:016x}"
+            if key in self.cache:
+                self.stats.known += 1
+                return "known", key, None
+
+        match = self.index.nearest(fp, exclude=key)
+        self.index.add(key, fp)
+        if match:
+            self.stats.near_duplicates += 1
+            return "duplicate", key, match[0]
+
+        self.stats.new += 1
+        return "new", key, None
+
+
+def open_fingerprint_index(cache, max_distance: int = 3) -> SimHashIndex:
+    """Index persisted by the cache backend, in-memory one if it has no storage."""
+    conn = getattr(cache, "conn", None)
+    if isinstance(conn, sqlite3.Connection):
+        return SQLiteSimHashIndex(conn, max_distance)
+    if isinstance(getattr(cache, "fingerprints", None), dict):
+        return JSONSimHashIndex(cache, max_distance)
+    return SimHashIndex(max_distance)
@@ -0,0 +1,373 @@
+"""
+Append-only columnar history of every observed job.
+
+Each run appends one row per job per day it was seen (a "sighting") to
+per-column array files under ``history/``. Strings are dictionary-encoded
+in append-only text files, so columns hold only fixed-width integers:
+
+    day.col       date ordinal                 time.col      observed at (unix s)
+    job.col       job key id                   source.col    source name id
+    company.col   company id                   location.col  location id
+    tag_row.col / tag.col — one row per (sighting, tag)
+
+A job seen on several checks of a day keeps its first sighting, so a
+year of hourly checks stays at one row per job per day. Aggregates work
+on whole column slices (Counter/set/dict over arrays), and the per-day
+rollups read by the bot's /stats are precomputed into ``rollups.json``.
+
+Columns are stored in native byte order; copy the directory only between
+machines of the same architecture.
+"""
+
+import json
+import os
+import statistics
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils.job import Job
+
+SIGHTING_COLUMNS = {
+    "day": "I",
+    "time": "q",
+    "job": "I",
+    "source": "I",
+    "company": "I",
+    "location": "I",
+}
+TAG_COLUMNS = {"tag_row": "I", "tag": "I"}
+DICTIONARIES = ("job", "source", "company", "location", "tag")
+# Facet -> (dictionary, rollup field)
+FACETS = {"tag": "tags", "company": "companies", "location": "locations"}
+ROLLUPS_FILE = "rollups.json"
+
+
+class _Dictionary:
+    """Append-only string <-> id mapping stored one value per line."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.values: List[str] = []
+        if path.exists():
+            text = path.read_text(encoding="utf-8")
+            if text and not text.endswith("\n"):
+                # Torn write of the last value: drop it
+                text = text[: text.rfind("\n") + 1]
+                path.write_text(text, encoding="utf-8")
+            self.values = text.splitlines()
+        self.ids = {value: i for i, value in enumerate(self.values)}
+        self._written = len(self.values)
+
+    def id(self, value: str) -> int:
+        value = value.replace("\n", " ")
+        i = self.ids.get(value)
+        if i is None:
+            i = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return i
+
+    def flush(self):
+        if len(self.values) > self._written:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(v + "\n" for v in self.values[self._written :]))
+            self._written = len(self.values)
+
+
+def _load_columns(directory: Path, typecodes: Dict[str, str]) -> Dict[str, array]:
+    """Read columns, cutting them to a common length after a torn append."""
+    columns = {}
+    for name, typecode in typecodes.items():
+        column = array(typecode)
+        path = directory / f"{name}.col"
+        if path.exists():
+            data = path.read_bytes()
+            column.frombytes(data[: len(data) - len(data) % column.itemsize])
+        columns[name] = column
+    rows = min(len(column) for column in columns.values())
+    for name, column in columns.items():
+        if len(column) > rows:
+            del column[rows:]
+            (directory / f"{name}.col").write_bytes(column.tobytes())
+    return columns
+
+
+class HistoryStore:
+    """Columnar sightings of jobs with per-day rollups."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dictionaries = {
+            name: _Dictionary(self.directory / f"{name}.txt") for name in DICTIONARIES
+        }
+        self.columns = _load_columns(self.directory, SIGHTING_COLUMNS)
+        tags = _load_columns(self.directory, TAG_COLUMNS)
+        # Tags of sightings lost in a torn append
+        rows = bisect_left(tags["tag_row"], len(self))
+        for column in tags.values():
+            del column[rows:]
+        self.columns.update(tags)
+        self._written = {name: len(column) for name, column in self.columns.items()}
+        # Earliest day touched since the last rollup refresh
+        self._dirty_from: Optional[int] = None
+        self._seen_day: Optional[int] = None
+        self._seen_jobs: set = set()
+
+    def __len__(self) -> int:
+        return len(self.columns["day"])
+
+    def _seen_on(self, day: int) -> set:
+        """Job ids already sighted on a day (the last one only)."""
+        if self._seen_day != day:
+            days = self.columns["day"]
+            lo = bisect_left(days, day)
+            self._seen_jobs = set(self.columns["job"][lo:])
+            self._seen_day = day
+        return self._seen_jobs
+
+    def _add(self, day: int, timestamp: int, values: Dict[str, int], tags):
+        if len(self) and day < self.columns["day"][-1]:
+            raise ValueError("History is append-only: observation is in the past")
+        seen = self._seen_on(day)
+        if values["job"] in seen:
+            return False
+        seen.add(values["job"])
+        row = len(self)
+        self.columns["day"].append(day)
+        self.columns["time"].append(timestamp)
+        for name, value in values.items():
+            self.columns[name].append(value)
+        for tag in tags:
+            self.columns["tag_row"].append(row)
+            self.columns["tag"].append(tag)
+        if self._dirty_from is None:
+            self._dirty_from = day
+        return True
+
+    def append(
+        self, items: Iterable[Tuple[str, str, Job]], observed_at: datetime = None
+    ) -> int:
+        """Record (key, source name, job) sightings (not committed).
+
+        Returns:
+            Number of new rows (jobs not yet seen that day)
+        """
+        observed_at = observed_at or datetime.now()
+        day, timestamp = observed_at.date().toordinal(), int(observed_at.timestamp())
+        ids = self.dictionaries
+        added = 0
+        for key, source, job in items:
+            values = {
+                "job": ids["job"].id(key),
+                "source": ids["source"].id(source),
+                "company": ids["company"].id(job.company),
+                "location": ids["location"].id(job.location),
+            }
+            tags = [ids["tag"].id(tag) for tag in job.tags]
+            added += self._add(day, timestamp, values, tags)
+        return added
+
+    def carry_over(self, source: str, observed_at: datetime = None) -> int:
+        """Re-sight a source's jobs from its last observed day.
+
+        For sources skipped as unchanged, whose jobs are still listed.
+
+        Returns:
+            Number of new rows
+        """
+        source_id = self.dictionaries["source"].ids.get(source)
+        if source_id is None:
+            return 0
+        days, sources = self.columns["day"], self.columns["source"]
+        last = next(
+            (i for i in range(len(self) - 1, -1, -1) if sources[i] == source_id),
+            None,
+        )
+        if last is None:
+            return 0
+        observed_at = observed_at or datetime.now()
+        day, timestamp = observed_at.date().toordinal(), int(observed_at.timestamp())
+        tag_rows, tags = self.columns["tag_row"], self.columns["tag"]
+        added = 0
+        for row in range(bisect_left(days, days[last]), last + 1):
+            if sources[row] != source_id:
+                continue
+            values = {
+                name: self.columns[name][row]
+                for name in ("job", "source", "company", "location")
+            }
+            row_tags = tags[bisect_left(tag_rows, row) : bisect_right(tag_rows, row)]
+            added += self._add(day, timestamp, values, row_tags)
+        return added
+
+    def commit(self):
+        """Append new values and rows to the files.
+
+        Dictionaries go first and tags last, so a crash never leaves ids
+        or rows that point at missing data.
+        """
+        for dictionary in self.dictionaries.values():
+            dictionary.flush()
+        for name in list(SIGHTING_COLUMNS) + list(TAG_COLUMNS):
+            column = self.columns[name]
+            if len(column) > self._written[name]:
+                with open(self.directory / f"{name}.col", "ab") as f:
+                    f.write(column[self._written[name] :].tobytes())
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._written[name] = len(column)
+
+    def day_ranges(self) -> Dict[int, Tuple[int, int]]:
+        """Day ordinal -> (first row, end row) of its sightings."""
+        days = self.columns["day"]
+        ranges = {}
+        lo = 0
+        while lo < len(days):
+            hi = bisect_right(days, days[lo], lo)
+            ranges[days[lo]] = (lo, hi)
+            lo = hi
+        return ranges
+
+    def first_days(self) -> Dict[int, int]:
+        """Job id -> day ordinal of its first sighting."""
+        # Later pairs win in dict(), so feed the columns backwards
+        return dict(zip(reversed(self.columns["job"]), reversed(self.columns["day"])))
+
+    def daily_counts(self, facet: str) -> Dict[date, Counter]:
+        """Postings per tag / company / location per day."""
+        ranges = self.day_ranges()
+        values = self.dictionaries[facet].values
+        if facet == "tag":
+            tag_rows = self.columns["tag_row"]
+            bounds = {
+                day: (bisect_left(tag_rows, lo), bisect_left(tag_rows, hi))
+                for day, (lo, hi) in ranges.items()
+            }
+            column = self.columns["tag"]
+        else:
+            bounds = ranges
+            column = self.columns[facet]
+        return {
+            date.fromordinal(day): Counter(
+                {values[i]: n for i, n in Counter(column[lo:hi]).items() if values[i]}
+            )
+            for day, (lo, hi) in bounds.items()
+        }
+
+    def removal_times(self) -> List[int]:
+        """Days each removed job stayed listed (first to last sighting).
+
+        A job counts as removed once a later day has sightings without it.
+        """
+        if not len(self):
+            return []
+        latest = self.columns["day"][-1]
+        first = self.first_days()
+        last = dict(zip(self.columns["job"], self.columns["day"]))
+        return [
+            last_day - first[job] + 1
+            for job, last_day in last.items()
+            if last_day < latest
+        ]
+
+    def _day_rollup(self, day, lo, hi, previous, first_days) -> dict:
+        jobs = set(self.columns["job"][lo:hi])
+        rollup = {
+            "active": hi - lo,
+            "new": sum(1 for job in jobs if first_days[job] == day),
+            "removed": 0,
+            "listed_days": {},
+        }
+        if previous:
+            previous_day, (plo, phi) = previous
+            removed = set(self.columns["job"][plo:phi]) - jobs
+            rollup["removed"] = len(removed)
+            rollup["listed_days"] = dict(
+                Counter(previous_day - first_days[job] + 1 for job in removed)
+            )
+        tag_rows = self.columns["tag_row"]
+        bounds = {
+            "tag": (bisect_left(tag_rows, lo), bisect_left(tag_rows, hi)),
+            "company": (lo, hi),
+            "location": (lo, hi),
+        }
+        for facet, field_name in FACETS.items():
+            values = self.dictionaries[facet].values
+            start, end = bounds[facet]
+            counts = Counter(self.columns[facet][start:end])
+            rollup[field_name] = {values[i]: n for i, n in counts.items() if values[i]}
+        return rollup
+
+    def refresh_rollups(self) -> dict:
+        """Recompute rollups for days changed since the last refresh.
+
+        Older days never change (the store is append-only), so only the
+        days from the first new sighting on are rebuilt.
+        """
+        path = self.directory / ROLLUPS_FILE
+        rollups = load_rollups(self.directory) or {"days": {}}
+        dirty_from = self._dirty_from
+        if not rollups["days"]:
+            dirty_from = self.columns["day"][0] if len(self) else None
+        if dirty_from is not None:
+            ranges = sorted(self.day_ranges().items())
+            first_days = self.first_days()
+            for i, (day, (lo, hi)) in enumerate(ranges):
+                if day < dirty_from:
+                    continue
+                previous = ranges[i - 1] if i else None
+                rollups["days"][date.fromordinal(day).isoformat()] = self._day_rollup(
+                    day, lo, hi, previous, first_days
+                )
+        rollups["updated_at"] = datetime.now().isoformat(timespec="seconds")
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(rollups, ensure_ascii=False), encoding="utf-8")
+        tmp.replace(path)
+        self._dirty_from = None
+        return rollups
+
+
+def load_rollups(directory: Path) -> Optional[dict]:
+    """Precomputed rollups, or None if the parser has not written them."""
+    path = Path(directory) / ROLLUPS_FILE
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def summarize(rollups: dict, days: int = 7, top: int = 5) -> Optional[dict]:
+    """Numbers for /stats over the last ``days`` observed days.
+
+    Returns:
+        dict with the latest day's postings and top facets, window totals,
+        a per-day trend and the median days until removal, or None if
+        there is no history
+    """
+    window = sorted(rollups.get("days", {}).items())[-days:]
+    if not window:
+        return None
+    latest_day, latest = window[-1]
+    listed_days = Counter()
+    for _, day in window:
+        listed_days.update({int(k): n for k, n in day["listed_days"].items()})
+    return {
+        "day": date.fromisoformat(latest_day),
+        "days": len(window),
+        "active": latest["active"],
+        "new": sum(day["new"] for _, day in window),
+        "removed": sum(day["removed"] for _, day in window),
+        "median_listed_days": (
+            statistics.median(sorted(listed_days.elements())) if listed_days else None
+        ),
+        "trend": [
+            (date.fromisoformat(d), day["active"], day["new"]) for d, day in window
+        ],
+        **{
+            field_name: Counter(latest[field_name]).most_common(top)
+            for field_name in FACETS.values()
+        },
+    }
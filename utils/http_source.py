@@ -0,0 +1,193 @@
+"""
+Browserless fetch-and-parse path for job boards.
+
+Works when card markup is present in the static HTML (or the board exposes
+a JSON data file). Returns an empty list when no cards are found, so the
+caller can fall back to the Playwright path, and None when the page has
+not changed since the previous run.
+"""
+
+import time
+from datetime import datetime
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from utils.change_detection import conditional_headers, content_hash
+from utils.extractor import FIELD_NAMES, JOB_SELECTORS, build_job
+from utils.job import Job
+
+# Elements without a closing tag
+VOID_TAGS = {
+    "area",
+    "base",
+    "br",
+    "col",
+    "embed",
+    "hr",
+    "img",
+    "input",
+    "link",
+    "meta",
+    "param",
+    "source",
+    "track",
+    "wbr",
+}
+
+
+def _class_name(selector: str) -> Optional[str]:
+    """Return class name for a simple '.class' selector, None otherwise."""
+    name = selector[1:] if selector.startswith(".") else ""
+    if not name or any(c in name for c in " .#[]:>+~,"):
+        return None
+    return name
+
+
+def supports_selectors(selectors: Dict[str, str]) -> bool:
+    """Check that card and field selectors are plain class selectors."""
+    return all(_class_name(selectors[name]) for name in ("card",) + FIELD_NAMES)
+
+
+class CardParser(HTMLParser):
+    """Collects raw job card fields from static HTML.
+
+    Mirrors EXTRACT_JOBS_JS: for each card, the first element matching each
+    field selector contributes its text content (child elements of the tags
+    field are separated by commas).
+    """
+
+    def __init__(self, selectors: Dict[str, str] = None):
+        super().__init__(convert_charrefs=True)
+        selectors = selectors or JOB_SELECTORS
+        self.card_class = _class_name(selectors["card"])
+        self.field_classes = {
+            _class_name(selectors[name]): name for name in FIELD_NAMES
+        }
+        self.cards: List[Dict[str, Optional[str]]] = []
+        # Open elements: (tag, role) where role is "card", "field" or None
+        self._stack: List[Tuple[str, Optional[str]]] = []
+        self._card: Optional[Dict] = None
+        self._field: Optional[str] = None
+        self._text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        classes = (attrs.get("class") or "").split()
+        role = None
+
+        if self._card is None:
+            if self.card_class in classes:
+                self._card = {name: None for name in self.field_classes.values()}
+                self._card["id"] = attrs.get("data-id")
+                role = "card"
+        elif self._field == "tags":
+            self._text.append(",")
+        elif self._field is None:
+            for cls in classes:
+                name = self.field_classes.get(cls)
+                if name and self._card[name] is None:
+                    self._field = name
+                    self._text = []
+                    role = "field"
+                    break
+
+        if tag not in VOID_TAGS:
+            self._stack.append((tag, role))
+
+    def handle_endtag(self, tag):
+        if not any(t == tag for t, _ in self._stack):
+            return
+        while self._stack:
+            open_tag, role = self._stack.pop()
+            if role == "field":
+                self._card[self._field] = "".join(self._text)
+                self._field = None
+            elif role == "card":
+                self.cards.append(self._card)
+                self._card = None
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if self._field is not None:
+            self._text.append(data)
+
+
+def parse_html(html: str, selectors: Dict[str, str] = None) -> List[Job]:
+    """Parse jobs from static HTML."""
+    parser = CardParser(selectors)
+    parser.feed(html)
+    parser.close()
+    found_at = datetime.now()
+    return [build_job(raw, found_at) for raw in parser.cards]
+
+
+def parse_json(data, found_at: datetime = None) -> List[Job]:
+    """Parse jobs from a JSON data file (list or {"jobs": [...]})."""
+    if isinstance(data, dict):
+        data = data.get("jobs", [])
+    found_at = found_at or datetime.now()
+    jobs = []
+    for item in data:
+        raw = {key: item.get(key) for key in FIELD_NAMES}
+        raw["id"] = str(item["id"]) if item.get("id") is not None else None
+        if raw["tags"] is not None and not isinstance(raw["tags"], str):
+            raw["tags"] = ", ".join(raw["tags"])
+        jobs.append(build_job(raw, found_at))
+    return jobs
+
+
+def fetch_jobs_http(
+    url: str, selectors: Dict[str, str] = None, timeout: float = 10, state: Dict = None
+) -> Tuple[Optional[List[Job]], float]:
+    """Fetch the board over plain HTTP and parse job cards.
+
+    Args:
+        url: Page URL or JSON data file URL
+        selectors: Card/field selectors, defaults to JOB_SELECTORS
+        timeout: Request timeout in seconds
+        state: Source state for conditional requests; updated in place
+
+    Returns:
+        (jobs, elapsed) — jobs is empty if no cards were found and None
+        if the page is unchanged since the previous HTTP-parsed run
+    """
+    selectors = selectors or JOB_SELECTORS
+    start = time.perf_counter()
+
+    # Validators are trusted only if the last run got its jobs from this page
+    check = state is not None and state.get("via") == "http"
+    headers = conditional_headers(state) if check else {}
+
+    resp = requests.get(url, headers=headers, timeout=timeout)
+    if resp.status_code == 304:
+        return None, time.perf_counter() - start
+    resp.raise_for_status()
+
+    body_hash = content_hash(resp.content)
+    if check and body_hash == state.get("body_hash"):
+        return None, time.perf_counter() - start
+
+    content_type = resp.headers.get("Content-Type", "")
+    if "charset" not in content_type:
+        # requests assumes ISO-8859-1 for text/* without charset
+        resp.encoding = "utf-8"
+
+    if "json" in content_type:
+        jobs = parse_json(resp.json())
+    elif supports_selectors(selectors):
+        jobs = parse_html(resp.text, selectors)
+    else:
+        jobs = []
+
+    if jobs and state is not None:
+        state.update(
+            via="http",
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+            body_hash=body_hash,
+        )
+
+    return jobs, time.perf_counter() - start
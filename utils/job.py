@@ -0,0 +1,172 @@
+"""
+Typed job posting shared by the parser, the page objects and delivery.
+
+Fields are normalized once when a job is built: tags become an interned
+tuple and the Russian publication date ("9 февр. 2026 г.") becomes a
+``date``, so filtering and sorting never re-parse strings. Jobs are
+frozen, use ``__slots__`` and serialize to compact bytes.
+"""
+
+import re
+import struct
+import sys
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# Month stems as they appear in full and abbreviated Russian dates
+RU_MONTHS = {
+    "янв": 1,
+    "фев": 2,
+    "мар": 3,
+    "апр": 4,
+    "мая": 5,
+    "май": 5,
+    "июн": 6,
+    "июл": 7,
+    "авг": 8,
+    "сен": 9,
+    "окт": 10,
+    "ноя": 11,
+    "дек": 12,
+}
+
+_RU_DATE = re.compile(r"(\d{1,2})\s+([а-яё]+)\.?\s+(\d{4})")
+_NUMERIC_DATE = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+_ISO_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+
+
+@lru_cache(maxsize=1024)
+def parse_ru_date(text: str) -> Optional[date]:
+    """Parse a publication date like "📅 9 февр. 2026 г.".
+
+    Also accepts "09.02.2026" and "2026-02-09". Boards repeat the same
+    few dates on every card, hence the cache.
+
+    Returns:
+        date, or None if the text is not a recognizable date
+    """
+    text = text.lower()
+    try:
+        match = _RU_DATE.search(text)
+        if match:
+            day, month, year = match.groups()
+            month = RU_MONTHS.get(month[:3])
+            return date(int(year), month, int(day)) if month else None
+        match = _NUMERIC_DATE.search(text)
+        if match:
+            day, month, year = map(int, match.groups())
+            return date(year, month, day)
+        match = _ISO_DATE.search(text)
+        if match:
+            return date(*map(int, match.groups()))
+    except ValueError:
+        # Day or month out of range
+        pass
+    return None
+
+
+def split_tags(text: Optional[str]) -> Tuple[str, ...]:
+    """Split comma-separated tags into an interned tuple."""
+    if not text:
+        return ()
+    return tuple(sys.intern(tag.strip()) for tag in text.split(",") if tag.strip())
+
+
+def _text(value: Optional[str]) -> str:
+    return (value or "").strip()
+
+
+# version, posted (ordinal, 0 — none), found_at (µs since epoch)
+_HEADER = struct.Struct("<BIq")
+_LENGTH = struct.Struct("<I")
+_VERSION = 1
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_TAG_SEPARATOR = "\x1f"
+
+
+@dataclass(frozen=True, slots=True)
+class Job:
+    """A job posting with normalized fields."""
+
+    id: str
+    title: str
+    company: str = ""
+    tags: Tuple[str, ...] = ()
+    description: str = ""
+    location: str = ""
+    posted: Optional[date] = None
+    found_at: datetime = field(default_factory=datetime.now)
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Optional[str]], found_at: datetime = None):
+        """Build a job from raw card fields (None for missing elements).
+
+        A missing title becomes "Untitled"; a missing data-id falls back to
+        the title.
+        """
+        title = _text(raw.get("title")) or "Untitled"
+        posted = raw.get("posted")
+        return cls(
+            id=raw.get("id") or title,
+            title=title,
+            company=sys.intern(_text(raw.get("company"))),
+            tags=split_tags(raw.get("tags")),
+            description=_text(raw.get("description")),
+            location=sys.intern(_text(raw.get("location"))),
+            posted=parse_ru_date(posted) if posted else None,
+            found_at=found_at or datetime.now(),
+        )
+
+    @property
+    def tags_text(self) -> str:
+        """Tags as displayed in messages."""
+        return ", ".join(self.tags)
+
+    def to_bytes(self) -> bytes:
+        """Compact binary form: fixed header plus length-prefixed UTF-8."""
+        found_at = (self.found_at - _EPOCH) // _MICROSECOND
+        parts = [
+            _HEADER.pack(
+                _VERSION, self.posted.toordinal() if self.posted else 0, found_at
+            )
+        ]
+        for text in (
+            self.id,
+            self.title,
+            self.company,
+            _TAG_SEPARATOR.join(self.tags),
+            self.description,
+            self.location,
+        ):
+            data = text.encode("utf-8")
+            parts.append(_LENGTH.pack(len(data)))
+            parts.append(data)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Job":
+        """Inverse of to_bytes."""
+        version, posted, found_at = _HEADER.unpack_from(data)
+        if version != _VERSION:
+            raise ValueError(f"Unsupported job format version: {version}")
+        offset = _HEADER.size
+        texts = []
+        for _ in range(6):
+            (length,) = _LENGTH.unpack_from(data, offset)
+            offset += _LENGTH.size
+            texts.append(data[offset : offset + length].decode("utf-8"))
+            offset += length
+        job_id, title, company, tags, description, location = texts
+        return cls(
+            id=job_id,
+            title=title,
+            company=sys.intern(company),
+            tags=tuple(sys.intern(t) for t in tags.split(_TAG_SEPARATOR) if t),
+            description=description,
+            location=sys.intern(location),
+            posted=date.fromordinal(posted) if posted else None,
+            found_at=_EPOCH + found_at * _MICROSECOND,
+        )
@@ -0,0 +1,245 @@
+"""
+Timing histograms and counters for parser runs and bot commands.
+
+Code under measurement uses the shared ``METRICS`` registry:
+
+    with METRICS.phase("goto", source=source.name):
+        page.goto(url)
+    METRICS.inc("jobs_found_total", len(jobs))
+
+Durations go to ``jobpulse_phase_seconds{phase=...}`` histograms. They are
+exported in the Prometheus text format (a file for node_exporter's
+textfile collector, or a local /metrics endpoint) and as one JSON line
+per run with exact p50/p95, so runs can be graphed and compared.
+"""
+
+import json
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Deque, Dict, Sequence, Tuple
+
+# Upper bounds in seconds, from a cache commit to a full e2e test run
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+
+# Raw samples kept per histogram for percentiles (the latest ones); the
+# bot never takes a snapshot, so its samples would otherwise grow forever
+MAX_SAMPLES = 10_000
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(labels: Dict[str, object]) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in labels
+    )
+    return "{" + ",".join(f'{k}="{v}"' for k, v in escaped) + "}"
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..100) of unsorted values."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+class Histogram:
+    """Cumulative bucket counts plus the raw samples of the current run.
+
+    The run's count and sum are exact; percentiles come from its latest
+    ``max_samples`` samples.
+    """
+
+    def __init__(self, buckets: Sequence[float], max_samples: int = MAX_SAMPLES):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.samples: Deque[float] = deque(maxlen=max_samples)
+        self.run_count = 0
+        self.run_sum = 0.0
+
+    def observe(self, value: float):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+        self.samples.append(value)
+        self.run_count += 1
+        self.run_sum += value
+
+    def reset_run(self):
+        self.samples.clear()
+        self.run_count = 0
+        self.run_sum = 0.0
+
+
+class Metrics:
+    """Thread-safe registry of histograms and counters."""
+
+    def __init__(self, prefix: str = "jobpulse", buckets=DEFAULT_BUCKETS):
+        self.prefix = prefix
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self._counters: Dict[Tuple[str, Labels], float] = {}
+        # Counter values at the last snapshot, for per-run deltas
+        self._marks: Dict[Tuple[str, Labels], float] = {}
+
+    def observe(self, name: str, seconds: float, **labels):
+        key = (name, _labels(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def inc(self, name: str, value: float = 1, **labels):
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        """Observe the duration of the block (also when it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def phase(self, phase: str, **labels):
+        """Time a pipeline phase into phase_seconds{phase=...}."""
+        return self.timer("phase_seconds", phase=phase, **labels)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+        declared = set()
+        for (name, labels), histogram in histograms:
+            metric = f"{self.prefix}_{name}"
+            if metric not in declared:
+                declared.add(metric)
+                lines.append(f"# TYPE {metric} histogram")
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                bucket_labels = _format_labels(labels + (("le", f"{bound:g}"),))
+                lines.append(f"{metric}_bucket{bucket_labels} {count}")
+            inf_labels = _format_labels(labels + (("le", "+Inf"),))
+            lines.append(f"{metric}_bucket{inf_labels} {histogram.count}")
+            lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.sum:.6f}")
+            lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+        for (name, labels), value in counters:
+            metric = f"{self.prefix}_{name}"
+            if metric not in declared:
+                declared.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{_format_labels(labels)} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self, reset: bool = True) -> dict:
+        """Per-run summary: phase percentiles and counter increments.
+
+        Args:
+            reset: start a new run (clear samples, move counter marks)
+        """
+        histograms, counters = {}, {}
+        with self._lock:
+            for (name, labels), histogram in sorted(self._histograms.items()):
+                if not histogram.samples:
+                    continue
+                samples = histogram.samples
+                histograms[f"{name}{_format_labels(labels)}"] = {
+                    "count": histogram.run_count,
+                    "sum": round(histogram.run_sum, 6),
+                    "p50": round(percentile(samples, 50), 6),
+                    "p95": round(percentile(samples, 95), 6),
+                    "max": round(max(samples), 6),
+                }
+                if reset:
+                    histogram.reset_run()
+            for key, value in sorted(self._counters.items()):
+                delta = value - self._marks.get(key, 0)
+                if delta:
+                    name, labels = key
+                    counters[f"{name}{_format_labels(labels)}"] = delta
+                if reset:
+                    self._marks[key] = value
+        return {"histograms": histograms, "counters": counters}
+
+    def write_textfile(self, path: Path):
+        """Atomically write render() output (node_exporter textfile format)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(self.render(), encoding="utf-8")
+        tmp.replace(path)
+
+    def append_jsonl(self, path: Path, **fields) -> dict:
+        """Append this run's snapshot, with extra fields, as one JSON line."""
+        record = {
+            "time": datetime.now().isoformat(timespec="seconds"),
+            **fields,
+            **self.snapshot(),
+        }
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return record
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """Serve GET /metrics from a background thread."""
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+# Shared by the parser, the crawler, delivery and the bot
+METRICS = Metrics()
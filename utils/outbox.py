@@ -0,0 +1,191 @@
+"""
+Persistent outbox that decouples job detection from Telegram delivery.
+
+Detection enqueues messages (and marks their jobs as known) in the same
+SQLite transaction as the cache. Delivery sends pending messages over a
+pooled HTTP session with bounded concurrency, and checkpoints every
+message as sent the moment its send succeeds. A crashed run leaves the
+rest pending for the next run instead of re-detecting and re-sending.
+
+A message that fails ``max_attempts`` times is marked 'failed' but not
+dropped: its jobs are already in the cache and would never be announced
+again. It is retried after ``failed_backoff`` seconds, doubling with each
+further failure up to a day.
+"""
+
+import json
+import sqlite3
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List, Sequence, Tuple
+
+from requests.adapters import HTTPAdapter
+
+# Longest wait before retrying a failed message, seconds
+MAX_FAILED_BACKOFF = 24 * 3600
+
+
+@dataclass
+class OutboxMessage:
+    """A pending Telegram message."""
+
+    id: int
+    chat_id: str
+    text: str
+    keys: List[str]
+    attempts: int
+
+
+class Outbox:
+    """Queue of Telegram messages stored in SQLite."""
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        max_attempts: int = 5,
+        failed_backoff: float = 3600,
+    ):
+        self.conn = conn
+        self.max_attempts = max_attempts
+        self.failed_backoff = failed_backoff
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS outbox ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " chat_id TEXT NOT NULL,"
+            " text TEXT NOT NULL,"
+            " keys TEXT NOT NULL,"
+            " status TEXT NOT NULL DEFAULT 'pending',"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " created_at TEXT NOT NULL,"
+            " sent_at TEXT,"
+            " retry_at TEXT"
+            ")"
+        )
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(outbox)")]
+        if "retry_at" not in columns:
+            # Outboxes created before failed messages were retried
+            conn.execute("ALTER TABLE outbox ADD COLUMN retry_at TEXT")
+        conn.execute("CREATE INDEX IF NOT EXISTS outbox_status ON outbox (status, id)")
+
+    def enqueue(self, chat_id: str, text: str, keys: Sequence[str]):
+        """Add a message carrying the given job keys (not committed)."""
+        self.conn.execute(
+            "INSERT INTO outbox (chat_id, text, keys, created_at) VALUES (?, ?, ?, ?)",
+            (str(chat_id), text, json.dumps(list(keys)), datetime.now().isoformat()),
+        )
+
+    # Pending messages and failed ones due for a retry
+    DUE = "status = 'pending' OR (status = 'failed' AND COALESCE(retry_at, '') <= ?)"
+
+    def pending(self) -> List[OutboxMessage]:
+        """Messages to send: pending ones and failed ones due for a retry."""
+        rows = self.conn.execute(
+            "SELECT id, chat_id, text, keys, attempts FROM outbox"
+            f" WHERE {self.DUE} ORDER BY id",
+            (datetime.now().isoformat(),),
+        )
+        return [
+            OutboxMessage(id, chat_id, text, json.loads(keys), attempts)
+            for id, chat_id, text, keys, attempts in rows
+        ]
+
+    def pending_count(self) -> int:
+        """Number of messages pending() would return."""
+        return self.conn.execute(
+            f"SELECT COUNT(*) FROM outbox WHERE {self.DUE}",
+            (datetime.now().isoformat(),),
+        ).fetchone()[0]
+
+    def mark_sent(self, message_id: int):
+        """Checkpoint a delivered message."""
+        self.conn.execute(
+            "UPDATE outbox SET status = 'sent', attempts = attempts + 1, sent_at = ?"
+            " WHERE id = ?",
+            (datetime.now().isoformat(), message_id),
+        )
+        self.conn.commit()
+
+    def mark_failed(self, message_id: int):
+        """Count a failed attempt; after max_attempts, back off for longer."""
+        (attempts,) = self.conn.execute(
+            "SELECT attempts + 1 FROM outbox WHERE id = ?", (message_id,)
+        ).fetchone()
+        if attempts < self.max_attempts:
+            self.conn.execute(
+                "UPDATE outbox SET attempts = ? WHERE id = ?", (attempts, message_id)
+            )
+        else:
+            backoff = min(
+                self.failed_backoff * 2 ** (attempts - self.max_attempts),
+                MAX_FAILED_BACKOFF,
+            )
+            retry_at = datetime.now() + timedelta(seconds=backoff)
+            self.conn.execute(
+                "UPDATE outbox SET attempts = ?, status = 'failed', retry_at = ?"
+                " WHERE id = ?",
+                (attempts, retry_at.isoformat(), message_id),
+            )
+        self.conn.commit()
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+def open_outbox(
+    cache, directory: Path, max_attempts: int = 5, failed_backoff: float = 3600
+) -> Outbox:
+    """Outbox sharing the SQLite cache connection, or its own outbox.db."""
+    conn = getattr(cache, "conn", None)
+    if not isinstance(conn, sqlite3.Connection):
+        conn = sqlite3.connect(Path(directory) / "outbox.db")
+        conn.execute("PRAGMA journal_mode=WAL")
+    return Outbox(conn, max_attempts, failed_backoff)
+
+
+def pool_session(sender, size: int):
+    """Mount a keep-alive connection pool of the given size on the sender."""
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=size)
+    sender.session.mount("https://", adapter)
+    sender.session.mount("http://", adapter)
+
+
+def deliver(outbox: Outbox, sender, concurrency: int = 8) -> Tuple[int, int]:
+    """Send all pending messages with bounded concurrency.
+
+    Sends run in worker threads; checkpoints are written from the calling
+    thread as each send completes.
+
+    Returns:
+        (sent, failed) message counts
+    """
+    messages = outbox.pending()
+    if not messages:
+        return 0, 0
+
+    pool_session(sender, concurrency)
+    sent = failed = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {
+            pool.submit(sender.send, message.text, message.chat_id): message
+            for message in messages
+        }
+        for future in as_completed(futures):
+            message = futures[future]
+            try:
+                ok = future.result()
+            except Exception as e:
+                print(f"❌ Send error: {e}", file=sys.stderr)
+                ok = False
+            if ok:
+                outbox.mark_sent(message.id)
+                sent += 1
+            else:
+                outbox.mark_failed(message.id)
+                failed += 1
+    return sent, failed
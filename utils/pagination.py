@@ -0,0 +1,219 @@
+"""
+Streaming extraction across paginated and infinite-scroll job listings.
+
+Jobs are yielded page by page, and the crawl can stop early: listings are
+newest-first, and once a run of already-known jobs shows up the remaining
+pages only hold jobs that were sent before. The stop happens at a page
+boundary, so every loaded page is yielded whole, and the listing counts as
+partial only if a next page was left unloaded.
+"""
+
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+from playwright.sync_api import Error as PWError
+
+from utils.extractor import extract_jobs, extract_jobs_async
+from utils.job import Job
+from utils.resource_policy import wait_for_cards, wait_for_cards_async
+
+# Identifies the current set of cards: count plus first and last card
+PAGE_SIGNATURE_JS = """
+(sel) => {
+    const cards = document.querySelectorAll(sel.card);
+    const id = (card) => card ? card.getAttribute("data-id") || card.textContent : "";
+    return `${cards.length}|${id(cards[0])}|${id(cards[cards.length - 1])}`;
+}
+"""
+
+# True once the cards differ from the given signature
+PAGE_CHANGED_JS = (
+    "([sel, before]) => (" + PAGE_SIGNATURE_JS.strip() + ")(sel) !== before"
+)
+
+SCROLL_TO_BOTTOM_JS = "() => window.scrollTo(0, document.body.scrollHeight)"
+
+
+def _next_button(page, selectors: Dict[str, str]):
+    """Locator of an enabled "next page" control, or None."""
+    selector = selectors.get("next")
+    if not selector:
+        return None
+    button = page.locator(selector).first
+    if button.count() and button.is_visible() and button.is_enabled():
+        return button
+    return None
+
+
+def next_page(page, selectors: Dict[str, str], timeout: float = 5000) -> bool:
+    """Advance to the next page of cards.
+
+    Clicks the "next" control when the page has one, otherwise scrolls to
+    the bottom to trigger infinite scroll.
+
+    Returns:
+        False if no new cards appeared within the timeout
+    """
+    before = page.evaluate(PAGE_SIGNATURE_JS, selectors)
+    try:
+        button = _next_button(page, selectors)
+        if button is not None:
+            button.click()
+        else:
+            page.evaluate(SCROLL_TO_BOTTOM_JS)
+        page.wait_for_function(
+            PAGE_CHANGED_JS, arg=[selectors, before], polling=100, timeout=timeout
+        )
+        wait_for_cards(page, selectors["card"], timeout=timeout)
+    except PWError:
+        # Timeout included: nothing more to load
+        return False
+    return True
+
+
+def has_next_page(page, selectors: Dict[str, str], timeout: float = 5000) -> bool:
+    """Whether the listing goes on after the current page.
+
+    A "next" control answers without loading anything. Without one the
+    listing may be infinite scroll, which has to be scrolled once to tell.
+    """
+    if _next_button(page, selectors) is not None:
+        return True
+    return next_page(page, selectors, timeout)
+
+
+def iter_jobs(
+    page,
+    selectors: Dict[str, str],
+    max_pages: int = 10,
+    timeout: float = 5000,
+    run: "KnownRun" = None,
+) -> Iterator[Job]:
+    """Yield jobs from the current page and the pages after it.
+
+    Jobs already yielded (infinite scroll keeps earlier cards) are skipped.
+    The next page is loaded only when the consumer asks for more jobs.
+    With a KnownRun, no page is loaded after the one where it stopped,
+    and the run records whether the listing had more pages.
+    """
+    seen = set()
+    for number in range(1, max_pages + 1):
+        jobs, _ = extract_jobs(page, selectors)
+        for job in jobs:
+            if job.id not in seen:
+                seen.add(job.id)
+                if run is not None:
+                    run.reached(job)
+                yield job
+        if run is not None and run.stopped:
+            run.truncated = has_next_page(page, selectors, timeout)
+            return
+        if number == max_pages or not next_page(page, selectors, timeout):
+            return
+
+
+async def _next_button_async(page, selectors: Dict[str, str]):
+    selector = selectors.get("next")
+    if not selector:
+        return None
+    button = page.locator(selector).first
+    if await button.count() and await button.is_visible() and await button.is_enabled():
+        return button
+    return None
+
+
+async def next_page_async(
+    page, selectors: Dict[str, str], timeout: float = 5000
+) -> bool:
+    """Async variant of next_page."""
+    before = await page.evaluate(PAGE_SIGNATURE_JS, selectors)
+    try:
+        button = await _next_button_async(page, selectors)
+        if button is not None:
+            await button.click()
+        else:
+            await page.evaluate(SCROLL_TO_BOTTOM_JS)
+        await page.wait_for_function(
+            PAGE_CHANGED_JS, arg=[selectors, before], polling=100, timeout=timeout
+        )
+        await wait_for_cards_async(page, selectors["card"], timeout=timeout)
+    except PWError:
+        return False
+    return True
+
+
+async def has_next_page_async(
+    page, selectors: Dict[str, str], timeout: float = 5000
+) -> bool:
+    """Async variant of has_next_page."""
+    if await _next_button_async(page, selectors) is not None:
+        return True
+    return await next_page_async(page, selectors, timeout)
+
+
+async def iter_jobs_async(
+    page,
+    selectors: Dict[str, str],
+    max_pages: int = 10,
+    timeout: float = 5000,
+    run: "KnownRun" = None,
+) -> AsyncIterator[Job]:
+    """Async variant of iter_jobs."""
+    seen = set()
+    for number in range(1, max_pages + 1):
+        jobs, _ = await extract_jobs_async(page, selectors)
+        for job in jobs:
+            if job.id not in seen:
+                seen.add(job.id)
+                if run is not None:
+                    run.reached(job)
+                yield job
+        if run is not None and run.stopped:
+            run.truncated = await has_next_page_async(page, selectors, timeout)
+            return
+        if number == max_pages or not await next_page_async(page, selectors, timeout):
+            return
+
+
+def known_checker(source, cache) -> Optional[Callable[[Job], bool]]:
+    """Predicate telling whether a job of the source is already cached."""
+    if cache is None:
+        return None
+    return lambda job: source.cache_key(job.id) in cache
+
+
+class PartialListing(list):
+    """Jobs of a listing whose crawl stopped at known jobs before its last page.
+
+    The pages that were not loaded still list jobs, so their absence says
+    nothing about removals.
+    """
+
+
+class KnownRun:
+    """Counts consecutive known jobs to decide when to stop crawling.
+
+    A stop_after of 0 (or no is_known) disables the early stop.
+    """
+
+    def __init__(self, is_known: Callable[[Job], bool], stop_after: int):
+        self.is_known = is_known
+        self.stop_after = stop_after
+        self.run = 0
+        self.stopped = False
+        # Set by iter_jobs: the crawl stopped with a next page left unloaded
+        self.truncated = False
+
+    def reached(self, job: Job) -> bool:
+        """Record a job; True once stop_after known jobs came in a row.
+
+        Stays True for the rest of the page, where the crawl stops.
+        """
+        if not self.stop_after or self.is_known is None:
+            return False
+        self.run = self.run + 1 if self.is_known(job) else 0
+        self.stopped = self.stopped or self.run >= self.stop_after
+        return self.stopped
+
+    def listing(self, jobs: List[Job]) -> List[Job]:
+        """The collected jobs, as a PartialListing if pages were left unloaded."""
+        return PartialListing(jobs) if self.truncated else jobs
@@ -0,0 +1,127 @@
+"""
+Background availability checks of the demo sites for /status.
+
+A single task probes every site concurrently through one pooled
+``httpx.AsyncClient`` every ``interval`` seconds and keeps the last
+``window`` samples per site. /status reads the latest sample, latency
+percentiles and uptime from memory instead of doing network I/O itself.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional
+
+import httpx
+
+from utils.metrics import METRICS, percentile
+
+
+@dataclass(frozen=True)
+class Sample:
+    """Outcome of one probe of a site."""
+
+    at: float
+    latency: Optional[float] = None
+    status_code: Optional[int] = None
+    error: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code == 200
+
+    @property
+    def age(self) -> float:
+        """Seconds since the probe."""
+        return time.time() - self.at
+
+
+class SiteProber:
+    """Periodically probes sites and keeps a rolling history of samples.
+
+    Args:
+        sites: site name -> URL
+        interval: seconds between probe rounds
+        timeout: per-request timeout, seconds
+        window: samples kept per site for percentiles and uptime
+    """
+
+    def __init__(
+        self,
+        sites: Dict[str, str],
+        interval: float = 60,
+        timeout: float = 10,
+        window: int = 60,
+    ):
+        self.sites = dict(sites)
+        self.interval = interval
+        self.timeout = timeout
+        self.history: Dict[str, Deque[Sample]] = {
+            name: deque(maxlen=window) for name in self.sites
+        }
+        self._client: Optional[httpx.AsyncClient] = None
+        self._task: Optional[asyncio.Task] = None
+        self._ready: Optional[asyncio.Event] = None
+
+    async def probe(self, name: str) -> Sample:
+        """Probe one site and record the sample."""
+        start = time.perf_counter()
+        try:
+            response = await self._client.get(self.sites[name])
+            latency = time.perf_counter() - start
+            sample = Sample(time.time(), latency, response.status_code)
+            METRICS.observe("site_probe_seconds", latency, site=name)
+        except Exception as e:
+            sample = Sample(time.time(), error=str(e) or type(e).__name__)
+            METRICS.inc("site_probe_errors_total", site=name)
+        self.history[name].append(sample)
+        return sample
+
+    async def probe_all(self) -> Dict[str, Sample]:
+        """Probe every site at once; a slow host delays only its own sample."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout, follow_redirects=True
+            )
+        samples = await asyncio.gather(*(self.probe(name) for name in self.sites))
+        return dict(zip(self.sites, samples))
+
+    def start(self):
+        """Start probing in the background on the running loop."""
+        if self._task is None:
+            self._ready = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def ready(self):
+        """Start if needed and wait for the first round of samples."""
+        self.start()
+        await self._ready.wait()
+
+    async def _run(self):
+        while True:
+            await self.probe_all()
+            self._ready.set()
+            await asyncio.sleep(self.interval)
+
+    def summary(self, name: str) -> dict:
+        """Latest sample, p50/p95 latency and uptime over the window."""
+        history = self.history[name]
+        latencies = [s.latency for s in history if s.ok]
+        return {
+            "latest": history[-1] if history else None,
+            "samples": len(history),
+            "uptime": sum(s.ok for s in history) / len(history) if history else None,
+            "p50": percentile(latencies, 50) if latencies else None,
+            "p95": percentile(latencies, 95) if latencies else None,
+        }
+
+    async def close(self):
+        """Stop probing and close the connection pool."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
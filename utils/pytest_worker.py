@@ -0,0 +1,217 @@
+"""
+Warm pytest interpreters for bot-triggered test runs.
+
+Starting ``python -m pytest`` for every /test_jobboard pays for importing
+pytest, Playwright and the project and for launching Chromium before the
+first test. A worker process does that once and then runs suites in
+process with ``pytest.main``, handing its browser to the ``browser``
+fixture in conftest.py through ``config.stash[WARM_BROWSER]``. If the
+browser cannot start, the stash holds the launch error instead: the
+fixture must not start a second sync Playwright in this process.
+
+The parent talks to a worker over its stdin/stdout, one JSON object per
+line:
+
+    <- {"ready": true, "browser": true}
+    -> {"args": ["tests/test_jobboard.py", "-v"], "env": {"TEST_RUN_ID": "..."}}
+    <- {"exit_code": 0, "output": "..."}
+
+``WarmWorker`` is the parent side. It replaces its process after
+``max_runs`` runs, because modules imported by earlier sessions stay
+cached, and whenever a run is killed.
+
+Usage (started by WarmWorker):
+    python -m utils.pytest_worker
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Optional, Tuple
+
+import pytest
+
+WARM_BROWSER = pytest.StashKey[object]()
+
+ROOT = Path(__file__).resolve().parent.parent
+# Responses carry the whole pytest output in one line
+LINE_LIMIT = 64 * 1024 * 1024
+
+
+class WarmBrowserPlugin:
+    """Puts the worker's browser, or its launch error, in the stash."""
+
+    def __init__(self, browser):
+        self.browser = browser
+
+    def pytest_configure(self, config):
+        config.stash[WARM_BROWSER] = self.browser
+
+
+def launch_browser(playwright):
+    """Launch Chromium like conftest.py does.
+
+    Returns:
+        The browser, or the exception if it cannot start
+    """
+    try:
+        return playwright.chromium.launch(headless=True, args=["--no-sandbox"])
+    except Exception as e:
+        print(f"⚠️ Warm browser not launched: {e}", file=sys.stderr)
+        return e
+
+
+def serve():
+    """Answer run requests from stdin until it is closed."""
+    # Keep the real stdout for responses; stray fd-level output goes to stderr
+    responses = os.fdopen(os.dup(1), "w", encoding="utf-8", buffering=1)
+    os.dup2(2, 1)
+
+    from playwright.sync_api import sync_playwright
+
+    playwright = sync_playwright().start()
+    browser = launch_browser(playwright)
+
+    def respond(message: dict):
+        responses.write(json.dumps(message, ensure_ascii=False) + "\n")
+
+    def usable(browser) -> bool:
+        return not isinstance(browser, Exception) and browser.is_connected()
+
+    respond({"ready": True, "browser": usable(browser)})
+    for line in sys.stdin:
+        request = json.loads(line)
+        if not usable(browser):
+            # Crashed, or never started: try again for every run
+            browser = launch_browser(playwright)
+        plugins = [WarmBrowserPlugin(browser)]
+        os.environ.update(request["env"])
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            exit_code = pytest.main(request["args"], plugins=plugins)
+        respond({"exit_code": int(exit_code), "output": output.getvalue()})
+
+    if usable(browser):
+        browser.close()
+    playwright.stop()
+
+
+class WarmWorker:
+    """Parent side of one worker process, spawned ahead of use.
+
+    Args:
+        cwd: directory to run suites in (where conftest.py and pytest.ini are)
+        max_runs: runs before the process is replaced by a fresh one
+    """
+
+    def __init__(self, cwd: Path = None, max_runs: int = 20):
+        self.cwd = Path(cwd) if cwd else Path.cwd()
+        self.max_runs = max_runs
+        self.runs = 0
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._spawning: Optional[asyncio.Task] = None
+        self._closed = False
+
+    def warm(self):
+        """Start a process in the background unless one is up or starting."""
+        if self._spawning is None and not self._closed:
+            self._spawning = asyncio.create_task(self._spawn())
+
+    async def acquire(self) -> asyncio.subprocess.Process:
+        """The ready process, waiting for it to start if needed."""
+        self.warm()
+        try:
+            return await asyncio.shield(self._spawning)
+        except Exception:
+            self._spawning = None
+            raise
+
+    async def run(self, args, env: dict = None) -> Tuple[Optional[int], str]:
+        """Run pytest with args in the worker, with env variables set first.
+
+        Returns:
+            (exit code, output), or (None, "") if the process was killed
+        """
+        process = await self.acquire()
+        request = {"args": list(args), "env": env or {}}
+        process.stdin.write((json.dumps(request) + "\n").encode("utf-8"))
+        await process.stdin.drain()
+        line = await process.stdout.readline()
+        if not line:
+            self._discard(process)
+            return None, ""
+        self.runs += 1
+        if self.runs >= self.max_runs:
+            # The old process exits on EOF; its replacement warms up meanwhile
+            process.stdin.close()
+            self._discard(process)
+        response = json.loads(line)
+        return response["exit_code"], response["output"]
+
+    def kill(self):
+        """Kill the process mid-run; a fresh one starts in the background."""
+        process = self.process
+        if process is not None and process.returncode is None:
+            process.kill()
+        self._discard(process)
+
+    async def stop(self):
+        """Let the process finish its current run and exit."""
+        process, self.process, self._spawning = self.process, None, None
+        if process is None or process.returncode is not None:
+            return
+        process.stdin.close()
+        try:
+            await asyncio.wait_for(process.wait(), 10)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+
+    async def close(self):
+        self._closed = True
+        if self._spawning is not None:
+            await asyncio.gather(self._spawning, return_exceptions=True)
+        await self.stop()
+
+    def _discard(self, process):
+        if self.process is process:
+            self.process, self._spawning = None, None
+            self.warm()
+
+    async def _spawn(self) -> asyncio.subprocess.Process:
+        env = {
+            **os.environ,
+            "PYTHONPATH": os.pathsep.join(
+                filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])
+            ),
+        }
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            "utils.pytest_worker",
+            cwd=self.cwd,
+            env=env,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            limit=LINE_LIMIT,
+        )
+        ready = await process.stdout.readline()
+        if not ready:
+            await process.wait()
+            raise RuntimeError(f"pytest worker exited with {process.returncode}")
+        self.process = process
+        self.runs = 0
+        return process
+
+
+if __name__ == "__main__":
+    # Run the importable module, not __main__: conftest.py looks the browser
+    # up under utils.pytest_worker.WARM_BROWSER, and a key is only equal to
+    # itself
+    from utils.pytest_worker import serve as worker_serve
+
+    worker_serve()
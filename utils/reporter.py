@@ -1,15 +1,28 @@
 """
 Utility for generating human-readable test reports.
+
+Every run is also saved as machine-readable files in a directory of its
+own (``reports/<run_id>/``): report.json for the bot, junit.xml for CI
+and report.txt for people.
 """
 
+import json
+import shutil
+import xml.etree.ElementTree as ET
 from datetime import datetime
-from typing import List, Dict
+from pathlib import Path
+from typing import List, Dict, Optional
+
+REPORT_JSON = "report.json"
+REPORT_JUNIT = "junit.xml"
+REPORT_TEXT = "report.txt"
 
 
 class TestReport:
     """Generates human-readable test reports."""
 
-    def __init__(self):
+    def __init__(self, run_id: str = None):
+        self.run_id = run_id
         self.start_time = datetime.now()
         self.results: List[Dict] = []
         self.end_time = None
@@ -39,59 +52,161 @@ class TestReport:
         """Finish report collection."""
         self.end_time = datetime.now()
 
-    def get_summary(self) -> str:
-        """Get text report in format suitable for Telegram/console."""
+    def to_dict(self) -> Dict:
+        """Run data as saved to report.json."""
         if not self.end_time:
             self.finish()
 
-        total = len(self.results)
-        passed = len([r for r in self.results if r["status"] == "PASSED"])
-        failed = len([r for r in self.results if r["status"] == "FAILED"])
-        skipped = len([r for r in self.results if r["status"] == "SKIPPED"])
-        duration_total = sum(r["duration"] for r in self.results)
-
-        # Status emoji
-        status_emoji = "✅" if failed == 0 else "❌"
-
-        # Header
-        report = f"{status_emoji} JobBoard Demo — Test Report\n"
-        report += f"{'─' * 45}\n"
-
-        # Statistics
-        report += f"Total tests:    {total}\n"
-        report += f"Passed:         {passed} ✅\n"
-        report += f"Failed:         {failed} ❌\n"
-        report += f"Skipped:        {skipped} ⏭\n"
-        report += f"Duration:       {duration_total:.2f}s\n"
-        report += f"{'─' * 45}\n\n"
-
-        # Test details
-        for result in self.results:
-            emoji = (
-                "✅"
-                if result["status"] == "PASSED"
-                else "❌" if result["status"] == "FAILED" else "⏭"
-            )
-            duration = f"{result['duration']:.2f}s"
-
-            # Trim test class prefix for readability
-            test_name = result["name"].replace("TestJobBoardDemo.", "")
-            report += f"{emoji} {test_name:<35} {duration:>6}\n"
-
-            # Add error if present
-            if result["error"] and result["status"] == "FAILED":
-                # Trim long stack traces
-                error_lines = result["error"].split("\n")
-                first_line = error_lines[0] if error_lines else ""
-                if len(first_line) > 70:
-                    first_line = first_line[:67] + "..."
-                report += f"   Error: {first_line}\n"
-
-        report += f"\n{'─' * 45}\n"
-        report += f"Generated: {self.end_time.strftime('%Y-%m-%d %H:%M:%S')}"
+        def count(status):
+            return len([r for r in self.results if r["status"] == status])
+
+        return {
+            "run_id": self.run_id,
+            "started_at": self.start_time.isoformat(timespec="seconds"),
+            "finished_at": self.end_time.isoformat(timespec="seconds"),
+            "total": len(self.results),
+            "passed": count("PASSED"),
+            "failed": count("FAILED"),
+            "skipped": count("SKIPPED"),
+            "duration": round(sum(r["duration"] for r in self.results), 3),
+            "tests": self.results,
+        }
 
-        return report
+    def get_summary(self) -> str:
+        """Get text report in format suitable for Telegram/console."""
+        return format_summary(self.to_dict())
+
+    def save(self, directory: Path) -> Path:
+        """Write report.json, junit.xml and report.txt into the directory."""
+        data = self.to_dict()
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / REPORT_JUNIT).write_text(junit_xml(data), encoding="utf-8")
+        (directory / REPORT_TEXT).write_text(format_summary(data), encoding="utf-8")
+        # Written last: its presence means the run's report is complete
+        (directory / REPORT_JSON).write_text(
+            json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        return directory
 
     def has_failures(self) -> bool:
         """Check if any tests failed."""
         return any(r["status"] == "FAILED" for r in self.results)
+
+
+def load_report(directory: Path) -> Optional[Dict]:
+    """Data of a saved run, or None if the run left no report."""
+    path = Path(directory) / REPORT_JSON
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except ValueError:
+        # Torn or corrupt: as good as no report
+        return None
+
+
+def prune_reports(reports_dir: Path, keep: int) -> int:
+    """Delete all but the ``keep`` newest run directories.
+
+    Only directories holding one of our report files are touched.
+
+    Returns:
+        Number of deleted run directories
+    """
+    reports_dir = Path(reports_dir)
+    if keep <= 0 or not reports_dir.is_dir():
+        return 0
+    runs = [
+        path
+        for path in reports_dir.iterdir()
+        if path.is_dir()
+        and any((path / name).exists() for name in (REPORT_JSON, REPORT_TEXT))
+    ]
+    runs.sort(key=lambda path: path.stat().st_mtime, reverse=True)
+    for path in runs[keep:]:
+        shutil.rmtree(path, ignore_errors=True)
+    return len(runs[keep:])
+
+
+def format_summary(data: Dict, title: str = "JobBoard Demo") -> str:
+    """Text report of saved run data, suitable for Telegram/console."""
+    # Status emoji
+    status_emoji = "✅" if data["failed"] == 0 else "❌"
+
+    # Header
+    report = f"{status_emoji} {title} — Test Report\n"
+    report += f"{'─' * 45}\n"
+
+    # Statistics
+    report += f"Total tests:    {data['total']}\n"
+    report += f"Passed:         {data['passed']} ✅\n"
+    report += f"Failed:         {data['failed']} ❌\n"
+    report += f"Skipped:        {data['skipped']} ⏭\n"
+    report += f"Duration:       {data['duration']:.2f}s\n"
+    report += f"{'─' * 45}\n\n"
+
+    # Test details
+    for result in data["tests"]:
+        emoji = (
+            "✅"
+            if result["status"] == "PASSED"
+            else "❌" if result["status"] == "FAILED" else "⏭"
+        )
+        duration = f"{result['duration']:.2f}s"
+
+        # Trim test class prefix for readability
+        test_name = result["name"].replace("TestJobBoardDemo.", "")
+        report += f"{emoji} {test_name:<35} {duration:>6}\n"
+
+        # Add error if present
+        if result["error"] and result["status"] == "FAILED":
+            # Trim long stack traces
+            error_lines = result["error"].split("\n")
+            first_line = error_lines[0] if error_lines else ""
+            if len(first_line) > 70:
+                first_line = first_line[:67] + "..."
+            report += f"   Error: {first_line}\n"
+
+    finished = datetime.fromisoformat(data["finished_at"])
+    report += f"\n{'─' * 45}\n"
+    report += f"Generated: {finished.strftime('%Y-%m-%d %H:%M:%S')}"
+
+    return report
+
+
+def junit_xml(data: Dict) -> str:
+    """JUnit XML of saved run data (one testsuite, a testcase per test)."""
+    suite = ET.Element(
+        "testsuite",
+        name=data["run_id"] or "pytest",
+        tests=str(data["total"]),
+        failures=str(data["failed"]),
+        skipped=str(data["skipped"]),
+        errors="0",
+        time=f"{data['duration']:.3f}",
+        timestamp=data["started_at"],
+    )
+    for result in data["tests"]:
+        # tests/test_jobboard.py::TestJobBoardDemo::test_x
+        path, _, name = result["name"].rpartition("::")
+        classname = path.replace(".py", "").replace("/", ".").replace("::", ".")
+        case = ET.SubElement(
+            suite,
+            "testcase",
+            classname=classname,
+            name=name,
+            time=f"{result['duration']:.3f}",
+        )
+        if result["status"] == "FAILED":
+            error = result["error"] or ""
+            failure = ET.SubElement(
+                case, "failure", message=error.split("\n", 1)[0][:200]
+            )
+            failure.text = error
+        elif result["status"] == "SKIPPED":
+            ET.SubElement(case, "skipped")
+    root = ET.Element("testsuites")
+    root.append(suite)
+    ET.indent(root)
+    return ET.tostring(root, encoding="unicode", xml_declaration=True) + "\n"
@@ -0,0 +1,171 @@
+"""
+Request interception and load waiting for the parser.
+
+Non-essential resources (images, fonts, stylesheets, analytics) are aborted
+via ``page.route`` and the parser waits only until job cards are rendered
+and stable, instead of waiting for network idle.
+"""
+
+import os
+import time
+from typing import Iterable
+from urllib.parse import urlparse
+
+DEFAULT_BLOCKED_TYPES = ("image", "font", "stylesheet", "media")
+DEFAULT_BLOCKED_HOSTS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "mc.yandex.ru",
+)
+
+# Quiet window Playwright requires before "networkidle" fires
+NETWORK_IDLE_WINDOW = 0.5
+
+# Resolves once the card count is non-zero and unchanged for stableMs
+CARDS_STABLE_JS = """
+([sel, stableMs]) => {
+    const n = document.querySelectorAll(sel).length;
+    const now = performance.now();
+    const s = window.__jobpulseCards || (window.__jobpulseCards = {n: -1, t: now});
+    if (n !== s.n) {
+        s.n = n;
+        s.t = now;
+        return false;
+    }
+    return n > 0 && now - s.t >= stableMs;
+}
+"""
+
+
+def _env_list(name: str, default: Iterable[str]) -> tuple:
+    value = os.environ.get(name)
+    if value is None:
+        return tuple(default)
+    return tuple(v.strip() for v in value.split(",") if v.strip())
+
+
+class ResourcePolicy:
+    """Blocks non-essential requests and keeps per-run statistics."""
+
+    def __init__(
+        self,
+        blocked_types: Iterable[str] = DEFAULT_BLOCKED_TYPES,
+        blocked_hosts: Iterable[str] = DEFAULT_BLOCKED_HOSTS,
+    ):
+        self.blocked_types = frozenset(blocked_types)
+        self.blocked_hosts = tuple(blocked_hosts)
+        self.blocked = 0
+        self.allowed = 0
+        self.started_at = None
+        self.ready_at = None
+        self.last_activity_at = None
+
+    @classmethod
+    def from_env(cls) -> "ResourcePolicy":
+        """Build policy from JOBSITE_BLOCK_RESOURCES / JOBSITE_BLOCK_HOSTS.
+
+        Both are comma-separated; an empty value disables that rule.
+        """
+        return cls(
+            blocked_types=_env_list("JOBSITE_BLOCK_RESOURCES", DEFAULT_BLOCKED_TYPES),
+            blocked_hosts=_env_list("JOBSITE_BLOCK_HOSTS", DEFAULT_BLOCKED_HOSTS),
+        )
+
+    def should_block(self, request) -> bool:
+        """Check if request is non-essential."""
+        if request.resource_type in self.blocked_types:
+            return True
+        host = urlparse(request.url).hostname or ""
+        return any(host == h or host.endswith("." + h) for h in self.blocked_hosts)
+
+    def _handle(self, route):
+        if self.should_block(route.request):
+            self.blocked += 1
+            route.abort()
+        else:
+            self.allowed += 1
+            route.continue_()
+
+    async def _handle_async(self, route):
+        if self.should_block(route.request):
+            self.blocked += 1
+            await route.abort()
+        else:
+            self.allowed += 1
+            await route.continue_()
+
+    def _on_activity(self, request):
+        # Only activity up to the ready moment says when networkidle could
+        # have fired; later requests belong to extraction
+        if self.ready_at is None:
+            self.last_activity_at = time.perf_counter()
+
+    def install(self, page):
+        """Attach the policy to a page before navigation."""
+        if self.blocked_types or self.blocked_hosts:
+            page.route("**/*", self._handle)
+        page.on("requestfinished", self._on_activity)
+        page.on("requestfailed", self._on_activity)
+        self.started_at = time.perf_counter()
+
+    async def install_async(self, page):
+        """Async variant of install for the multi-source crawler."""
+        if self.blocked_types or self.blocked_hosts:
+            await page.route("**/*", self._handle_async)
+        page.on("requestfinished", self._on_activity)
+        page.on("requestfailed", self._on_activity)
+        self.started_at = time.perf_counter()
+
+    def mark_ready(self):
+        """Record the moment job cards became usable."""
+        self.ready_at = time.perf_counter()
+
+    @property
+    def ready_time(self) -> float:
+        """Seconds from navigation start to cards ready."""
+        if self.started_at is None or self.ready_at is None:
+            return 0.0
+        return self.ready_at - self.started_at
+
+    @property
+    def time_saved(self) -> float:
+        """Lower-bound estimate of time saved versus waiting for networkidle.
+
+        networkidle would have fired no earlier than the last observed
+        network activity before the cards were ready plus the idle window;
+        requests that were blocked would only have pushed it later. Zero if
+        the network had already been idle that long when the cards were ready.
+        """
+        if self.ready_at is None or self.last_activity_at is None:
+            return 0.0
+        idle_at = self.last_activity_at + NETWORK_IDLE_WINDOW
+        return max(0.0, idle_at - self.ready_at)
+
+    def summary(self) -> str:
+        return (
+            f"blocked {self.blocked} of {self.blocked + self.allowed} requests, "
+            f"ready in {self.ready_time:.2f}s, ~{self.time_saved:.2f}s saved"
+        )
+
+
+def wait_for_cards(page, selector: str, timeout: float = 15000, stable_ms: int = 300):
+    """Wait until cards matching selector are present and their count is stable.
+
+    Raises:
+        playwright TimeoutError if cards do not appear in time
+    """
+    page.evaluate("() => { delete window.__jobpulseCards; }")
+    page.wait_for_function(
+        CARDS_STABLE_JS, arg=[selector, stable_ms], polling=100, timeout=timeout
+    )
+
+
+async def wait_for_cards_async(
+    page, selector: str, timeout: float = 15000, stable_ms: int = 300
+):
+    """Async variant of wait_for_cards."""
+    await page.evaluate("() => { delete window.__jobpulseCards; }")
+    await page.wait_for_function(
+        CARDS_STABLE_JS, arg=[selector, stable_ms], polling=100, timeout=timeout
+    )
@@ -0,0 +1,457 @@
+"""
+Asynchronous queue of pytest runs requested from the bot.
+
+/test_jobboard and /test_internet only enqueue a run and reply at once.
+A fixed number of workers start pytest with
+``asyncio.create_subprocess_exec``, so the event loop keeps serving
+other commands while suites run. Every run has an ID: users can see
+its position in the queue and cancel it, queued or running.
+
+``request`` coalesces identical requests: while a suite is queued or
+running, new requests for it attach to that run and all of them get its
+report. A finished run is also kept for ``cache_ttl`` seconds and served
+again instead of starting pytest.
+
+With ``warm=True`` every worker runs suites in its own warm interpreter
+(utils/pytest_worker.py) instead of a fresh ``python -m pytest``.
+
+Given ``on_progress``, the queue listens on a localhost socket whose
+address it passes to pytest as TEST_PROGRESS_ADDR. The reporter hooks
+stream a JSON line as each test starts and ends; ``on_progress`` is
+awaited with the updated run at most once per ``progress_interval``.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import count
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from utils.pytest_worker import WarmWorker
+from utils.reporter import load_report
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+TIMEOUT = "timeout"
+CANCELLED = "cancelled"
+# pytest could not be run at all (error in output)
+FAILED = "failed"
+ACTIVE = (QUEUED, RUNNING)
+
+# How request() served a run
+MISS = "miss"
+JOINED = "joined"
+HIT = "hit"
+
+OnFinish = Callable[["SuiteRun"], Awaitable[None]]
+
+
+@dataclass
+class Progress:
+    """Tests of a running suite reported so far."""
+
+    total: int = 0
+    done: int = 0
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    current: str = ""
+
+    def update(self, event: dict):
+        """Apply one event streamed by the reporter hooks."""
+        if event.get("event") == "start":
+            self.total = event.get("total") or self.total
+            self.current = event.get("test", "")
+        elif event.get("event") == "result":
+            self.done += 1
+            status = event.get("status")
+            if status == "PASSED":
+                self.passed += 1
+            elif status == "FAILED":
+                self.failed += 1
+            else:
+                self.skipped += 1
+            self.current = ""
+
+
+@dataclass(frozen=True)
+class Suite:
+    """A test file the bot can run."""
+
+    name: str
+    title: str
+    test_file: str
+
+    def pytest_args(self) -> List[str]:
+        return [
+            self.test_file,
+            "-v",
+            "--tb=short",
+            "-o",
+            "console_output_style=classic",
+        ]
+
+    def command(self) -> List[str]:
+        return [sys.executable, "-m", "pytest", *self.pytest_args()]
+
+
+@dataclass(eq=False)
+class SuiteRun:
+    """One requested run and its outcome.
+
+    ``chat_id`` started the run; ``waiters`` maps every chat waiting for
+    the report (including that one) to its callback.
+    """
+
+    id: int
+    chat_id: str
+    suite: Suite
+    waiters: Dict[str, Optional[OnFinish]] = field(default_factory=dict)
+    status: str = QUEUED
+    queued_at: float = field(default_factory=time.monotonic)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    # reports/<report_id>/ holds report.json, junit.xml and report.txt
+    report_id: str = ""
+    report_dir: Optional[Path] = None
+    # Parsed report.json, None if pytest left no report
+    result: Optional[dict] = None
+    exit_code: Optional[int] = None
+    output: str = field(default="", repr=False)
+    progress: Progress = field(default_factory=Progress)
+    process: Optional[asyncio.subprocess.Process] = field(default=None, repr=False)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the run started (or was queued)."""
+        end = self.finished_at or time.monotonic()
+        return end - (self.started_at or self.queued_at)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the run finished (0 while it is active)."""
+        if self.finished_at is None:
+            return 0.0
+        return time.monotonic() - self.finished_at
+
+
+class RunQueue:
+    """FIFO of suite runs served by a bounded pool of workers.
+
+    Workers start with ``start()`` or the first submitted run, on the
+    running loop. Completed (not timed out) runs stay reusable for
+    ``cache_ttl`` seconds. Warm interpreters are replaced after
+    ``max_runs`` runs.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        timeout: float = 60,
+        cwd: Path = None,
+        cache_ttl: float = 0,
+        warm: bool = False,
+        max_runs: int = 20,
+        reports_dir: Path = None,
+        on_progress: OnFinish = None,
+        progress_interval: float = 1.0,
+    ):
+        self.workers = workers
+        self.timeout = timeout
+        self.cwd = Path(cwd) if cwd else Path.cwd()
+        self.reports_dir = Path(reports_dir) if reports_dir else self.cwd / "reports"
+        self.cache_ttl = cache_ttl
+        self.warm = warm
+        self.max_runs = max_runs
+        self.on_progress = on_progress
+        self.progress_interval = progress_interval
+        self.runs: Dict[int, SuiteRun] = {}
+        # Latest completed run of every suite
+        self.results: Dict[Suite, SuiteRun] = {}
+        self._ids = count(1)
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._warm_workers: List[WarmWorker] = []
+        self._progress_server: Optional[asyncio.Task] = None
+        # Running runs by report ID, for events streamed by pytest
+        self._streaming: Dict[str, SuiteRun] = {}
+        # Throttled progress notifications: pending task, last call time
+        self._notifying: Dict[int, asyncio.Task] = {}
+        self._notified_at: Dict[int, float] = {}
+        # Runs updated while their on_progress call was in flight
+        self._stale: set = set()
+
+    def start(self):
+        """Start the workers (and their interpreters) ahead of the first run."""
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue()
+        if self.on_progress:
+            self._progress_server = asyncio.create_task(
+                asyncio.start_server(self._read_progress, "127.0.0.1", 0)
+            )
+        if self.warm:
+            self._warm_workers = [
+                WarmWorker(self.cwd, self.max_runs) for _ in range(self.workers)
+            ]
+            for worker in self._warm_workers:
+                worker.warm()
+        self._tasks = [
+            asyncio.create_task(self._worker(worker))
+            for worker in self._warm_workers or [None] * self.workers
+        ]
+
+    def submit(
+        self,
+        chat_id,
+        suite: Suite,
+        on_finish: OnFinish = None,
+    ) -> SuiteRun:
+        """Queue a new run; on_finish is awaited with it once it ends."""
+        self.start()
+        run = SuiteRun(next(self._ids), str(chat_id), suite)
+        run.waiters[run.chat_id] = on_finish
+        self.runs[run.id] = run
+        self._queue.put_nowait(run)
+        return run
+
+    def request(
+        self,
+        chat_id,
+        suite: Suite,
+        on_finish: OnFinish = None,
+    ) -> Tuple[SuiteRun, str]:
+        """Serve a run of the suite the cheapest way possible.
+
+        Returns:
+            (run, how): HIT — a cached run, on_finish is not called;
+            JOINED — on_finish is attached to the queued or running run;
+            MISS — a new run was queued
+        """
+        cached = self.results.get(suite)
+        if cached and cached.age < self.cache_ttl:
+            return cached, HIT
+        for run in self.runs.values():
+            if run.suite == suite and run.status in ACTIVE:
+                run.waiters.setdefault(str(chat_id), on_finish)
+                return run, JOINED
+        return self.submit(chat_id, suite, on_finish), MISS
+
+    def waiting(self, run: SuiteRun, chat_id) -> bool:
+        """Whether the chat waits for this run's report."""
+        return str(chat_id) in run.waiters
+
+    def active(self) -> List[SuiteRun]:
+        """Running runs first, then queued ones in order."""
+        runs = [run for run in self.runs.values() if run.status in ACTIVE]
+        return sorted(runs, key=lambda run: (run.status != RUNNING, run.id))
+
+    def position(self, run: SuiteRun) -> int:
+        """0 while running, otherwise the 1-based place in the queue."""
+        if run.status != QUEUED:
+            return 0
+        return sum(
+            1
+            for other in self.runs.values()
+            if other.status == QUEUED and other.id <= run.id
+        )
+
+    def cancel(self, run_id: int, chat_id) -> Optional[SuiteRun]:
+        """Detach this chat from an active run; stop it if nobody else waits.
+
+        Returns:
+            The run (still active if other chats wait for it), or None if
+            the chat waits for no such active run
+        """
+        run = self.runs.get(run_id)
+        if run is None or run.status not in ACTIVE or not self.waiting(run, chat_id):
+            return None
+        if len(run.waiters) > 1:
+            del run.waiters[str(chat_id)]
+            return run
+        running = run.status == RUNNING
+        run.status = CANCELLED
+        if running and run.process and run.process.returncode is None:
+            run.process.terminate()
+        elif not running:
+            run.finished_at = time.monotonic()
+            del self.runs[run.id]
+        return run
+
+    async def join(self):
+        """Wait until every submitted run has ended and been reported."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _worker(self, warm: Optional[WarmWorker]):
+        while True:
+            run = await self._queue.get()
+            try:
+                if run.status != QUEUED:
+                    # Cancelled while waiting
+                    continue
+                try:
+                    await self._execute(run, warm)
+                except Exception as e:
+                    # Keep the worker alive and never leave the run active:
+                    # later requests would join it and wait forever
+                    run.status = FAILED
+                    run.finished_at = time.monotonic()
+                    run.output = f"{type(e).__name__}: {e}"
+                    run.process = None
+                    print(f"❌ Run #{run.id} failed: {run.output}", file=sys.stderr)
+                self.runs.pop(run.id, None)
+                if run.status == DONE and self.cache_ttl:
+                    self.results[run.suite] = run
+                for chat_id, on_finish in list(run.waiters.items()):
+                    if on_finish is None:
+                        continue
+                    try:
+                        await on_finish(run)
+                    except Exception as e:
+                        print(
+                            f"❌ Run #{run.id} report not sent to {chat_id}: {e}",
+                            file=sys.stderr,
+                        )
+            finally:
+                self._queue.task_done()
+
+    async def _execute(self, run: SuiteRun, warm: Optional[WarmWorker]):
+        run.status = RUNNING
+        run.started_at = time.monotonic()
+        # A directory of its own, so parallel runs never share a report
+        run.report_id = f"{datetime.now():%Y%m%d_%H%M%S}_run{run.id}"
+        run.report_dir = self.reports_dir / run.report_id
+        env = {"TEST_RUN_ID": run.report_id, "TEST_REPORTS_DIR": str(self.reports_dir)}
+        if self._progress_server:
+            server = await self._progress_server
+            port = server.sockets[0].getsockname()[1]
+            env["TEST_PROGRESS_ADDR"] = f"127.0.0.1:{port}"
+            self._streaming[run.report_id] = run
+        try:
+            if warm:
+                run.exit_code, run.output = await self._run_warm(run, warm, env)
+            else:
+                run.exit_code, run.output = await self._run_cold(run, env)
+        finally:
+            self._streaming.pop(run.report_id, None)
+            notifying = self._notifying.pop(run.id, None)
+            if notifying:
+                # The report follows; make sure no progress edit lands after it
+                notifying.cancel()
+                await asyncio.gather(notifying, return_exceptions=True)
+            self._notified_at.pop(run.id, None)
+            self._stale.discard(run.id)
+        run.finished_at = time.monotonic()
+        if run.status == RUNNING:
+            run.status = DONE
+        run.result = load_report(run.report_dir)
+        run.process = None
+
+    async def _run_cold(self, run: SuiteRun, env: dict) -> Tuple[Optional[int], str]:
+        run.process = await asyncio.create_subprocess_exec(
+            *run.suite.command(),
+            cwd=self.cwd,
+            env={**os.environ, **env},
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        if run.status == CANCELLED:
+            # Cancelled while the process was starting
+            run.process.terminate()
+        try:
+            output, _ = await asyncio.wait_for(run.process.communicate(), self.timeout)
+        except asyncio.TimeoutError:
+            run.process.kill()
+            output, _ = await run.process.communicate()
+            if run.status == RUNNING:
+                run.status = TIMEOUT
+        return run.process.returncode, output.decode("utf-8", errors="replace")
+
+    async def _run_warm(
+        self, run: SuiteRun, warm: WarmWorker, env: dict
+    ) -> Tuple[Optional[int], str]:
+        # Cancelling a run kills the interpreter; the worker spawns a new one
+        run.process = await warm.acquire()
+        if run.status == CANCELLED:
+            warm.kill()
+            return None, ""
+        try:
+            return await asyncio.wait_for(
+                warm.run(run.suite.pytest_args(), env), self.timeout
+            )
+        except asyncio.TimeoutError:
+            warm.kill()
+            if run.status == RUNNING:
+                run.status = TIMEOUT
+            return None, ""
+
+    async def _read_progress(self, reader, writer):
+        """Apply events from one pytest session's progress connection."""
+        try:
+            async for line in reader:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    continue
+                run = self._streaming.get(event.get("run_id"))
+                if run is not None:
+                    run.progress.update(event)
+                    self._notify(run)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def _notify(self, run: SuiteRun):
+        """Call on_progress soon, at most once per progress_interval."""
+        if run.id in self._notifying:
+            # A pending call will see this update; one in flight will not
+            self._stale.add(run.id)
+            return
+        last = self._notified_at.get(run.id, 0.0)
+        delay = max(0.0, last + self.progress_interval - time.monotonic())
+        self._notifying[run.id] = asyncio.create_task(self._notify_later(run, delay))
+
+    async def _notify_later(self, run: SuiteRun, delay: float):
+        # Stays in _notifying until on_progress returns, so that the end of
+        # the run can cancel or wait for it
+        await asyncio.sleep(delay)
+        self._stale.discard(run.id)
+        self._notified_at[run.id] = time.monotonic()
+        try:
+            await self.on_progress(run)
+        except Exception as e:
+            print(f"❌ Run #{run.id} progress not shown: {e}", file=sys.stderr)
+        self._notifying.pop(run.id, None)
+        if run.id in self._stale:
+            self._notify(run)
+
+    async def close(self):
+        """Stop the workers and kill runs in progress."""
+        for run in self.runs.values():
+            if run.process and run.process.returncode is None:
+                run.process.kill()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for worker in self._warm_workers:
+            await worker.close()
+        for task in self._notifying.values():
+            task.cancel()
+        self._stale = set()
+        if self._progress_server:
+            server = await self._progress_server
+            server.close()
+            await server.wait_closed()
+        self._progress_server = None
+        self._notifying = {}
+        self._tasks = []
+        self._warm_workers = []
+        self._queue = None
@@ -0,0 +1,240 @@
+"""
+Full-text search over every job the monitor has seen.
+
+Jobs are stored in SQLite with an FTS5 index (BM25 ranking, prefix
+matching, Unicode case folding). The parser upserts every scraped job,
+and the bot queries the same file, so /search answers without a browser.
+
+Query syntax: free words (prefix-matched against all fields) plus
+optional filters, in English or Russian:
+    company:/компания:   location:/город:   tag:/тег:   days:/дней:
+e.g. "python location:Москва days:7".
+"""
+
+import re
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from utils.job import Job
+
+# Filter prefix -> indexed column
+FILTER_COLUMNS = {
+    "company": "company",
+    "компания": "company",
+    "location": "location",
+    "город": "location",
+    "tag": "tags",
+    "тег": "tags",
+}
+DAYS_FILTERS = ("days", "дней")
+
+# BM25 weights of title, company, tags, description, location
+BM25_WEIGHTS = (5.0, 3.0, 4.0, 1.0, 2.0)
+
+
+def _words(text: str) -> List[str]:
+    return re.findall(r"\w+", text.lower())
+
+
+@dataclass
+class SearchQuery:
+    """Parsed /search query."""
+
+    terms: List[str] = field(default_factory=list)
+    filters: Dict[str, List[str]] = field(default_factory=dict)
+    days: Optional[int] = None
+
+    def match_expression(self) -> str:
+        """FTS5 MATCH expression: every word and filter, last token as prefix."""
+        parts = [f'"{term}"*' for term in self.terms]
+        for column, values in self.filters.items():
+            parts.extend(f'{column} : "{" ".join(_words(v))}"*' for v in values)
+        return " AND ".join(parts)
+
+
+def parse_query(text: str) -> SearchQuery:
+    """Split query text into words, column filters and a days filter.
+
+    Raises:
+        ValueError: a days filter that is not a positive number
+    """
+    query = SearchQuery()
+    for token in re.findall(r'\S+:"[^"]*"|\S+', text):
+        prefix, sep, value = token.partition(":")
+        prefix = prefix.lower()
+        value = value.strip('"')
+        if sep and prefix in DAYS_FILTERS:
+            if not value.isdigit() or int(value) < 1:
+                raise ValueError(f"Invalid days filter: {value}")
+            query.days = int(value)
+        elif sep and prefix in FILTER_COLUMNS:
+            if _words(value):
+                query.filters.setdefault(FILTER_COLUMNS[prefix], []).append(value)
+        else:
+            query.terms.extend(_words(token))
+    return query
+
+
+@dataclass
+class SearchHit:
+    """One search result."""
+
+    key: str
+    source: str
+    title: str
+    company: str
+    tags: str
+    location: str
+    posted: Optional[date]
+    found_at: str
+    score: float
+
+
+class JobSearchIndex:
+    """Jobs table with an external-content FTS5 index."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS search_jobs (
+                key TEXT NOT NULL UNIQUE,
+                source TEXT NOT NULL,
+                title TEXT NOT NULL,
+                company TEXT NOT NULL,
+                tags TEXT NOT NULL,
+                description TEXT NOT NULL,
+                location TEXT NOT NULL,
+                posted TEXT,
+                found_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS search_jobs_posted
+                ON search_jobs (coalesce(posted, substr(found_at, 1, 10)));
+            CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+                title, company, tags, description, location,
+                content='search_jobs', content_rowid='rowid',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            );
+            CREATE TRIGGER IF NOT EXISTS search_jobs_ai AFTER INSERT ON search_jobs
+            BEGIN
+                INSERT INTO search_fts (rowid, title, company, tags, description, location)
+                VALUES (new.rowid, new.title, new.company, new.tags,
+                        new.description, new.location);
+            END;
+            CREATE TRIGGER IF NOT EXISTS search_jobs_ad AFTER DELETE ON search_jobs
+            BEGIN
+                INSERT INTO search_fts
+                    (search_fts, rowid, title, company, tags, description, location)
+                VALUES ('delete', old.rowid, old.title, old.company, old.tags,
+                        old.description, old.location);
+            END;
+            CREATE TRIGGER IF NOT EXISTS search_jobs_au AFTER UPDATE ON search_jobs
+            BEGIN
+                INSERT INTO search_fts
+                    (search_fts, rowid, title, company, tags, description, location)
+                VALUES ('delete', old.rowid, old.title, old.company, old.tags,
+                        old.description, old.location);
+                INSERT INTO search_fts (rowid, title, company, tags, description, location)
+                VALUES (new.rowid, new.title, new.company, new.tags,
+                        new.description, new.location);
+            END;
+            """)
+        self.conn.commit()
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM search_jobs").fetchone()[0]
+
+    def add_many(self, items: Iterable[Tuple[str, str, Job]]):
+        """Upsert (key, source name, job) items (not committed).
+
+        Unchanged jobs are left alone, so re-scraping a board does not
+        rewrite its index entries.
+        """
+        self.conn.executemany(
+            "INSERT INTO search_jobs"
+            " (key, source, title, company, tags, description, location,"
+            " posted, found_at)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (key) DO UPDATE SET"
+            " title = excluded.title, company = excluded.company,"
+            " tags = excluded.tags, description = excluded.description,"
+            " location = excluded.location, posted = excluded.posted"
+            " WHERE (title, company, tags, description, location, posted)"
+            " IS NOT (excluded.title, excluded.company, excluded.tags,"
+            " excluded.description, excluded.location, excluded.posted)",
+            (
+                (
+                    key,
+                    source,
+                    job.title,
+                    job.company,
+                    job.tags_text,
+                    job.description,
+                    job.location,
+                    job.posted.isoformat() if job.posted else None,
+                    job.found_at.isoformat(),
+                )
+                for key, source, job in items
+            ),
+        )
+
+    def search(
+        self, query: SearchQuery, limit: int = 10
+    ) -> Tuple[List[SearchHit], int]:
+        """Best matches first (newest first for filter-only queries).
+
+        Returns:
+            (hits, total number of matches)
+        """
+        columns = (
+            "j.key, j.source, j.title, j.company, j.tags, j.location,"
+            " j.posted, j.found_at"
+        )
+        posted = "coalesce(j.posted, substr(j.found_at, 1, 10))"
+        expression = query.match_expression()
+        if expression:
+            weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+            sql = (
+                f"SELECT {columns}, bm25(search_fts, {weights}) AS score"
+                " FROM search_fts JOIN search_jobs j ON j.rowid = search_fts.rowid"
+                " WHERE search_fts MATCH ?"
+            )
+            params = [expression]
+            order = f"score, {posted} DESC"
+        else:
+            sql = f"SELECT {columns}, 0.0 AS score FROM search_jobs j WHERE 1"
+            params = []
+            order = f"{posted} DESC"
+        if query.days:
+            sql += f" AND {posted} >= ?"
+            params.append((date.today() - timedelta(days=query.days)).isoformat())
+
+        total = self.conn.execute(f"SELECT COUNT(*) FROM ({sql})", params).fetchone()[0]
+        rows = self.conn.execute(f"{sql} ORDER BY {order} LIMIT ?", params + [limit])
+        hits = []
+        for row in rows:
+            hit = SearchHit(*row)
+            hit.posted = date.fromisoformat(hit.posted) if hit.posted else None
+            hits.append(hit)
+        return hits, total
+
+    def query(self, text: str, limit: int = 10) -> Tuple[List[SearchHit], int, float]:
+        """Parse and run a query.
+
+        Returns:
+            (hits, total, elapsed seconds)
+        """
+        start = time.perf_counter()
+        hits, total = self.search(parse_query(text), limit)
+        return hits, total, time.perf_counter() - start
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
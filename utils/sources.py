@@ -0,0 +1,57 @@
+"""
+Job board sources monitored by the parser.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from utils.extractor import JOB_SELECTORS
+
+
+@dataclass
+class Source:
+    """A job board with its own selectors and cache namespace."""
+
+    name: str
+    url: str
+    selectors: Dict[str, str] = field(default_factory=lambda: dict(JOB_SELECTORS))
+    namespace: str = ""
+    data_url: Optional[str] = None
+
+    @property
+    def host(self) -> str:
+        return urlparse(self.url).hostname or ""
+
+    def cache_key(self, job_id: str) -> str:
+        """Cache key for a job ID (plain ID for the default namespace)."""
+        return f"{self.namespace}:{job_id}" if self.namespace else job_id
+
+
+def load_sources(path: Path, default: Source) -> List[Source]:
+    """Load sources from a JSON file.
+
+    The file holds a list of objects with "name", "url" and optional
+    "selectors" (merged over JOB_SELECTORS), "namespace" (defaults to name)
+    and "data_url". Without the file only the default source is returned.
+    """
+    if not path or not Path(path).exists():
+        return [default]
+
+    with open(path, "r", encoding="utf-8") as f:
+        entries = json.load(f)
+
+    sources = []
+    for entry in entries:
+        sources.append(
+            Source(
+                name=entry["name"],
+                url=entry["url"],
+                selectors={**JOB_SELECTORS, **entry.get("selectors", {})},
+                namespace=entry.get("namespace", entry["name"]),
+                data_url=entry.get("data_url"),
+            )
+        )
+    return sources
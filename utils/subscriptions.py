@@ -0,0 +1,248 @@
+"""
+Chat subscriptions and matching of new jobs to subscribers.
+
+A subscription belongs to a chat and filters jobs by keywords (title and
+description words), tags, companies and locations. Values within one
+facet are alternatives (OR); all facets a subscription sets must match
+(AND). A subscription without any facet receives every job.
+
+Matching goes through an inverted index from (facet, term) to
+subscriptions, so a job only touches the subscriptions that share at
+least one of its terms instead of every rule.
+"""
+
+import json
+import re
+import shlex
+import sqlite3
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from utils.job import Job
+
+FACETS = ("keywords", "tags", "companies", "locations")
+
+# Prefixes accepted in rule text, e.g. "tag:Python company:Ozon"
+RULE_PREFIXES = {
+    "tag": "tags",
+    "company": "companies",
+    "location": "locations",
+    "keyword": "keywords",
+}
+
+
+def _norm(value: str) -> str:
+    return " ".join(value.lower().split())
+
+
+def _words(text: str) -> List[str]:
+    return re.findall(r"\w+", text.lower())
+
+
+def job_terms(job: Job) -> Dict[str, FrozenSet[str]]:
+    """Normalized terms of a job per facet."""
+    return {
+        "keywords": frozenset(_words(job.title) + _words(job.description)),
+        "tags": frozenset(_norm(tag) for tag in job.tags),
+        "companies": frozenset([_norm(job.company)]) - {""},
+        "locations": frozenset(
+            _norm(part) for part in re.split(r"[,/]", job.location) if part.strip()
+        ),
+    }
+
+
+@dataclass
+class Subscription:
+    """Filter rule of one chat."""
+
+    chat_id: str
+    keywords: Tuple[str, ...] = ()
+    tags: Tuple[str, ...] = ()
+    companies: Tuple[str, ...] = ()
+    locations: Tuple[str, ...] = ()
+    id: Optional[int] = None
+
+    def __post_init__(self):
+        self.chat_id = str(self.chat_id)
+        for facet in FACETS:
+            values = getattr(self, facet)
+            setattr(self, facet, tuple(dict.fromkeys(_norm(v) for v in values if v)))
+
+    def terms(self) -> Dict[str, Tuple[str, ...]]:
+        """Facets set by this subscription."""
+        return {facet: getattr(self, facet) for facet in FACETS if getattr(self, facet)}
+
+    def matches(self, job: Job, terms: Dict[str, FrozenSet[str]] = None) -> bool:
+        """Direct check against one job (reference for the index)."""
+        terms = terms or job_terms(job)
+        return all(
+            any(value in terms[facet] for value in values)
+            for facet, values in self.terms().items()
+        )
+
+    def describe(self) -> str:
+        """Rule in the same syntax /subscribe accepts."""
+        parts = list(self.keywords)
+        for prefix, facet in RULE_PREFIXES.items():
+            if facet != "keywords":
+                parts.extend(
+                    f'{prefix}:"{value}"' if " " in value else f"{prefix}:{value}"
+                    for value in getattr(self, facet)
+                )
+        return " ".join(parts) or "все вакансии"
+
+
+def parse_rule(chat_id: str, text: str) -> Subscription:
+    """Build a subscription from rule text.
+
+    Bare words are keywords; "tag:", "company:", "location:" set the other
+    facets. Values with spaces can be quoted: location:"Нижний Новгород".
+
+    Raises:
+        ValueError: unknown prefix or unbalanced quotes
+    """
+    values = defaultdict(list)
+    for token in shlex.split(text):
+        prefix, sep, value = token.partition(":")
+        if not sep:
+            values["keywords"].extend(_words(token))
+            continue
+        facet = RULE_PREFIXES.get(prefix.lower())
+        if facet is None:
+            raise ValueError(f"Unknown filter: {prefix}")
+        if facet == "keywords":
+            values[facet].extend(_words(value))
+        elif value.strip():
+            values[facet].append(value)
+    return Subscription(chat_id=chat_id, **values)
+
+
+class SubscriptionIndex:
+    """Inverted index from facet terms to subscriptions."""
+
+    def __init__(self, subscriptions: Iterable[Subscription] = ()):
+        self._postings: Dict[Tuple[str, str], List[int]] = defaultdict(list)
+        # Bit mask of the facets every subscription requires
+        self._required: List[int] = []
+        self._chats: List[str] = []
+        self._match_all: List[int] = []
+        for subscription in subscriptions:
+            self.add(subscription)
+
+    def __len__(self) -> int:
+        return len(self._chats)
+
+    def add(self, subscription: Subscription):
+        slot = len(self._chats)
+        self._chats.append(subscription.chat_id)
+        required = 0
+        for bit, facet in enumerate(FACETS):
+            for value in getattr(subscription, facet):
+                self._postings[(facet, value)].append(slot)
+            if getattr(subscription, facet):
+                required |= 1 << bit
+        self._required.append(required)
+        if not required:
+            self._match_all.append(slot)
+
+    def match(self, job: Job) -> Set[str]:
+        """Chats subscribed to a job."""
+        hits: Dict[int, int] = {}
+        terms_by_facet = job_terms(job)
+        for bit, facet in enumerate(FACETS):
+            mask = 1 << bit
+            for term in terms_by_facet[facet]:
+                for slot in self._postings.get((facet, term), ()):
+                    hits[slot] = hits.get(slot, 0) | mask
+
+        chats = {self._chats[slot] for slot in self._match_all}
+        chats.update(
+            self._chats[slot]
+            for slot, mask in hits.items()
+            if mask == self._required[slot]
+        )
+        return chats
+
+
+class SubscriptionStore:
+    """Subscriptions stored in SQLite (shared by the bot and the parser)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS subscriptions ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " chat_id TEXT NOT NULL,"
+            " rule TEXT NOT NULL,"
+            " created_at TEXT NOT NULL"
+            ")"
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS subscriptions_chat ON subscriptions (chat_id)"
+        )
+        self.conn.commit()
+
+    def add(self, subscription: Subscription) -> int:
+        """Save a subscription and return its ID."""
+        rule = {facet: list(getattr(subscription, facet)) for facet in FACETS}
+        cursor = self.conn.execute(
+            "INSERT INTO subscriptions (chat_id, rule, created_at) VALUES (?, ?, ?)",
+            (
+                subscription.chat_id,
+                json.dumps(rule, ensure_ascii=False),
+                datetime.now().isoformat(),
+            ),
+        )
+        self.conn.commit()
+        subscription.id = cursor.lastrowid
+        return subscription.id
+
+    def remove(self, chat_id: str, subscription_id: int) -> bool:
+        """Delete a subscription of the chat."""
+        deleted = self.conn.execute(
+            "DELETE FROM subscriptions WHERE id = ? AND chat_id = ?",
+            (subscription_id, str(chat_id)),
+        ).rowcount
+        self.conn.commit()
+        return bool(deleted)
+
+    def _load(self, rows) -> List[Subscription]:
+        return [
+            Subscription(chat_id=chat_id, id=id, **json.loads(rule))
+            for id, chat_id, rule in rows
+        ]
+
+    def for_chat(self, chat_id: str) -> List[Subscription]:
+        return self._load(
+            self.conn.execute(
+                "SELECT id, chat_id, rule FROM subscriptions WHERE chat_id = ?"
+                " ORDER BY id",
+                (str(chat_id),),
+            )
+        )
+
+    def all(self) -> List[Subscription]:
+        return self._load(
+            self.conn.execute("SELECT id, chat_id, rule FROM subscriptions ORDER BY id")
+        )
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM subscriptions").fetchone()[0]
+
+    def build_index(self, default_chat_id: str = None) -> SubscriptionIndex:
+        """Index of all subscriptions.
+
+        default_chat_id (TELEGRAM_CHAT_ID) is subscribed to every job.
+        """
+        index = SubscriptionIndex(self.all())
+        if default_chat_id:
+            index.add(Subscription(chat_id=default_chat_id))
+        return index
+
+    def close(self):
+        self.conn.close()